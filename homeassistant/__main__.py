@@ -78,6 +78,13 @@ def ensure_config_path(config_dir: str) -> None:
             sys.exit(1)
 
 
+def _non_negative_int(value: str) -> int:
+    """Validate an argument is an integer of zero or more."""
+    if (number := int(value)) < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
 def get_arguments() -> argparse.Namespace:
     """Get parsed passed in arguments."""
     # pylint: disable-next=import-outside-toplevel
@@ -147,6 +154,17 @@ def get_arguments() -> argparse.Namespace:
         action="store_true",
         help="Skips validation of operating system",
     )
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        help="Record where startup time is spent to startup_trace.json",
+    )
+    parser.add_argument(
+        "--pre-import-workers",
+        type=_non_negative_int,
+        default=0,
+        help="Import integrations in this many threads ahead of setting them up",
+    )
 
     return parser.parse_args()
 
@@ -205,6 +223,8 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        startup_trace=args.startup_trace,
+        pre_import_workers=args.pre_import_workers,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
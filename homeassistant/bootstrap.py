@@ -84,6 +84,7 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
@@ -282,6 +283,14 @@ async def async_setup_hass(
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
+        if runtime_config.startup_trace:
+            startup_trace.async_enable(hass)
+
+        if runtime_config.pre_import_workers:
+            hass.data[loader.DATA_PRE_IMPORT_WORKERS] = (
+                runtime_config.pre_import_workers
+            )
+
         return hass
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
@@ -437,6 +446,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -983,6 +993,23 @@ async def _async_set_up_integrations(
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
 
+    if pre_import_workers := hass.data.get(loader.DATA_PRE_IMPORT_WORKERS):
+        # Import the integrations concurrently while the first ones are set
+        # up. Setting up an integration waits for its import in progress.
+        hass.async_create_background_task(
+            loader.async_pre_import_integrations(
+                hass,
+                {
+                    domain: integration
+                    for domain, integration in integration_cache.items()
+                    if domain in domains_to_setup
+                },
+                pre_import_workers,
+            ),
+            "pre-import integrations",
+            eager_start=True,
+        )
+
     pre_stage_domains = [
         (name, domains_to_setup & domain_group) for name, domain_group in SETUP_ORDER
     ]
@@ -1071,6 +1098,8 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    await startup_trace.async_finish(hass)
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
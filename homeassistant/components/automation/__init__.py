@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import TraceRunPolicy
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -85,7 +86,12 @@ from homeassistant.loader import bind_hass
 from homeassistant.util.dt import parse_datetime
 from homeassistant.util.hass_dict import HassKey
 
-from .config import AutomationConfig, ValidationStatus
+from .config import (
+    AutomationConfig,
+    ValidationStatus,
+    async_setup_validated_configs,
+    reuse_validated_configs,
+)
 from .const import (
     CONF_ACTIONS,
     CONF_INITIAL_STATE,
@@ -292,10 +298,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         "async_turn_off",
     )
 
+    async_setup_validated_configs(hass)
+
     async def reload_service_handler(service_call: ServiceCall) -> None:
         """Remove all automations and load new ones from config."""
         await async_get_blueprints(hass).async_reset_cache()
-        if (conf := await component.async_prepare_reload(skip_reset=True)) is None:
+        with reuse_validated_configs():
+            conf = await component.async_prepare_reload(skip_reset=True)
+        if conf is None:
             return
         if automation_id := service_call.data.get(CONF_ID):
             await _async_process_single_config(hass, conf, component, automation_id)
@@ -499,7 +509,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         self._trigger_variables = trigger_variables
         self.raw_config = raw_config
         self._blueprint_inputs = blueprint_inputs
-        self._trace_config = trace_config
+        self._trace_policy = TraceRunPolicy(trace_config)
         self._attr_unique_id = automation_id
 
     @property
@@ -651,7 +661,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             self.raw_config,
             self._blueprint_inputs,
             trigger_context,
-            self._trace_config,
+            self._trace_policy,
         ) as automation_trace:
             this = None
             if state := self.hass.states.get(self.entity_id):
@@ -662,23 +672,25 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                     variables = self._variables.async_render(self.hass, variables)
                 except TemplateError as err:
                     self._logger.error("Error rendering variables: %s", err)
-                    automation_trace.set_error(err)
+                    if automation_trace is not None:
+                        automation_trace.set_error(err)
                     return None
 
-            # Prepare tracing the automation
-            automation_trace.set_trace(trace_get())
+            if automation_trace is not None:
+                # Prepare tracing the automation
+                automation_trace.set_trace(trace_get())
 
-            # Set trigger reason
-            trigger_description = variables.get("trigger", {}).get("description")
-            automation_trace.set_trigger_description(trigger_description)
+                # Set trigger reason
+                trigger_description = variables.get("trigger", {}).get("description")
+                automation_trace.set_trigger_description(trigger_description)
 
-            # Add initial variables as the trigger step
-            if "trigger" in variables and "idx" in variables["trigger"]:
-                trigger_path = f"trigger/{variables['trigger']['idx']}"
-            else:
-                trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+                # Add initial variables as the trigger step
+                if "trigger" in variables and "idx" in variables["trigger"]:
+                    trigger_path = f"trigger/{variables['trigger']['idx']}"
+                else:
+                    trigger_path = "trigger"
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -734,17 +746,20 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                         "edit": f"/config/automation/edit/{self.unique_id}",
                     },
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except (vol.Invalid, HomeAssistantError) as err:
                 self._logger.error(
                     "Error while executing automation %s: %s",
                     self.entity_id,
                     err,
                 )
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
             except Exception as err:
                 self._logger.exception("While executing automation %s", self.entity_id)
-                automation_trace.set_error(err)
+                if automation_trace is not None:
+                    automation_trace.set_error(err)
 
             return None
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from contextlib import suppress
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from enum import StrEnum
 from typing import Any
 
@@ -13,6 +14,7 @@ from voluptuous.humanize import humanize_error
 from homeassistant.components import blueprint
 from homeassistant.components.trace import TRACE_CONFIG_SCHEMA
 from homeassistant.config import config_per_platform, config_without_domain
+from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
 from homeassistant.const import (
     CONF_ALIAS,
     CONF_CONDITION,
@@ -21,12 +23,19 @@ from homeassistant.const import (
     CONF_ID,
     CONF_VARIABLES,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv, script
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+    script,
+)
 from homeassistant.helpers.condition import async_validate_conditions_config
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml.input import UndefinedSubstitution
 
 from .const import (
@@ -45,6 +54,15 @@ from .helpers import async_get_blueprints
 
 PACKAGE_MERGE_HINT = "list"
 
+DATA_VALIDATED_CONFIGS: HassKey[dict[str, AutomationConfig]] = HassKey(
+    f"{DOMAIN}_validated_configs"
+)
+
+_reuse_validated_configs: ContextVar[bool] = ContextVar(
+    "_reuse_validated_configs", default=False
+)
+"""Set to True while reloading to skip validating automations that did not change."""
+
 _MINIMAL_PLATFORM_SCHEMA = vol.Schema(
     {
         CONF_ID: str,
@@ -120,8 +138,13 @@ async def _async_validate_config_item(  # noqa: C901
     config: ConfigType,
     raise_on_errors: bool,
     warn_on_errors: bool,
+    validated_configs: Mapping[str, AutomationConfig] | None = None,
 ) -> AutomationConfig:
-    """Validate config item."""
+    """Validate config item.
+
+    If validated_configs has a config with the same id and raw config, it is
+    returned instead of validating the config again.
+    """
     raw_config = None
     raw_blueprint_inputs = None
     uses_blueprint = False
@@ -222,6 +245,16 @@ async def _async_validate_config_item(  # noqa: C901
                 raise HomeAssistantError(err) from err
             return _minimal_config(ValidationStatus.FAILED_BLUEPRINT, err, config)
 
+    if (
+        validated_configs
+        and raw_config is not None
+        and (automation_id := raw_config.get(CONF_ID)) is not None
+        and (previous_config := validated_configs.get(automation_id)) is not None
+        and previous_config.raw_config == raw_config
+        and previous_config.raw_blueprint_inputs == raw_blueprint_inputs
+    ):
+        return previous_config
+
     automation_name = "Unnamed automation"
     if isinstance(config, Mapping):
         if CONF_ALIAS in config:
@@ -325,10 +358,13 @@ class AutomationConfig(dict):
 async def _try_async_validate_config_item(
     hass: HomeAssistant,
     config: dict[str, Any],
+    validated_configs: Mapping[str, AutomationConfig] | None,
 ) -> AutomationConfig | None:
     """Validate config item."""
     try:
-        return await _async_validate_config_item(hass, config, False, True)
+        return await _async_validate_config_item(
+            hass, config, False, True, validated_configs
+        )
     except (vol.Invalid, HomeAssistantError):
         return None
 
@@ -342,19 +378,71 @@ async def async_validate_config_item(
     return await _async_validate_config_item(hass, config, True, False)
 
 
+@contextmanager
+def reuse_validated_configs() -> Generator[None]:
+    """Reuse the validated config of automations that did not change.
+
+    Validating the triggers, conditions and actions of every automation
+    dominates reloading, while a reload usually changes few of them. The
+    automation entities of unchanged configs are kept, so their previously
+    validated config is still the one in use.
+    """
+    token = _reuse_validated_configs.set(True)
+    try:
+        yield
+    finally:
+        _reuse_validated_configs.reset(token)
+
+
+@callback
+def async_setup_validated_configs(hass: HomeAssistant) -> None:
+    """Forget the validated configs when what their validation used changes.
+
+    Validating triggers, conditions and actions looks up devices and
+    entities in the registries, and device automations are only fully
+    validated when the config entry of the device is loaded.
+    """
+
+    @callback
+    def _async_forget_validated_configs(*_: Any) -> None:
+        hass.data.pop(DATA_VALIDATED_CONFIGS, None)
+
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_forget_validated_configs
+    )
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _async_forget_validated_configs
+    )
+    async_dispatcher_connect(
+        hass, SIGNAL_CONFIG_ENTRY_CHANGED, _async_forget_validated_configs
+    )
+
+
 async def async_validate_config(hass: HomeAssistant, config: ConfigType) -> ConfigType:
     """Validate config."""
+    validated_configs = (
+        hass.data.get(DATA_VALIDATED_CONFIGS)
+        if _reuse_validated_configs.get()
+        else None
+    )
     # No gather here since _try_async_validate_config_item is unlikely to suspend
     # and the cost of creating many tasks is not worth the benefit.
-    automations = list(
-        filter(
-            lambda x: x is not None,
-            [
-                await _try_async_validate_config_item(hass, p_config)
-                for _, p_config in config_per_platform(config, DOMAIN)
-            ],
+    automations = [
+        automation
+        for _, p_config in config_per_platform(config, DOMAIN)
+        if (
+            automation := await _try_async_validate_config_item(
+                hass, p_config, validated_configs
+            )
         )
-    )
+        is not None
+    ]
+    # Failed configs are validated again as what they depend on may be fixed
+    hass.data[DATA_VALIDATED_CONFIGS] = {
+        automation[CONF_ID]: automation
+        for automation in automations
+        if CONF_ID in automation and automation.validation_status is ValidationStatus.OK
+    }
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
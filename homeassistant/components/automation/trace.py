@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
+    TraceRunPolicy,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disable
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -54,11 +55,20 @@ def trace_automation(
     config: ConfigType | None,
     blueprint_inputs: ConfigType | None,
     context: Context,
-    trace_config: ConfigType,
-) -> Generator[AutomationTrace]:
-    """Trace action execution of automation with automation_id."""
+    trace_policy: TraceRunPolicy,
+) -> Generator[AutomationTrace | None]:
+    """Trace action execution of automation with automation_id.
+
+    Yields None if the trace policy skips this run.
+    """
+    if not trace_policy.trace_next_run():
+        trace_disable()
+        yield None
+        return
+
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if not trace_policy.store_failed_only:
+        async_store_trace(hass, trace, trace_policy.stored_traces)
 
     try:
         yield trace
@@ -69,3 +79,5 @@ def trace_automation(
     finally:
         if automation_id:
             trace.finished()
+        if trace_policy.store_failed_only and trace.failed:
+            async_store_trace(hass, trace, trace_policy.stored_traces)
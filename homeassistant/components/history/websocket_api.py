@@ -36,9 +36,14 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    COLUMNAR_ENTITY_CHUNK_SIZE,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -103,6 +108,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -128,8 +134,9 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    columnar: bool = msg["columnar"]
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], columnar)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -154,12 +161,27 @@ async def ws_get_history_during_period(
             )
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], columnar)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if columnar:
+        await _async_send_columnar_history(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -176,6 +198,157 @@ async def ws_get_history_during_period(
     )
 
 
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg_id: int, columnar: bool
+) -> None:
+    """Send an empty history_during_period response."""
+    if not columnar:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(
+        json_bytes(messages.event_message(msg_id, {"states": {}, "complete": True}))
+    )
+
+
+def _compressed_states_to_columns(
+    compressed_states: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Convert the compressed states of an entity to parallel arrays.
+
+    State values are interned in "v" and "s" holds the index of the
+    value of each row. Timestamps in "lu" are deltas to the previous row,
+    the first one is the absolute timestamp. "lc" and "a" are only
+    included if any row has them, with None for rows that do not.
+    """
+    values: list[Any] = []
+    value_indexes: dict[Any, int] = {}
+    state_indexes: list[int] = []
+    last_updated: list[float] = []
+    last_changed: list[float | None] = []
+    attributes: list[Any] = []
+    has_last_changed = False
+    has_attributes = False
+    previous_ts = 0.0
+    for compressed_state in compressed_states:
+        value = compressed_state[COMPRESSED_STATE_STATE]
+        if (value_index := value_indexes.get(value)) is None:
+            value_index = value_indexes[value] = len(values)
+            values.append(value)
+        state_indexes.append(value_index)
+        last_updated_ts: float = compressed_state[COMPRESSED_STATE_LAST_UPDATED]
+        last_updated.append(last_updated_ts - previous_ts)
+        previous_ts = last_updated_ts
+        if (
+            last_changed_ts := compressed_state.get(COMPRESSED_STATE_LAST_CHANGED)
+        ) is not None:
+            has_last_changed = True
+        last_changed.append(last_changed_ts)
+        if (attrs := compressed_state.get(COMPRESSED_STATE_ATTRIBUTES)) is not None:
+            has_attributes = True
+        attributes.append(attrs)
+
+    columns: dict[str, Any] = {
+        "v": values,
+        COMPRESSED_STATE_STATE: state_indexes,
+        COMPRESSED_STATE_LAST_UPDATED: last_updated,
+    }
+    if has_last_changed:
+        columns[COMPRESSED_STATE_LAST_CHANGED] = last_changed
+    if has_attributes:
+        columns[COMPRESSED_STATE_ATTRIBUTES] = attributes
+    return columns
+
+
+def _generate_columnar_history_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    complete: bool,
+) -> bytes:
+    """Fetch history for a chunk of entities and convert it to columnar json."""
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    return json_bytes(
+        messages.event_message(
+            msg_id,
+            {
+                "states": {
+                    entity_id: _compressed_states_to_columns(compressed_states)
+                    for entity_id, compressed_states in states.items()
+                },
+                "complete": complete,
+            },
+        )
+    )
+
+
+async def _async_send_columnar_history(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Send history in the columnar format, in chunks of entities.
+
+    Each chunk is fetched and serialized on its own so the memory used
+    is bounded by the chunk size and the client can start rendering
+    as soon as the first chunk arrives. The last message has complete
+    set to True.
+    """
+    instance = get_instance(hass)
+    connection.subscriptions[msg_id] = callback(lambda: None)
+    connection.send_result(msg_id)
+    entity_id_chunks: list[list[str]] = list(
+        chunked_or_all(entity_ids, COLUMNAR_ENTITY_CHUNK_SIZE)
+    )
+    last_chunk_index = len(entity_id_chunks) - 1
+    for chunk_index, entity_ids_chunk in enumerate(entity_id_chunks):
+        payload = await instance.async_add_executor_job(
+            _generate_columnar_history_chunk,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids_chunk,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            chunk_index == last_chunk_index,
+        )
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while fetching the history
+            return
+        connection.send_message(payload)
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -308,7 +481,7 @@ def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, An
     if not no_attributes or state.domain in history.NEED_ATTRIBUTE_DOMAINS:
         comp_state[COMPRESSED_STATE_ATTRIBUTES] = state.attributes
     comp_state[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated_timestamp
-    if state.last_changed != state.last_updated:
+    if state.last_changed_timestamp != state.last_updated_timestamp:
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = state.last_changed_timestamp
     return comp_state
 
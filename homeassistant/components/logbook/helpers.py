@@ -256,7 +256,7 @@ def _is_state_filtered(new_state: State, old_state: State) -> bool:
     """
     return bool(
         new_state.state == old_state.state
-        or new_state.last_changed != new_state.last_updated
+        or new_state.last_changed_timestamp != new_state.last_updated_timestamp
         or new_state.domain in ALWAYS_CONTINUOUS_DOMAINS
         or ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
         or ATTR_STATE_CLASS in new_state.attributes
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
-from operator import attrgetter
+from operator import attrgetter, itemgetter
 import socket
 import ssl
 import time
@@ -117,6 +117,9 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Number of topics to keep the matching subscriptions cached for
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -266,12 +269,97 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the trie node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # Subscriptions ending at this level, with their insertion order
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class _WildcardSubscriptionTrie:
+    """Match topics against wildcard subscriptions using a topic level trie.
+
+    Matching a topic only visits the levels of the trie that can match
+    instead of testing every wildcard subscription.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._sequence = 0
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a wildcard subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        self._sequence += 1
+        node.subscriptions[subscription] = self._sequence
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a wildcard subscription."""
+        node = self._root
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the levels that no longer lead to any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in insertion order."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level do not match topics starting with $
+        wildcard_root = not topic.startswith("$")
+        matched: list[tuple[int, Subscription]] = []
+        stack: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            if (wildcard_root or index) and (
+                multi_level := children.get("#")
+            ) is not None:
+                matched.extend(
+                    (sequence, subscription)
+                    for subscription, sequence in multi_level.subscriptions.items()
+                )
+            if index == last:
+                matched.extend(
+                    (sequence, subscription)
+                    for subscription, sequence in node.subscriptions.items()
+                )
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if (wildcard_root or index) and (
+                single_level := children.get("+")
+            ) is not None:
+                stack.append((single_level, index + 1))
+        if len(matched) > 1:
+            matched.sort(key=itemgetter(0))
+        return [subscription for _, subscription in matched]
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -378,6 +466,7 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscription_trie = _WildcardSubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -759,6 +848,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscription_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -777,6 +867,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscription_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -847,9 +938,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1056,18 +1146,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscription_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1263,13 +1348,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
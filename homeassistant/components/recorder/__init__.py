@@ -44,7 +44,7 @@ from .const import (  # noqa: F401
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
-from .core import Recorder
+from .core import MAX_DB_EXECUTOR_WORKERS, Recorder
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -62,6 +62,8 @@ DEFAULT_COMMIT_INTERVAL = 5
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
+CONF_DB_READ_WORKERS = "db_read_workers"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
@@ -94,6 +96,15 @@ def validate_db_url(db_url: str) -> Any:
     return db_url
 
 
+def validate_db_read_url(db_read_url: str) -> Any:
+    """Validate read replica database URL."""
+    # SQLite readers already get their own WAL connection per db executor
+    if db_read_url.startswith(SQLITE_URL_PREFIX):
+        raise vol.Invalid("A read replica is not supported with SQLite")
+
+    return db_read_url
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Optional(DOMAIN, default=dict): vol.All(
@@ -108,6 +119,12 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(
+                        cv.string, validate_db_read_url
+                    ),
+                    vol.Optional(
+                        CONF_DB_READ_WORKERS, default=MAX_DB_EXECUTOR_WORKERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -170,6 +187,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        db_read_url=conf.get(CONF_DB_READ_URL),
+        db_read_workers=conf[CONF_DB_READ_WORKERS],
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -128,6 +128,10 @@ DEFAULT_URL = "sqlite:///{hass_config_path}"
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The maximum number of queued events that are taken off the
+# queue at once so their ids can be resolved in bulk
+MAX_EVENT_BATCH_SIZE = 1000
+
 SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
@@ -164,6 +168,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        db_read_url: str | None = None,
+        db_read_workers: int = MAX_DB_EXECUTOR_WORKERS,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -181,6 +187,11 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        # Read-only queries fan out to db_read_workers executor threads,
+        # each with its own connection, and go to db_read_url when a
+        # replica is configured for a server database.
+        self.db_read_url = db_read_url
+        self.db_read_workers = db_read_workers
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -190,7 +201,11 @@ class Recorder(threading.Thread):
         # Database is ready to use and all migration steps completed (used by tests)
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
+        # Set when the queue is drained at close so a batch of events
+        # already taken off the queue is not processed
+        self._close_requested = False
         self.engine: Engine | None = None
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -214,6 +229,7 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
@@ -262,6 +278,19 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read-only queries.
+
+        Returns a session bound to the read replica when one is configured,
+        except on the recorder thread which must see its own writes.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() != self.thread_id
+        ):
+            return self._get_read_session()
+        return self.get_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -276,7 +305,7 @@ class Recorder(threading.Thread):
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             self.recorder_and_worker_thread_ids,
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=self.db_read_workers,
             shutdown_hook=self._shutdown_pool,
         )
 
@@ -426,6 +455,7 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
+        self._close_requested = True
         while True:
             try:
                 self._queue.get_nowait()
@@ -834,7 +864,27 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            # Event is never subclassed so we can
+            # use a fast type check
+            if type(task_or_event) is not Event or queue_.empty():
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            # More events are waiting; take the ones that are queued
+            # behind this one so we can resolve their ids in bulk. A task
+            # ends the batch so the queue order is preserved.
+            batch: list[RecorderTask | Event] = [task_or_event]
+            while len(batch) < MAX_EVENT_BATCH_SIZE and not queue_.empty():
+                batch.append(task_or_event := queue_.get_nowait())
+                if type(task_or_event) is not Event:
+                    break
+            self._guarded_pre_process_event_batch(batch)
+            for task_or_event in batch:
+                if self._close_requested:
+                    # The queue was drained at close, drop the rest of
+                    # the batch so the stop task is reached quickly
+                    break
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
@@ -862,6 +912,47 @@ class Recorder(threading.Thread):
         self.states_meta_manager.load(state_change_events, session)
         self.state_attributes_manager.load(state_change_events, session)
 
+    def _guarded_pre_process_event_batch(
+        self, batch: list[RecorderTask | Event[Any]]
+    ) -> None:
+        """Pre process a batch of events, recovering the session on failure."""
+        if not self.enabled:
+            return
+        try:
+            self._pre_process_event_batch(batch)
+        except exc.DatabaseError as err:
+            if self._handle_database_error(err, setup_run=True):
+                return
+            _LOGGER.exception("Unhandled database error while pre processing events")
+        except SQLAlchemyError:
+            _LOGGER.exception("SQLAlchemyError error pre processing events")
+        except Exception:
+            _LOGGER.exception("Error while pre processing events")
+            return
+        else:
+            return
+
+        # Reset the session if an SQLAlchemyError (including DatabaseError)
+        # happens to rollback and recover
+        self._reopen_event_session()
+
+    def _pre_process_event_batch(self, batch: list[RecorderTask | Event[Any]]) -> None:
+        """Resolve the metadata_ids and attributes_ids for a batch of events.
+
+        Ids that are not in the caches are looked up with one query per
+        table instead of one query per event.
+        """
+        if state_change_events := [
+            task_or_event
+            for task_or_event in batch
+            if type(task_or_event) is Event
+            and task_or_event.event_type == EVENT_STATE_CHANGED
+        ]:
+            assert self.event_session is not None
+            session = self.event_session
+            self.states_meta_manager.load(state_change_events, session)
+            self.state_attributes_manager.load(state_change_events, session)
+
     def _guarded_process_one_task_or_event_or_recover(
         self, task: RecorderTask | Event
     ) -> None:
@@ -1382,6 +1473,9 @@ class Recorder(threading.Thread):
         kwargs: dict[str, Any] = {}
         self._completed_first_database_setup = False
 
+        # One connection per db executor worker plus the recorder thread
+        pool_size = self.db_read_workers + 1
+
         if self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url:
             kwargs["connect_args"] = {"check_same_thread": False}
             kwargs["poolclass"] = MutexPool
@@ -1389,6 +1483,7 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            kwargs["pool_size"] = pool_size
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
@@ -1413,6 +1508,8 @@ class Recorder(threading.Thread):
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+            if pool_size > POOL_SIZE:
+                kwargs["pool_size"] = pool_size
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1427,6 +1524,48 @@ class Recorder(threading.Thread):
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        if not self.db_read_url:
+            return
+        if self.db_url.startswith(SQLITE_URL_PREFIX):
+            _LOGGER.warning(
+                "A read replica is not supported with SQLite, read-only queries"
+                " will use the recorder database"
+            )
+            return
+        self._setup_read_connection(kwargs)
+
+    def _setup_read_connection(self, kwargs: dict[str, Any]) -> None:
+        """Connect to the read replica used for read-only queries."""
+        assert self.db_read_url is not None
+        assert self.read_engine is None
+        read_engine = create_engine(self.db_read_url, **kwargs, future=True)
+        if read_engine.dialect.name != self.dialect_name:
+            _LOGGER.error(
+                "The read replica database dialect %s does not match the"
+                " recorder database dialect %s, read-only queries will use"
+                " the recorder database",
+                read_engine.dialect.name,
+                self.dialect_name,
+            )
+            read_engine.dispose()
+            return
+        sqlalchemy_event.listen(
+            read_engine, "connect", self._setup_read_connection_for_dialect
+        )
+        self.read_engine = read_engine
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read replica database")
+
+    def _setup_read_connection_for_dialect(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read replica."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
 
     def _close_connection(self) -> None:
         """Close the connection."""
@@ -1434,6 +1573,10 @@ class Recorder(threading.Thread):
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -525,11 +525,11 @@ class States(Base):
         else:
             state_value = state.state
             last_updated_ts = state.last_updated_timestamp
-            if state.last_updated == state.last_changed:
+            if last_updated_ts == state.last_changed_timestamp:
                 last_changed_ts = None
             else:
                 last_changed_ts = state.last_changed_timestamp
-            if state.last_updated == state.last_reported:
+            if last_updated_ts == state.last_reported_timestamp:
                 last_reported_ts = None
             else:
                 last_reported_ts = state.last_reported_timestamp
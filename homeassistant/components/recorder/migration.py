@@ -2836,6 +2836,9 @@ class EntityIDMigration(BaseMigrationWithQuery, BaseOffLineMigration):
                         entity_id_to_metadata_id[db_states_metadata.entity_id] = (
                             db_states_metadata.metadata_id
                         )
+                        states_meta_manager.clear_non_existent(
+                            db_states_metadata.entity_id
+                        )
 
                 session.execute(
                     update(States),
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Mapping
 import logging
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -18,6 +19,8 @@ from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
     from ..core import Recorder
 
 # The number of attribute ids to cache in memory
@@ -37,11 +40,27 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The last serialized attributes of recently changed entities. The
+        # state machine reuses the attributes object when they did not
+        # change, so an identity check is enough to skip serializing them
+        # again.
+        self._serialized: LRU[
+            str, tuple[Mapping[str, Any], StateInfo | None, bytes]
+        ] = LRU(CACHE_SIZE)
+        self._non_existent_shared_attrs: LRU[str, None] = LRU(CACHE_SIZE)
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
+        if (state := event.data["new_state"]) is None:
+            self._serialized.pop(event.data["entity_id"], None)
+        elif (
+            (cached := self._serialized.get(state.entity_id)) is not None
+            and cached[0] is state.attributes
+            and cached[1] is state.state_info
+        ):
+            return cached[2]
         try:
-            return StateAttributes.shared_attrs_bytes_from_event(
+            shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
                 event, self.recorder.dialect_name
             )
         except JSON_ENCODE_EXCEPTIONS as ex:
@@ -51,6 +70,33 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
                 ex,
             )
             return None
+        if state is not None:
+            self._serialized[state.entity_id] = (
+                state.attributes,
+                state.state_info,
+                shared_attrs_bytes,
+            )
+        return shared_attrs_bytes
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._serialized.get_size():
+            self._serialized.set_size(new_size)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._serialized.clear()
+        self._non_existent_shared_attrs.clear()
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -60,12 +106,14 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+        if shared_attrs_data_hashes := {
+            shared_attrs_bytes.decode("utf-8"): StateAttributes.hash_shared_attrs_bytes(
+                shared_attrs_bytes
+            )
             for event in events
             if (shared_attrs_bytes := self.serialize_from_event(event))
         }:
-            self._load_from_hashes(hashes, session)
+            self.get_many(shared_attrs_data_hashes.items(), session)
 
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
@@ -84,17 +132,25 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
-        missing_hashes: set[int] = set()
+        missing: dict[str, int] = {}
         for shared_attrs, data_hash in shared_attrs_data_hashes:
-            if (attributes_id := self._id_map.get(shared_attrs)) is None:
-                missing_hashes.add(data_hash)
+            if (
+                attributes_id := self._id_map.get(shared_attrs)
+            ) is None and shared_attrs not in self._non_existent_shared_attrs:
+                missing[shared_attrs] = data_hash
 
             results[shared_attrs] = attributes_id
 
-        if not missing_hashes:
+        if not missing:
             return results
 
-        return results | self._load_from_hashes(missing_hashes, session)
+        results |= self._load_from_hashes(set(missing.values()), session)
+        # Remember the shared_attrs which are not in the database so
+        # they are not looked up again before they are added
+        for shared_attrs in missing:
+            if results.get(shared_attrs) is None:
+                self._non_existent_shared_attrs[shared_attrs] = None
+        return results
 
     def _load_from_hashes(
         self, hashes: Collection[int], session: Session
@@ -134,6 +190,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            self._non_existent_shared_attrs.pop(cast(str, shared_attrs), None)
         self._pending.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
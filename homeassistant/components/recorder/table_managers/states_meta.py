@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -30,6 +31,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         """Initialize the states meta manager."""
         self._did_first_load = False
         super().__init__(recorder, CACHE_SIZE)
+        self._non_existent_entity_ids: LRU[str, None] = LRU(CACHE_SIZE)
 
     def load(
         self, events: list[Event[EventStateChangedData]], session: Session
@@ -92,7 +94,9 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         results: dict[str, int | None] = {}
         missing: list[str] = []
         for entity_id in entity_ids:
-            if (metadata_id := self._id_map.get(entity_id)) is None:
+            if (metadata_id := self._id_map.get(entity_id)) is None and not (
+                from_recorder and entity_id in self._non_existent_entity_ids
+            ):
                 missing.append(entity_id)
 
             results[entity_id] = metadata_id
@@ -119,6 +123,13 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
                     if update_cache:
                         self._id_map[entity_id] = metadata_id
 
+        if from_recorder:
+            # Remember the entity_ids which are not in the database so
+            # they are not looked up again before they are added
+            for entity_id in missing:
+                if results[entity_id] is None:
+                    self._non_existent_entity_ids[entity_id] = None
+
         return results
 
     def add_pending(self, db_states_meta: StatesMeta) -> None:
@@ -139,8 +150,26 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         """
         for entity_id, db_states_meta in self._pending.items():
             self._id_map[entity_id] = db_states_meta.metadata_id
+            self.clear_non_existent(cast(str, entity_id))
         self._pending.clear()
 
+    def clear_non_existent(self, entity_id: str) -> None:
+        """Clear a non-existent entity_id from the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._non_existent_entity_ids.pop(entity_id, None)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._non_existent_entity_ids.clear()
+
     def evict_purged(self, entity_ids: Iterable[str]) -> None:
         """Evict purged event_types from the cache when they are no longer used.
 
@@ -165,4 +194,5 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
             {StatesMeta.entity_id: new_entity_id}
         )
         self._id_map.pop(entity_id, None)
+        self.clear_non_existent(new_entity_id)
         return True
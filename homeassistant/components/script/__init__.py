@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import TraceRunPolicy
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -576,7 +577,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
         )
         self._changed = asyncio.Event()
         self.raw_config = raw_config
-        self._trace_config = cfg[CONF_TRACE]
+        self._trace_policy = TraceRunPolicy(cfg[CONF_TRACE])
         self._blueprint_inputs = blueprint_inputs
         self._attr_name = self.script.name
 
@@ -695,10 +696,11 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             self.raw_config,
             self._blueprint_inputs,
             context,
-            self._trace_config,
+            self._trace_policy,
         ) as script_trace:
             # Prepare tracing the execution of the script's sequence
-            script_trace.set_trace(trace_get())
+            if script_trace is not None:
+                script_trace.set_trace(trace_get())
             with trace_path("sequence"):
                 this = None
                 if state := self.hass.states.get(self.entity_id):
@@ -7,11 +7,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
+    TraceRunPolicy,
     async_store_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_disable
 
 from .const import DOMAIN
 
@@ -29,11 +30,20 @@ def trace_script(
     config: dict[str, Any] | None,
     blueprint_inputs: dict[str, Any] | None,
     context: Context,
-    trace_config: dict[str, Any],
-) -> Iterator[ScriptTrace]:
-    """Trace execution of a script."""
+    trace_policy: TraceRunPolicy,
+) -> Iterator[ScriptTrace | None]:
+    """Trace execution of a script.
+
+    Yields None if the trace policy skips this run.
+    """
+    if not trace_policy.trace_next_run():
+        trace_disable()
+        yield None
+        return
+
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if not trace_policy.store_failed_only:
+        async_store_trace(hass, trace, trace_policy.stored_traces)
 
     try:
         yield trace
@@ -44,3 +54,5 @@ def trace_script(
     finally:
         if item_id:
             trace.finished()
+        if trace_policy.store_failed_only and trace.failed:
+            async_store_trace(hass, trace, trace_policy.stored_traces)
@@ -5,11 +5,12 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
+from dataclasses import dataclass, field
 import datetime
 import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -26,6 +27,9 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
@@ -146,6 +150,96 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+@dataclass(slots=True)
+class _FloatColumns:
+    """Numeric states of a measurement sensor during a period, stored as columns."""
+
+    values: list[float] = field(default_factory=list)
+    timestamps: list[float] = field(default_factory=list)
+    units: set[str | None] = field(default_factory=set)
+
+
+def _time_weighted_average_of_columns(
+    columns: _FloatColumns, start_ts: float, end_ts: float
+) -> float:
+    """Calculate a time weighted average of float columns.
+
+    Same as _time_weighted_average, but works on timestamps.
+    """
+    values = columns.values
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    start_times = [max(timestamp, start_ts) for timestamp in columns.timestamps]
+    # Adjust start time, if there was no last known state
+    start_ts = start_times[0]
+    start_times.append(end_ts)
+    accumulated = math.fsum(
+        value * (start_times[idx + 1] - start_times[idx])
+        for idx, value in enumerate(values)
+    )
+    if (period_seconds := end_ts - start_ts) == 0:
+        # See _time_weighted_average
+        return 0.0
+    return accumulated / period_seconds
+
+
+def _get_float_columns(
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    entity_ids: list[str],
+) -> dict[str, _FloatColumns]:
+    """Fetch the numeric significant states of entities in a single pass.
+
+    The states are fetched in the compressed format to avoid creating
+    state objects, attributes are only inspected when they change.
+    """
+    history_list = history.get_significant_states_with_session(
+        hass,
+        session,
+        start - datetime.timedelta.resolution,
+        end,
+        entity_ids=entity_ids,
+        compressed_state_format=True,
+    )
+    isfinite = math.isfinite
+    result: dict[str, _FloatColumns] = {}
+    for entity_id, entity_history in history_list.items():
+        columns = result[entity_id] = _FloatColumns()
+        values_append = columns.values.append
+        timestamps_append = columns.timestamps.append
+        last_attributes: dict[str, Any] | None = None
+        for compressed_state in cast(list[dict[str, Any]], entity_history):
+            try:
+                if not isfinite(
+                    float_state := float(compressed_state[COMPRESSED_STATE_STATE])
+                ):
+                    continue
+            except (ValueError, TypeError):
+                continue
+            # Attribute dicts are shared between rows with the same attributes
+            if (
+                attributes := compressed_state[COMPRESSED_STATE_ATTRIBUTES]
+            ) is not last_attributes:
+                columns.units.add(attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+                last_attributes = attributes
+            values_append(float_state)
+            timestamps_append(compressed_state[COMPRESSED_STATE_LAST_UPDATED])
+    return result
+
+
+def _state_to_float_columns(state: State) -> _FloatColumns | None:
+    """Return float columns for a single state, if it's numeric."""
+    if not _is_numeric(state):
+        return None
+    return _FloatColumns(
+        [float(state.state)],
+        [state.last_updated_timestamp],
+        {state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)},
+    )
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -432,19 +526,27 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    # Measurements are fetched for all entities in one columnar pass
+    float_columns: dict[str, _FloatColumns] = {}
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
+        float_columns = _get_float_columns(
+            hass, session, start, end, entities_significant_history
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_columns: dict[str, _FloatColumns] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if "sum" not in wanted_statistics[entity_id]:
+            # If there are no recent state changes, the sensor's state may
+            # already be pruned from the recorder. Get the state from the
+            # state machine instead.
+            if columns := float_columns.get(entity_id):
+                if columns.values:
+                    entities_with_float_columns[entity_id] = columns
+            elif columns := _state_to_float_columns(_state):
+                entities_with_float_columns[entity_id] = columns
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -458,8 +560,69 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids={*entities_with_float_states, *entities_with_float_columns},
     )
+
+    # Min, max and mean are calculated from the columns unless the unit
+    # changed during the period or differs from the unit of already compiled
+    # statistics, those entities need their states normalized.
+    start_ts = start.timestamp()
+    end_ts = end.timestamp()
+    entities_to_normalize: set[str] = set()
+    for entity_id, columns in entities_with_float_columns.items():
+        if len(columns.units) != 1:
+            entities_to_normalize.add(entity_id)
+            continue
+        statistics_unit = next(iter(columns.units))
+        if (old_metadata := old_metadatas.get(entity_id)) and old_metadata[1][
+            "unit_of_measurement"
+        ] != statistics_unit:
+            entities_to_normalize.add(entity_id)
+            continue
+        values = columns.values
+        entity_wanted_statistics = wanted_statistics[entity_id]
+        columns_stat: StatisticData = {"start": start}
+        if "max" in entity_wanted_statistics:
+            columns_stat["max"] = max(values)
+        if "min" in entity_wanted_statistics:
+            columns_stat["min"] = min(values)
+        if "mean" in entity_wanted_statistics:
+            columns_stat["mean"] = _time_weighted_average_of_columns(
+                columns, start_ts, end_ts
+            )
+        result.append(
+            {
+                "meta": {
+                    "has_mean": "mean" in entity_wanted_statistics,
+                    "has_sum": False,
+                    "name": None,
+                    "source": RECORDER_DOMAIN,
+                    "statistic_id": entity_id,
+                    "unit_of_measurement": statistics_unit,
+                },
+                "stat": columns_stat,
+            }
+        )
+    if entities_to_normalize:
+        _history_list = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            start - datetime.timedelta.resolution,
+            end,
+            entity_ids=list(entities_to_normalize),
+        )
+        for _state in sensor_states:
+            entity_id = _state.entity_id
+            if entity_id in _history_list:
+                entity_history = _history_list[entity_id]
+            elif entity_id in entities_to_normalize:
+                entity_history = [_state]
+            else:
+                continue
+            if float_states := _entity_history_to_float_and_state(entity_history):
+                entities_with_float_states[entity_id] = float_states
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
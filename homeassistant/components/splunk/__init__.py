@@ -16,13 +16,13 @@ from homeassistant.const import (
     CONF_SSL,
     CONF_TOKEN,
     CONF_VERIFY_SSL,
-    EVENT_STATE_CHANGED,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant
 from homeassistant.helpers import state as state_helper
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+from homeassistant.helpers.event import async_track_state_change_batch
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import ConfigType
 
@@ -88,31 +88,46 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     await event_collector.queue(json.dumps(payload, cls=JSONEncoder), send=False)
 
-    async def splunk_event_listener(event):
-        """Listen for new messages on the bus and sends them to Splunk."""
+    async def splunk_event_listener(
+        events: list[Event[EventStateChangedData]],
+    ) -> None:
+        """Listen for new messages on the bus and sends them to Splunk.
+
+        The state changes of one event loop iteration are sent in one request.
+        """
+        queued = False
+        for event in events:
+            state = event.data.get("new_state")
+            if state is None or not entity_filter(state.entity_id):
+                continue
+
+            _state: float | str
+            try:
+                _state = state_helper.state_as_number(state)
+            except ValueError:
+                _state = state.state
+
+            payload = {
+                "time": event.time_fired.timestamp(),
+                "host": name,
+                "event": {
+                    "domain": state.domain,
+                    "entity_id": state.object_id,
+                    "attributes": dict(state.attributes),
+                    "value": _state,
+                },
+            }
 
-        state = event.data.get("new_state")
-        if state is None or not entity_filter(state.entity_id):
-            return
+            await event_collector.queue(
+                json.dumps(payload, cls=JSONEncoder), send=False
+            )
+            queued = True
 
-        try:
-            _state = state_helper.state_as_number(state)
-        except ValueError:
-            _state = state.state
-
-        payload = {
-            "time": event.time_fired.timestamp(),
-            "host": name,
-            "event": {
-                "domain": state.domain,
-                "entity_id": state.object_id,
-                "attributes": dict(state.attributes),
-                "value": _state,
-            },
-        }
+        if not queued:
+            return
 
         try:
-            await event_collector.queue(json.dumps(payload, cls=JSONEncoder), send=True)
+            await event_collector.send()
         except SplunkPayloadError as err:
             if err.status == HTTPStatus.UNAUTHORIZED:
                 _LOGGER.error(err)
@@ -125,6 +140,6 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         except ClientResponseError as err:
             _LOGGER.error(err.message)
 
-    hass.bus.async_listen(EVENT_STATE_CHANGED, splunk_event_listener)
+    async_track_state_change_batch(hass, splunk_event_listener)
 
     return True
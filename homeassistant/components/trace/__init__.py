@@ -16,13 +16,16 @@ from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
 from .const import (
+    CONF_POLICY,
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
     DATA_TRACE,
     DATA_TRACE_STORE,
     DEFAULT_STORED_TRACES,
+    TracePolicy,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import TraceRunPolicy, async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +35,9 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_POLICY): vol.Coerce(TracePolicy),
+    vol.Optional(CONF_SAMPLE_RATE): vol.All(vol.Coerce(int), vol.Range(min=1)),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -41,6 +46,8 @@ __all__ = [
     "CONF_STORED_TRACES",
     "TRACE_CONFIG_SCHEMA",
     "ActionTrace",
+    "TracePolicy",
+    "TraceRunPolicy",
     "async_store_trace",
 ]
 
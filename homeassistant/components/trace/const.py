@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from enum import StrEnum
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -12,8 +13,27 @@ if TYPE_CHECKING:
     from .models import TraceData
 
 
+CONF_POLICY = "policy"
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
+DEFAULT_SAMPLE_RATE = 10  # Trace one in ten runs when sampling
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+
+class TracePolicy(StrEnum):
+    """Which runs of a script or automation are traced."""
+
+    FULL = "full"
+    """Trace and store every run."""
+
+    ON_ERROR = "on_error"
+    """Trace every run, only store the runs that failed."""
+
+    SAMPLED = "sampled"
+    """Trace and store one in sample_rate runs."""
+
+    OFF = "off"
+    """Do not trace."""
@@ -83,6 +83,18 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return if the run failed.
+
+        Falls back to the script execution of the current run if the trace
+        has not finished.
+        """
+        if self._error is not None:
+            return True
+        script_execution = self._script_execution or script_execution_get()
+        return script_execution == "error"
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
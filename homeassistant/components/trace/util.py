@@ -8,9 +8,20 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    CONF_POLICY,
+    CONF_SAMPLE_RATE,
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
+    DEFAULT_STORED_TRACES,
+    TracePolicy,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -78,6 +89,36 @@ async def async_list_traces(
     return traces
 
 
+class TraceRunPolicy:
+    """Apply the trace config of a script or automation to its runs."""
+
+    __slots__ = ("_runs", "policy", "sample_rate", "stored_traces")
+
+    def __init__(self, trace_config: ConfigType) -> None:
+        """Initialize the policy."""
+        self.policy = TracePolicy(trace_config.get(CONF_POLICY, TracePolicy.FULL))
+        self.sample_rate: int = trace_config.get(CONF_SAMPLE_RATE, DEFAULT_SAMPLE_RATE)
+        self.stored_traces: int = trace_config.get(
+            CONF_STORED_TRACES, DEFAULT_STORED_TRACES
+        )
+        self._runs = 0
+
+    def trace_next_run(self) -> bool:
+        """Return if the next run should be traced."""
+        if self.policy is TracePolicy.OFF:
+            return False
+        if self.policy is TracePolicy.SAMPLED:
+            traced = self._runs % self.sample_rate == 0
+            self._runs += 1
+            return traced
+        return True
+
+    @property
+    def store_failed_only(self) -> bool:
+        """Return if only the traces of failed runs are stored."""
+        return self.policy is TracePolicy.ON_ERROR
+
+
 def async_store_trace(
     hass: HomeAssistant, trace: ActionTrace, stored_traces: int
 ) -> None:
@@ -0,0 +1,354 @@
+"""Fan out state changes to subscribe_entities subscriptions.
+
+Subscriptions with the same entity filter share a group. The group
+filters each state change once and builds each outgoing frame once for
+all subscribers that use the same message id, which is what a wall of
+identical dashboards does. The state changes of one event loop
+iteration are sent as a single frame, and a group can also coalesce the
+changes of a longer window, so bursts of state changes do not result in
+a frame per change for every client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HassJobType,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_batch
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .connection import ActiveConnection
+from .const import DOMAIN
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptionHub] = HassKey(
+    f"{DOMAIN}.entity_subscriptions"
+)
+
+type _GroupKey = tuple[frozenset[str] | None, Hashable, float]
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the hub for subscribe_entities subscriptions."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = EntitySubscriptionHub(hass)
+    return hub
+
+
+def _can_read_all_entities(user: User) -> bool:
+    """Return if the user can read every entity."""
+    # We have to lookup the permissions on every change because the
+    # user might have changed since the subscription was created.
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
+@dataclass(slots=True)
+class _Subscriber:
+    """A subscribe_entities subscription of a connection."""
+
+    connection: ActiveConnection
+    message_id_as_bytes: bytes
+    max_pending_message_count: int = 0
+
+    def send(self, message: bytes) -> None:
+        """Send a message and track the send queue of the connection."""
+        connection = self.connection
+        connection.send_message(message)
+        if (
+            pending := connection.get_pending_message_count()
+        ) > self.max_pending_message_count:
+            self.max_pending_message_count = pending
+
+
+@callback
+def _async_merge_change(
+    changes: dict[str, tuple[State | None, State | None]],
+    event: Event[EventStateChangedData],
+) -> None:
+    """Merge a state change into the changes queued for the entities."""
+    data = event.data
+    entity_id = data["entity_id"]
+    if (pending := changes.get(entity_id)) is None:
+        changes[entity_id] = (data["old_state"], data["new_state"])
+    else:
+        changes[entity_id] = (pending[0], data["new_state"])
+
+
+class _SubscriberGroup:
+    """Subscriptions that share an entity filter and coalesce window."""
+
+    __slots__ = (
+        "batch",
+        "coalesce_window",
+        "entity_filter",
+        "entity_ids",
+        "flush_handle",
+        "hass",
+        "pending",
+        "subscribers",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        coalesce_window: float,
+    ) -> None:
+        """Initialize the group."""
+        self.hass = hass
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.coalesce_window = coalesce_window
+        self.subscribers: list[_Subscriber] = []
+        # The state each client last received and the current state
+        self.pending: dict[str, tuple[State | None, State | None]] = {}
+        self.flush_handle: asyncio.TimerHandle | None = None
+        # The state changes of the current event loop iteration
+        self.batch: list[Event[EventStateChangedData]] = []
+
+    def matches(self, entity_id: str) -> bool:
+        """Return if the group is interested in the entity."""
+        return (not self.entity_ids or entity_id in self.entity_ids) and (
+            not self.entity_filter or self.entity_filter(entity_id)
+        )
+
+    @callback
+    def async_send(
+        self,
+        changes: dict[str, tuple[State | None, State | None]],
+        partial_message: bytes,
+    ) -> None:
+        """Send the changes to all subscribers.
+
+        Subscribers that use the same message id share the frame.
+        """
+        frames: dict[bytes, bytes] = {}
+        for subscriber in self.subscribers:
+            message_id_as_bytes = subscriber.message_id_as_bytes
+            user = subscriber.connection.user
+            if not _can_read_all_entities(user):
+                check_entity = user.permissions.check_entity
+                if not (
+                    permitted := [
+                        entity_id
+                        for entity_id in changes
+                        if check_entity(entity_id, POLICY_READ)
+                    ]
+                ):
+                    continue
+                if len(permitted) != len(changes):
+                    if (
+                        permitted_message := messages.partial_state_diffs_message(
+                            (entity_id, *changes[entity_id]) for entity_id in permitted
+                        )
+                    ) is not None:
+                        subscriber.send(
+                            messages.partial_message_with_id(
+                                permitted_message, message_id_as_bytes
+                            )
+                        )
+                    continue
+            if (frame := frames.get(message_id_as_bytes)) is None:
+                frame = frames[message_id_as_bytes] = messages.partial_message_with_id(
+                    partial_message, message_id_as_bytes
+                )
+            subscriber.send(frame)
+
+    @callback
+    def async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue a state change."""
+        if not self.coalesce_window:
+            self.batch.append(event)
+            return
+        _async_merge_change(self.pending, event)
+        if self.flush_handle is None:
+            self.flush_handle = self.hass.loop.call_later(
+                self.coalesce_window, self.async_flush
+            )
+
+    @callback
+    def async_send_batch(self) -> None:
+        """Send the state changes of the event loop iteration."""
+        events = self.batch
+        self.batch = []
+        if len(events) == 1:
+            event = events[0]
+            data = event.data
+            self.async_send(
+                {data["entity_id"]: (data["old_state"], data["new_state"])},
+                messages.partial_cached_state_diff_message(event),
+            )
+            return
+        changes: dict[str, tuple[State | None, State | None]] = {}
+        for event in events:
+            _async_merge_change(changes, event)
+        self._async_send_changes(changes)
+
+    @callback
+    def async_flush(self) -> None:
+        """Send the changes queued during the window."""
+        self.flush_handle = None
+        changes = self.pending
+        self.pending = {}
+        self._async_send_changes(changes)
+
+    @callback
+    def _async_send_changes(
+        self, changes: dict[str, tuple[State | None, State | None]]
+    ) -> None:
+        """Send the combined changes of several entities."""
+        if (
+            partial_message := messages.partial_state_diffs_message(
+                (entity_id, *change) for entity_id, change in changes.items()
+            )
+        ) is not None:
+            self.async_send(changes, partial_message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the queued changes."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        self.pending.clear()
+        self.batch.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return statistics about the group."""
+        return {
+            "entity_ids": sorted(self.entity_ids) if self.entity_ids else None,
+            "filtered": self.entity_filter is not None,
+            "coalesce_window": self.coalesce_window,
+            "subscriptions": len(self.subscribers),
+            "pending_changes": len(self.pending),
+        }
+
+
+class EntitySubscriptionHub:
+    """Deliver state changes to subscribe_entities subscriptions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._groups: dict[_GroupKey, _SubscriberGroup] = {}
+        # Groups limited to entity ids are indexed by entity id, the
+        # others have to see every state change
+        self._groups_by_entity_id: dict[str, list[_SubscriberGroup]] = {}
+        self._unkeyed_groups: list[_SubscriberGroup] = []
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        filter_key: Hashable,
+        coalesce_window: float,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes.
+
+        filter_key must be equal for subscriptions with equal entity
+        filters. Returns a callback to unsubscribe.
+        """
+        key = (
+            frozenset(entity_ids) if entity_ids else None,
+            filter_key,
+            coalesce_window,
+        )
+        if (group := self._groups.get(key)) is None:
+            group = self._groups[key] = _SubscriberGroup(
+                self._hass, entity_ids, entity_filter, coalesce_window
+            )
+            if entity_ids:
+                for entity_id in entity_ids:
+                    self._groups_by_entity_id.setdefault(entity_id, []).append(group)
+            else:
+                self._unkeyed_groups.append(group)
+        subscriber = _Subscriber(connection, str(msg_id).encode())
+        group.subscribers.append(subscriber)
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = async_track_state_change_batch(
+                self._hass, self._async_state_changed, HassJobType.Callback
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            group.subscribers.remove(subscriber)
+            if group.subscribers:
+                return
+            group.async_cancel()
+            del self._groups[key]
+            if group.entity_ids:
+                for entity_id in group.entity_ids:
+                    groups = self._groups_by_entity_id[entity_id]
+                    groups.remove(group)
+                    if not groups:
+                        del self._groups_by_entity_id[entity_id]
+            else:
+                self._unkeyed_groups.remove(group)
+            if not self._groups and self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_state_changed(self, events: list[Event[EventStateChangedData]]) -> None:
+        """Pass the state changes to the groups interested in the entities."""
+        batched: list[_SubscriberGroup] = []
+        for event in events:
+            entity_id = event.data["entity_id"]
+            if groups := self._groups_by_entity_id.get(entity_id):
+                groups = groups + self._unkeyed_groups
+            else:
+                groups = self._unkeyed_groups
+            for group in groups:
+                if group.matches(entity_id):
+                    if not group.coalesce_window and not group.batch:
+                        batched.append(group)
+                    group.async_state_changed(event)
+        for group in batched:
+            group.async_send_batch()
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return statistics about the groups and connections."""
+        connections: dict[int, dict[str, Any]] = {}
+        for group in self._groups.values():
+            for subscriber in group.subscribers:
+                connection = subscriber.connection
+                if (stats := connections.get(id(connection))) is None:
+                    stats = connections[id(connection)] = {
+                        "user_id": connection.user.id,
+                        "subscriptions": 0,
+                        "pending_changes": 0,
+                        "pending_messages": connection.get_pending_message_count(),
+                        "max_pending_messages": 0,
+                    }
+                stats["subscriptions"] += 1
+                stats["pending_changes"] += len(group.pending)
+                stats["max_pending_messages"] = max(
+                    stats["max_pending_messages"],
+                    subscriber.max_pending_message_count,
+                )
+        return {
+            "groups": [group.as_dict() for group in self._groups.values()],
+            "connections": list(connections.values()),
+        }
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from functools import lru_cache, partial
 import json
 import logging
@@ -14,6 +14,8 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -63,6 +65,7 @@ from homeassistant.setup import async_get_loaded_integrations, async_get_setup_t
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .broadcast import async_get_entity_subscription_hub
 from .connection import ActiveConnection
 from .messages import construct_result_message
 
@@ -96,6 +99,7 @@ def async_register_commands(
     async_reg(hass, handle_unsubscribe_events)
     async_reg(hass, handle_validate_config)
     async_reg(hass, handle_subscribe_entities)
+    async_reg(hass, handle_entity_subscriptions_stats)
     async_reg(hass, handle_supported_features)
     async_reg(hass, handle_integration_descriptions)
 
@@ -367,38 +371,14 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_window", default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=const.MAX_COALESCE_WINDOW)
+        ),
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,16 +395,15 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(
+        connection,
+        msg_id,
+        entity_ids,
+        entity_filter,
+        None if entity_filter is None else _entity_filter_key(msg),
+        msg["coalesce_window"],
     )
     connection.send_result(msg_id)
 
@@ -467,6 +446,32 @@ def handle_subscribe_entities(
     )
 
 
+def _entity_filter_key(msg: dict[str, Any]) -> Hashable:
+    """Return a key that is equal for equal include/exclude filters."""
+    return tuple(
+        (
+            filter_type,
+            tuple(
+                (key, tuple(sorted(values)))
+                for key, values in sorted(msg.get(filter_type, {}).items())
+            ),
+        )
+        for filter_type in (CONF_INCLUDE, CONF_EXCLUDE)
+    )
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "entity_subscriptions/stats"})
+def handle_entity_subscriptions_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle entity subscription statistics command."""
+    connection.send_result(
+        msg["id"], async_get_entity_subscription_hub(hass).async_get_stats()
+    )
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
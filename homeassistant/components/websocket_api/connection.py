@@ -36,12 +36,19 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return the number of messages waiting to be sent."""
+    return 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
     __slots__ = (
         "binary_handlers",
         "can_coalesce",
+        "compress_min_size",
+        "get_pending_message_count",
         "handlers",
         "hass",
         "last_id",
@@ -70,11 +77,14 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.compress_min_size = 0
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Replaced by the websocket handler once its send queue exists
+        self.get_pending_message_count: Callable[[], int] = _no_pending_messages
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -85,6 +95,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.compress_min_size = int(features.get(const.FEATURE_COMPRESS_MIN_SIZE, 0))
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -34,6 +34,13 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Maximum number of seconds to hold the answers to a batch of commands
+# sent in one frame so they can be written in one frame
+BATCH_MAX_WAIT: Final = 0.5
+
+# Maximum number of seconds subscribe_entities may coalesce state changes
+MAX_COALESCE_WINDOW: Final = 5
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +65,6 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Messages smaller than this number of bytes are sent without
+# permessage-deflate compression
+FEATURE_COMPRESS_MIN_SIZE = "compress_min_size"
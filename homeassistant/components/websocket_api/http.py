@@ -19,10 +19,11 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JsonValueType, json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    BATCH_MAX_WAIT,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -38,6 +39,28 @@ from .util import describe_request
 
 CLOSE_MSG_TYPES = {WSMsgType.CLOSE, WSMsgType.CLOSED, WSMsgType.CLOSING}
 
+_MESSAGE_ID_PREFIX = b'{"id":'
+_ANSWER_TYPES = (b',"type":"result"', b',"type":"pong"')
+
+
+def _answered_message_id(message: bytes) -> int | None:
+    """Return the id of the command a message answers.
+
+    Result and pong messages are serialized with the id first, so the
+    id can be read without parsing the message.
+    """
+    if not message.startswith(_MESSAGE_ID_PREFIX):
+        return None
+    if (end := message.find(b",", 6)) == -1 or not message.startswith(
+        _ANSWER_TYPES, end
+    ):
+        return None
+    try:
+        return int(message[6:end])
+    except ValueError:
+        return None
+
+
 if TYPE_CHECKING:
     from .connection import ActiveConnection
 
@@ -57,6 +80,22 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app[KEY_HASS], request).async_handle()
 
 
+async def _async_send_uncompressed(writer: WebSocketWriter, message: bytes) -> None:
+    """Send a text frame without permessage-deflate.
+
+    RFC 7692 allows uncompressed frames after compression was negotiated.
+    The writer only reads compress before it first awaits and only the
+    writer task sends data frames, so it is safe to turn compression off
+    while sending this frame.
+    """
+    compress = writer.compress
+    writer.compress = 0
+    try:
+        await writer.send_frame(message, WSMsgType.TEXT)
+    finally:
+        writer.compress = compress
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -71,6 +110,9 @@ class WebSocketHandler:
 
     __slots__ = (
         "_authenticated",
+        "_batch_answers",
+        "_batch_pending_ids",
+        "_batch_timeout",
         "_closing",
         "_connection",
         "_handle_task",
@@ -107,6 +149,11 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Ids of batched commands that have not been answered yet
+        self._batch_pending_ids: set[int] = set()
+        # Answers to batched commands held until the batch is answered
+        self._batch_answers: list[bytes] = []
+        self._batch_timeout: asyncio.TimerHandle | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -140,6 +187,9 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        writer = wsock._writer  # noqa: SLF001
+        if TYPE_CHECKING:
+            assert writer is not None
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -157,16 +207,17 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
-
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                # The client may ask to not compress small messages as
+                # deflating them costs more than it saves on fast links
+                if len(message) < connection.compress_min_size and writer.compress:
+                    await _async_send_uncompressed(writer, message)
+                else:
+                    await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -203,6 +254,34 @@ class WebSocketHandler:
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
+        if (
+            self._batch_pending_ids
+            and (message_id := _answered_message_id(message)) in self._batch_pending_ids
+        ):
+            # Hold the answers to a batch of commands until all of them are
+            # answered so they are written in one frame. Other messages are
+            # not held.
+            self._batch_pending_ids.remove(message_id)
+            if (
+                connection := self._connection
+            ) is not None and message_id in connection.subscriptions:
+                # The events of a subscription are not held, so its result
+                # is sent right away to arrive before them
+                self._queue_message(message)
+            else:
+                self._batch_answers.append(message)
+            if not self._batch_pending_ids:
+                self._async_release_batch()
+            return
+
+        self._queue_message(message)
+
+    @callback
+    def _queue_message(self, message: bytes) -> None:
+        """Queue a serialized message and schedule the writer."""
+        if self._closing:
+            return
+
         message_queue = self._message_queue
         message_queue.append(message)
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
@@ -262,6 +341,44 @@ class WebSocketHandler:
         if not ready_future.done():
             ready_future.set_result(queue_size)
 
+    @callback
+    def _async_handle_batch(self, command_msgs: list[JsonValueType]) -> None:
+        """Handle a frame with multiple commands.
+
+        When the client can read coalesced messages, the answers are held
+        until all commands of the batch are answered or BATCH_MAX_WAIT
+        has passed since the first batch that is still held.
+        """
+        connection = self._connection
+        if TYPE_CHECKING:
+            assert connection is not None
+        if connection.can_coalesce:
+            self._batch_pending_ids.update(
+                msg_id
+                for msg in command_msgs
+                if type(msg) is dict and type(msg_id := msg.get("id")) is int
+            )
+        for msg in command_msgs:
+            connection.async_handle(msg)
+        # Later batches can't extend the deadline of the held answers
+        if not self._batch_pending_ids or self._batch_timeout is not None:
+            return
+        self._batch_timeout = self._loop.call_later(
+            BATCH_MAX_WAIT, self._async_release_batch
+        )
+
+    @callback
+    def _async_release_batch(self) -> None:
+        """Queue the held answers to batched commands."""
+        if self._batch_timeout is not None:
+            self._batch_timeout.cancel()
+            self._batch_timeout = None
+        self._batch_pending_ids.clear()
+        answers = self._batch_answers
+        self._batch_answers = []
+        for answer in answers:
+            self._queue_message(answer)
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -357,6 +474,10 @@ class WebSocketHandler:
             unsub_stop()
 
             self._cancel_peak_checker()
+            if self._batch_timeout is not None:
+                self._batch_timeout.cancel()
+                self._batch_timeout = None
+            self._batch_answers.clear()
 
             if connection is not None:
                 connection.async_handle_close()
@@ -403,6 +524,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.get_pending_message_count = self._get_pending_message_count
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
@@ -410,6 +532,11 @@ class WebSocketHandler:
         self._authenticated = True
         return connection
 
+    def _get_pending_message_count(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        # The queue is cleared once the connection is closed
+        return len(self._message_queue or ())
+
     @callback
     def _async_increase_writer_limit(self, writer: WebSocketWriter) -> None:
         #
@@ -494,8 +621,7 @@ class WebSocketHandler:
                 async_handle_str(command_msg_data)
                 continue
 
-            for split_msg in command_msg_data:
-                async_handle_str(split_msg)
+            self._async_handle_batch(command_msg_data)
 
     async def _async_cleanup_writer_and_close(
         self, disconnect_warn: str | None, connection: ActiveConnection | None
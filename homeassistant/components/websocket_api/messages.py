@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -152,18 +153,55 @@ def cached_state_diff_message(
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
+    return partial_message_with_id(
+        partial_cached_state_diff_message(event), message_id_as_bytes
+    )
+
+
+def partial_message_with_id(
+    partial_message: bytes, message_id_as_bytes: bytes
+) -> bytes:
+    """Add the id to a message serialized without one."""
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
+def partial_state_diffs_message(
+    changes: Iterable[tuple[str, State | None, State | None]],
+) -> bytes | None:
+    """Serialize the combined changes of several entities without the id.
+
+    Each change is the entity_id with the state the client last received
+    and the current state. Entities that were added and removed again are
+    left out. Returns None when nothing changed.
+    """
+    added: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removed: list[str] = []
+    for entity_id, old_state, new_state in changes:
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        else:
+            changed[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": event})
+        or INVALID_JSON_PARTIAL_MESSAGE
     )
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+def partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
     The message is constructed without the id which
@@ -199,16 +237,30 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the minimal diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
     old_state_context = old_state.context
     if old_state.state != new_state.state:
         additions[COMPRESSED_STATE_STATE] = new_state.state
-    if old_state.last_changed != new_state.last_changed:
-        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed_timestamp
-    elif old_state.last_updated != new_state.last_updated:
-        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated_timestamp
+    last_changed_timestamp = new_state.last_changed_timestamp
+    last_updated_timestamp = new_state.last_updated_timestamp
+    if old_state.last_changed_timestamp != last_changed_timestamp:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = last_changed_timestamp
+    # The old state may be several updates behind when changes are
+    # coalesced, so last_updated can differ from a new last_changed
+    if old_state.last_updated_timestamp != last_updated_timestamp and (
+        COMPRESSED_STATE_LAST_CHANGED not in additions
+        or last_updated_timestamp != last_changed_timestamp
+    ):
+        additions[COMPRESSED_STATE_LAST_UPDATED] = last_updated_timestamp
     if old_state_context.parent_id != new_state_context.parent_id:
         additions[COMPRESSED_STATE_CONTEXT] = {"parent_id": new_state_context.parent_id}
     if old_state_context.user_id != new_state_context.user_id:
@@ -221,9 +273,10 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    # The state machine reuses the attributes when they did not change
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         if added := {
             key: value
             for key, value in new_attributes.items()
@@ -235,7 +288,7 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -1459,7 +1460,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_dispatchers",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1467,6 +1475,11 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # event_type -> data key -> data value -> listeners
+        self._keyed_listeners: dict[
+            EventType[Any] | str, dict[str, dict[Any, list[_FilterableJobType[Any]]]]
+        ] = {}
+        self._keyed_dispatchers: dict[EventType[Any] | str, CALLBACK_TYPE] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1641,6 +1654,63 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        value: Hashable,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where a data key has a value.
+
+        The listener is only called when the event data contains ``key``
+        and its value equals ``value``. Keyed listeners are stored in an
+        index so firing an event only looks at the listeners that match,
+        instead of running an event_filter for every listener.
+
+        All keyed listeners of an event type are dispatched together, at the
+        position the first of them was registered among the other listeners.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require a specific event type")
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} {key}={value}"),
+            None,
+        )
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
+            keyed_listeners = self._keyed_listeners[event_type] = {}
+            self._keyed_dispatchers[event_type] = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        functools.partial(self._async_dispatch_keyed, keyed_listeners),
+                        f"listen {event_type} keyed",
+                        job_type=HassJobType.Callback,
+                    ),
+                    functools.partial(_async_keyed_filter, keyed_listeners),
+                ),
+            )
+        keyed_listeners.setdefault(key, {}).setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key, value, filterable_job
+        )
+
+    @callback
+    def _async_dispatch_keyed(
+        self,
+        keyed_listeners: dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+        event: Event[Any],
+    ) -> None:
+        """Dispatch an event to the keyed listeners that match its data."""
+        for job, _ in _async_matching_keyed_listeners(keyed_listeners, event.data):
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1741,6 +1811,70 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        value: Hashable,
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            index = keyed_listeners[key]
+            listeners = index[value]
+            listeners.remove(filterable_job)
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        # prune the index so empty buckets do not accumulate
+        if not listeners:
+            del index[value]
+            if not index:
+                del keyed_listeners[key]
+                if not keyed_listeners:
+                    del self._keyed_listeners[event_type]
+                    self._keyed_dispatchers.pop(event_type)()
+
+
+@callback
+def _async_keyed_filter(
+    keyed_listeners: dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+    event_data: Mapping[str, Any],
+) -> bool:
+    """Return if any keyed listener matches the event data."""
+    for key, index in keyed_listeners.items():
+        try:
+            if event_data.get(key, _SENTINEL) in index:
+                return True
+        except TypeError:
+            # Unhashable values can never match a keyed listener
+            continue
+    return False
+
+
+def _async_matching_keyed_listeners(
+    keyed_listeners: dict[str, dict[Any, list[_FilterableJobType[Any]]]],
+    event_data: Mapping[str, Any],
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listeners that match the event data."""
+    matched: list[_FilterableJobType[Any]] = []
+    for key, index in keyed_listeners.items():
+        try:
+            if listeners := index.get(event_data.get(key, _SENTINEL)):
+                matched += listeners
+        except TypeError:
+            # Unhashable values can never match a keyed listener
+            continue
+    return matched
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -1768,13 +1902,15 @@ class State:
 
     __slots__ = (
         "_cache",
+        "_last_changed",
+        "_last_reported",
+        "_last_updated",
         "attributes",
         "context",
         "domain",
         "entity_id",
-        "last_changed",
-        "last_reported",
-        "last_updated",
+        "last_changed_timestamp",
+        "last_reported_timestamp",
         "last_updated_timestamp",
         "object_id",
         "state",
@@ -1793,8 +1929,16 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
+        last_reported_timestamp: float | None = None,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        The times can be passed as datetimes, timestamps or both. The
+        state machine only passes timestamps, the datetimes are created
+        the first time they are accessed as most states are replaced
+        before that happens.
+        """
         self._cache: dict[str, Any] = {}
         state = str(state)
 
@@ -1815,26 +1959,80 @@ class State:
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
+        if last_reported_timestamp is None:
+            if last_reported is None:
+                last_reported = dt_util.utcnow()
+            last_reported_timestamp = last_reported.timestamp()
+        if last_updated_timestamp is None:
+            if last_updated is None or last_updated is last_reported:
+                last_updated = last_reported
+                last_updated_timestamp = last_reported_timestamp
+            else:
+                last_updated_timestamp = last_updated.timestamp()
+        if last_changed_timestamp is None:
+            if last_changed is None or last_changed == last_updated:
+                last_changed = last_updated
+                last_changed_timestamp = last_updated_timestamp
+            else:
+                last_changed_timestamp = last_changed.timestamp()
+        self._last_reported = last_reported
+        self._last_updated = last_updated
+        self._last_changed = last_changed
+        self.last_reported_timestamp = last_reported_timestamp
+        self.last_updated_timestamp = last_updated_timestamp
+        self.last_changed_timestamp = last_changed_timestamp
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
-        # The recorder or the websocket_api will always call the timestamps,
-        # so we will set the timestamp values here to avoid the overhead of
-        # the function call in the property we know will always be called.
-        last_updated = self.last_updated
-        if not last_updated_timestamp:
-            last_updated_timestamp = last_updated.timestamp()
-        self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
-        # the same datetime object for both values so we can use an identity
-        # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        if (last_changed := self._last_changed) is None:
+            if self.last_changed_timestamp == self.last_updated_timestamp:
+                last_changed = self.last_updated
+            else:
+                last_changed = dt_util.utc_from_timestamp(self.last_changed_timestamp)
+            self._last_changed = last_changed
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set the last time the state was changed."""
+        self._last_changed = value
+        self.last_changed_timestamp = value.timestamp()
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        if (last_reported := self._last_reported) is None:
+            if self.last_reported_timestamp == self.last_updated_timestamp:
+                last_reported = self.last_updated
+            else:
+                last_reported = dt_util.utc_from_timestamp(self.last_reported_timestamp)
+            self._last_reported = last_reported
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set the last time the state was reported."""
+        self._last_reported = value
+        self.last_reported_timestamp = value.timestamp()
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        if (last_updated := self._last_updated) is None:
+            last_updated = self._last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set the last time the state or attributes were changed."""
+        self._last_updated = value
+        self.last_updated_timestamp = value.timestamp()
 
     @under_cached_property
     def name(self) -> str:
@@ -1843,16 +2041,6 @@ class State:
             "_", " "
         )
 
-    @under_cached_property
-    def last_changed_timestamp(self) -> float:
-        """Timestamp of last change."""
-        return self.last_changed.timestamp()
-
-    @under_cached_property
-    def last_reported_timestamp(self) -> float:
-        """Timestamp of last report."""
-        return self.last_reported.timestamp()
-
     @under_cached_property
     def _as_dict(self) -> dict[str, Any]:
         """Return a dict representation of the State.
@@ -1861,11 +2049,12 @@ class State:
         as it will mutate the cached version.
         """
         last_changed_isoformat = self.last_changed.isoformat()
-        if self.last_changed == self.last_updated:
+        last_changed_timestamp = self.last_changed_timestamp
+        if last_changed_timestamp == self.last_updated_timestamp:
             last_updated_isoformat = last_changed_isoformat
         else:
             last_updated_isoformat = self.last_updated.isoformat()
-        if self.last_changed == self.last_reported:
+        if last_changed_timestamp == self.last_reported_timestamp:
             last_reported_isoformat = last_changed_isoformat
         else:
             last_reported_isoformat = self.last_reported.isoformat()
@@ -1941,7 +2130,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -2282,6 +2471,38 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, new_state, attributes) tuples.
+
+        All states are written with the same timestamp. If no context is
+        passed, each state gets its own newly created context. A state_changed
+        or state_reported event is still fired for each entity.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        async_set_internal = self.async_set_internal
+        for entity_id, new_state, attributes in states:
+            async_set_internal(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                context,
+                None,
+                timestamp,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2314,23 +2535,21 @@ class StateMachine:
             same_state = False
             same_attr = False
             last_changed = None
+            last_changed_timestamp = None
         else:
+            # Keep the entity_id already held by the state machine
+            # instead of the copy lower() made
+            entity_id = old_state.entity_id
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
+            if same_state:
+                last_changed = old_state._last_changed  # noqa: SLF001
+                last_changed_timestamp = old_state.last_changed_timestamp
+            else:
+                last_changed = None
+                last_changed_timestamp = None
 
         if context is None:
             context = Context(id=ulid_at_time(timestamp))
@@ -2338,8 +2557,8 @@ class StateMachine:
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            old_state._last_reported = None  # type: ignore[union-attr] # noqa: SLF001
+            old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2365,12 +2584,14 @@ class StateMachine:
             new_state,
             attributes,
             last_changed,
-            now,
-            now,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp or timestamp,
+            timestamp,
         )
         if old_state is not None:
             old_state.expire()
@@ -216,6 +216,7 @@ class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"areas": "id"},
         )
 
     @callback
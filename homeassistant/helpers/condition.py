@@ -65,6 +65,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -177,6 +178,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool | None:
         """Trace condition."""
+        if trace_cv.get() is None:
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -254,8 +257,23 @@ async def async_from_config(
         check_factory = check_factory.func
 
     if asyncio.iscoroutinefunction(check_factory):
-        return cast(ConditionCheckerType, await factory(hass, config))
-    return cast(ConditionCheckerType, factory(config))
+        checker = cast(ConditionCheckerType, await factory(hass, config))
+    else:
+        checker = cast(ConditionCheckerType, factory(config))
+
+    if (compiled := _compile_condition(config)) is None:
+        return checker
+
+    @ft.wraps(checker)
+    def check_compiled_when_untraced(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool | None:
+        """Skip the tracing wrappers when no trace is being collected."""
+        if trace_cv.get() is None:
+            return compiled(hass, variables)
+        return checker(hass, variables)
+
+    return check_compiled_when_untraced
 
 
 async def async_and_from_config(
@@ -1016,6 +1034,263 @@ async def async_trigger_from_config(
     return trigger_if
 
 
+def _compile_condition(config: ConfigType) -> ConditionCheckerType | None:
+    """Flatten a condition tree into a checker which does not trace.
+
+    Trees of and, or, not, numeric_state, state, template, time and trigger
+    conditions are compiled. The result is None if the tree contains any
+    other condition.
+    """
+    if CONF_ENABLED in config:
+        if isinstance(enabled := config[CONF_ENABLED], Template):
+            return None
+        if not enabled:
+            return _disabled_condition
+    if (compiler := _CONDITION_COMPILERS.get(config[CONF_CONDITION])) is None:
+        return None
+    return compiler(config)
+
+
+def _compile_conditions(
+    configs: list[ConfigType],
+) -> list[ConditionCheckerType] | None:
+    """Compile a list of conditions, return None if any can't be compiled."""
+    checks: list[ConditionCheckerType] = []
+    for config in configs:
+        if (check := _compile_condition(config)) is None:
+            return None
+        checks.append(check)
+    return checks
+
+
+def _disabled_condition(
+    hass: HomeAssistant, variables: TemplateVarsType = None
+) -> bool | None:
+    """Condition not enabled, will act as if it didn't exist."""
+    return None
+
+
+def _compile_and(config: ConfigType) -> ConditionCheckerType | None:
+    """Compile an and condition."""
+    if (checks := _compile_conditions(config["conditions"])) is None:
+        return None
+    total = len(checks)
+
+    def compiled_and(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test and condition."""
+        errors = []
+        for index, check in enumerate(checks):
+            try:
+                if check(hass, variables) is False:
+                    return False
+            except ConditionError as ex:
+                errors.append(
+                    ConditionErrorIndex("and", index=index, total=total, error=ex)
+                )
+        if errors:
+            raise ConditionErrorContainer("and", errors=errors)
+        return True
+
+    return compiled_and
+
+
+def _compile_or(config: ConfigType) -> ConditionCheckerType | None:
+    """Compile an or condition."""
+    if (checks := _compile_conditions(config["conditions"])) is None:
+        return None
+    total = len(checks)
+
+    def compiled_or(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test or condition."""
+        errors = []
+        for index, check in enumerate(checks):
+            try:
+                if check(hass, variables) is True:
+                    return True
+            except ConditionError as ex:
+                errors.append(
+                    ConditionErrorIndex("or", index=index, total=total, error=ex)
+                )
+        if errors:
+            raise ConditionErrorContainer("or", errors=errors)
+        return False
+
+    return compiled_or
+
+
+def _compile_not(config: ConfigType) -> ConditionCheckerType | None:
+    """Compile a not condition."""
+    if (checks := _compile_conditions(config["conditions"])) is None:
+        return None
+    total = len(checks)
+
+    def compiled_not(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test not condition."""
+        errors = []
+        for index, check in enumerate(checks):
+            try:
+                if check(hass, variables):
+                    return False
+            except ConditionError as ex:
+                errors.append(
+                    ConditionErrorIndex("not", index=index, total=total, error=ex)
+                )
+        if errors:
+            raise ConditionErrorContainer("not", errors=errors)
+        return True
+
+    return compiled_not
+
+
+def _compile_numeric_state(config: ConfigType) -> ConditionCheckerType:
+    """Compile a numeric_state condition."""
+    entity_ids = config.get(CONF_ENTITY_ID, [])
+    attribute = config.get(CONF_ATTRIBUTE)
+    below = config.get(CONF_BELOW)
+    above = config.get(CONF_ABOVE)
+    value_template = config.get(CONF_VALUE_TEMPLATE)
+    total = len(entity_ids)
+
+    def compiled_numeric_state(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test numeric state condition."""
+        errors = []
+        for index, entity_id in enumerate(entity_ids):
+            try:
+                if not async_numeric_state(
+                    hass, entity_id, below, above, value_template, variables, attribute
+                ):
+                    return False
+            except ConditionError as ex:
+                errors.append(
+                    ConditionErrorIndex(
+                        "numeric_state", index=index, total=total, error=ex
+                    )
+                )
+        if errors:
+            raise ConditionErrorContainer("numeric_state", errors=errors)
+        return True
+
+    return compiled_numeric_state
+
+
+def _compile_state(config: ConfigType) -> ConditionCheckerType:
+    """Compile a state condition.
+
+    Conditions that compare the state to constants test membership of a
+    frozenset instead of going through state().
+    """
+    entity_ids = config.get(CONF_ENTITY_ID, [])
+    req_states: Any = config.get(CONF_STATE, [])
+    for_period = config.get(CONF_FOR)
+    attribute = config.get(CONF_ATTRIBUTE)
+    match_all = config.get(CONF_MATCH, ENTITY_MATCH_ALL) == ENTITY_MATCH_ALL
+    total = len(entity_ids)
+
+    if not isinstance(req_states, list):
+        req_states = [req_states]
+
+    wanted_states: frozenset[str] | None = None
+    if (
+        for_period is None
+        and attribute is None
+        and all(
+            isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is None
+            for req_state in req_states
+        )
+    ):
+        wanted_states = frozenset(req_states)
+
+    def compiled_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test state condition."""
+        errors = []
+        result = not match_all
+        for index, entity_id in enumerate(entity_ids):
+            try:
+                if wanted_states is None:
+                    is_state = state(
+                        hass, entity_id, req_states, for_period, attribute, variables
+                    )
+                elif (entity := hass.states.get(entity_id)) is None:
+                    raise ConditionErrorMessage("state", f"unknown entity {entity_id}")
+                else:
+                    is_state = entity.state in wanted_states
+                if is_state:
+                    result = True
+                elif match_all:
+                    return False
+            except ConditionError as ex:
+                errors.append(
+                    ConditionErrorIndex("state", index=index, total=total, error=ex)
+                )
+        if errors:
+            raise ConditionErrorContainer("state", errors=errors)
+        return result
+
+    return compiled_state
+
+
+def _compile_template(config: ConfigType) -> ConditionCheckerType:
+    """Compile a template condition."""
+    value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
+
+    def compiled_template(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test template condition."""
+        # The entities the template used are only needed for the trace
+        try:
+            value: str = value_template.async_render(variables, parse_result=False)
+        except TemplateError as ex:
+            raise ConditionErrorMessage("template", str(ex)) from ex
+        return value.lower() == "true"
+
+    return compiled_template
+
+
+def _compile_time(config: ConfigType) -> ConditionCheckerType:
+    """Compile a time condition."""
+    before = config.get(CONF_BEFORE)
+    after = config.get(CONF_AFTER)
+    weekday = config.get(CONF_WEEKDAY)
+
+    def compiled_time(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test time condition."""
+        return time(hass, before, after, weekday)
+
+    return compiled_time
+
+
+def _compile_trigger(config: ConfigType) -> ConditionCheckerType:
+    """Compile a trigger condition."""
+    trigger_id = config[CONF_ID]
+
+    def compiled_trigger(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test trigger condition."""
+        return (
+            variables is not None
+            and "trigger" in variables
+            and variables["trigger"].get("id") in trigger_id
+        )
+
+    return compiled_trigger
+
+
+_CONDITION_COMPILERS: dict[str, Callable[[ConfigType], ConditionCheckerType | None]] = {
+    "and": _compile_and,
+    "not": _compile_not,
+    "numeric_state": _compile_numeric_state,
+    "or": _compile_or,
+    "state": _compile_state,
+    "template": _compile_template,
+    "time": _compile_time,
+    "trigger": _compile_trigger,
+}
+
+
 def numeric_state_validate_config(
     hass: HomeAssistant, config: ConfigType
 ) -> ConfigType:
@@ -1090,11 +1365,16 @@ async def async_conditions_from_config(
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
         errors: list[ConditionErrorIndex] = []
+        tracing = trace_cv.get() is not None
         for index, check in enumerate(checks):
             try:
-                with trace_path(["condition", str(index)]):
-                    if check(hass, variables) is False:
-                        return False
+                if not tracing:
+                    result = check(hass, variables)
+                else:
+                    with trace_path(["condition", str(index)]):
+                        result = check(hass, variables)
+                if result is False:
+                    return False
             except ConditionError as ex:
                 errors.append(
                     ConditionErrorIndex(
@@ -639,6 +639,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
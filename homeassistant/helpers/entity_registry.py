@@ -724,6 +724,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -106,14 +106,21 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    ) = None
+    # Trackers set either filter_callable or data_key; with a data_key the
+    # tracker listens on the event bus keyed by that event data key instead
+    # of filtering every event itself
+    data_key: str | None = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -122,6 +129,7 @@ class _KeyedEventData(Generic[_TypedDictT]):
 
     listener: CALLBACK_TYPE
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    key_listeners: dict[str, CALLBACK_TYPE]
 
 
 @dataclass(slots=True)
@@ -361,21 +369,11 @@ def _async_dispatch_entity_id_event[_StateEventDataT: EventStateEventData](
             )
 
 
-@callback
-def _async_state_filter[_StateEventDataT: EventStateEventData](
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -399,7 +397,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -430,18 +428,45 @@ def _remove_listener(
     tracker: _KeyedEventTracker[_TypedDictT],
     keys: Iterable[str],
     job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+    event_data: _KeyedEventData[_TypedDictT],
 ) -> None:
     """Remove listener."""
+    callbacks = event_data.callbacks
+    key_listeners = event_data.key_listeners
     for key in keys:
         callbacks[key].remove(job)
         if not callbacks[key]:
             del callbacks[key]
+            if key in key_listeners:
+                key_listeners.pop(key)()
 
     if not callbacks:
         hass.data.pop(tracker.key).listener()
 
 
+@callback
+def _async_add_key_job(
+    hass: HomeAssistant,
+    tracker: _KeyedEventTracker[_TypedDictT],
+    event_data: _KeyedEventData[_TypedDictT],
+    key: str,
+    job: HassJob[[Event[_TypedDictT]], Any],
+) -> None:
+    """Add a job for a key and listen on the bus for the key if it is new."""
+    callbacks = event_data.callbacks
+    if (data_key := tracker.data_key) is not None and key not in callbacks:
+        event_data.key_listeners[key] = hass.bus.async_listen_keyed(
+            tracker.event_type,
+            data_key,
+            key,
+            partial(tracker.dispatcher_callable, hass, callbacks),
+        )
+    # We don't use setdefault here because this function gets
+    # called ~20000 times during startup, and we want to avoid
+    # the overhead of creating empty lists and throwing them away.
+    callbacks[key].append(job)
+
+
 # tracker, not hass is intentionally the first argument here since its
 # constant and may be used in a partial in the future
 def _async_track_event(
@@ -462,32 +487,34 @@ def _async_track_event(
     tracker_key = tracker.key
     if tracker_key in hass_data:
         event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
     else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
+        callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]] = (
+            defaultdict(list)
         )
-        event_data = _KeyedEventData(listener, callbacks)
+        if tracker.filter_callable is None:
+            # Keyed trackers listen on the bus per key as keys are added
+            listener = _remove_empty_listener
+        else:
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
+        event_data = _KeyedEventData(listener, callbacks, {})
         hass_data[tracker_key] = event_data
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
     if isinstance(keys, str):
         # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
+        # so we optimize for that case.
+        _async_add_key_job(hass, tracker, event_data, keys, job)
         keys = (keys,)
     else:
         for key in keys:
-            callbacks[key].append(job)
+            _async_add_key_job(hass, tracker, event_data, key, job)
 
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
+    return partial(_remove_listener, hass, tracker, keys, job, event_data)
 
 
 @callback
@@ -551,16 +578,6 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
@@ -585,7 +602,7 @@ _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
     key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    data_key="device_id",
 )
 
 
@@ -709,6 +726,77 @@ def async_track_state_removed_domain(
     )
 
 
+@dataclass(slots=True)
+class _TrackStateChangeBatch:
+    """Helper class to deliver state changes in batches.
+
+    State changes are collected as they are fired and delivered to the
+    action once per event loop iteration.
+    """
+
+    hass: HomeAssistant
+    job: HassJob[[list[Event[EventStateChangedData]]], Any]
+    _pending: list[Event[EventStateChangedData]]
+    _listener: CALLBACK_TYPE | None = None
+    _handle: asyncio.Handle | None = None
+
+    def async_attach(self) -> None:
+        """Attach the state change listener."""
+        self._listener = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Queue a state change and schedule delivery of the batch."""
+        self._pending.append(event)
+        if self._handle is None:
+            self._handle = self.hass.loop.call_soon(self._async_deliver)
+
+    @callback
+    def _async_deliver(self) -> None:
+        """Deliver the pending state changes."""
+        self._handle = None
+        events = self._pending
+        self._pending = []
+        self.hass.async_run_hass_job(self.job, events)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the listener and drop any pending state changes."""
+        if TYPE_CHECKING:
+            assert self._listener is not None
+        self._listener()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+
+@callback
+@bind_hass
+def async_track_state_change_batch(
+    hass: HomeAssistant,
+    action: Callable[[list[Event[EventStateChangedData]]], Any],
+    job_type: HassJobType | None = None,
+) -> CALLBACK_TYPE:
+    """Track all state changes and deliver them in batches.
+
+    Instead of calling the action for every state_changed event, the
+    events fired during one event loop iteration are collected and passed
+    to the action as a list, in the order they were fired. This is useful
+    for listeners that process many states at once, for example when an
+    integration uses StateMachine.async_set_many.
+    """
+    track = _TrackStateChangeBatch(
+        hass,
+        HassJob(action, f"track state change batch {action}", job_type=job_type),
+        [],
+    )
+    track.async_attach()
+    return track.async_cancel
+
+
 @callback
 def _async_string_to_lower_list(instr: str | Iterable[str]) -> list[str]:
     if isinstance(instr, str):
@@ -1968,11 +2056,20 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
 
     if info.filter(entity_id):
-        return True
+        # Templates that only read the state value of this entity do not
+        # need to be re-rendered when only its attributes changed.
+        return not (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+            and info.is_state_only(entity_id)
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
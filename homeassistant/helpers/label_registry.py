@@ -107,6 +107,7 @@ class LabelRegistry(BaseRegistry[LabelRegistryStoreData]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_keys={"labels": "label_id"},
         )
 
     @callback
@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -49,6 +50,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.loader import Integration, async_get_integrations, bind_hass
 from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.event_type import EventType
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
 from homeassistant.util.yaml.loader import JSON_TYPE
@@ -80,6 +82,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[_TargetIndex] = HassKey("service_target_index")
 
 
 @cache
@@ -526,9 +529,10 @@ def async_extract_referenced_entity_ids(
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
+    ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
+    index = _async_get_target_index(hass, ent_reg, dev_reg, area_reg)
 
     if selector.floor_ids:
         floor_reg = floor_registry.async_get(hass)
@@ -550,26 +554,16 @@ def async_extract_referenced_entity_ids(
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+            label_entity_ids, label_device_ids, label_area_ids = index.label_targets(
+                label_id
+            )
+            selected.indirectly_referenced.update(label_entity_ids)
+            selected.referenced_devices.update(label_device_ids)
+            selected.referenced_areas.update(label_area_ids)
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.floor_areas(floor_id))
 
     selected.referenced_areas.update(selector.area_ids)
     selected.referenced_devices.update(selector.device_ids)
@@ -578,55 +572,179 @@ def async_extract_referenced_entity_ids(
         return selected
 
     # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (entry.entity_category is None and entry.hidden_by is None)
+    for device_id in selected.referenced_devices:
+        selected.indirectly_referenced.update(index.device_entities(device_id))
+
+    # Find devices for targeted areas and add indirectly referenced by area
+    for area_id in selected.referenced_areas:
+        area_device_ids, area_entity_ids = index.area_targets(area_id)
+        selected.referenced_devices.update(area_device_ids)
+        selected.indirectly_referenced.update(area_entity_ids)
+
+    return selected
+
+
+def _is_indirect_target(entry: entity_registry.RegistryEntry) -> bool:
+    """Return if an entity is targeted through its device, area or labels."""
+    # Do not add entities which are hidden or which are config
+    # or diagnostic entities.
+    return entry.entity_category is None and entry.hidden_by is None
+
+
+class _TargetIndex:
+    """Index what device, area, floor and label targets expand to.
+
+    The expansion of a target is built from the registries on first use
+    and kept until one of the registries changes, so resolving the targets
+    of a service call is a few dict lookups.
+    """
+
+    __slots__ = (
+        "_area_reg",
+        "_area_targets",
+        "_dev_reg",
+        "_device_entities",
+        "_ent_reg",
+        "_floor_areas",
+        "_label_targets",
     )
 
-    # Find devices for targeted areas
-    referenced_devices_by_area: set[str] = set()
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            referenced_devices_by_area.update(
+    def __init__(
+        self,
+        ent_reg: entity_registry.EntityRegistry,
+        dev_reg: device_registry.DeviceRegistry,
+        area_reg: area_registry.AreaRegistry,
+    ) -> None:
+        """Initialize the index."""
+        self._ent_reg = ent_reg
+        self._dev_reg = dev_reg
+        self._area_reg = area_reg
+        self._device_entities: dict[str, tuple[str, ...]] = {}
+        self._area_targets: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._floor_areas: dict[str, tuple[str, ...]] = {}
+        self._label_targets: dict[
+            str, tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]
+        ] = {}
+
+    @callback
+    def async_use_registries(
+        self,
+        ent_reg: entity_registry.EntityRegistry,
+        dev_reg: device_registry.DeviceRegistry,
+        area_reg: area_registry.AreaRegistry,
+    ) -> None:
+        """Clear the index if the registries were replaced."""
+        if (
+            self._ent_reg is not ent_reg
+            or self._dev_reg is not dev_reg
+            or self._area_reg is not area_reg
+        ):
+            self._ent_reg = ent_reg
+            self._dev_reg = dev_reg
+            self._area_reg = area_reg
+            self.async_clear()
+
+    @callback
+    def async_clear(self, _event: Event[Any] | None = None) -> None:
+        """Clear the index."""
+        self._device_entities.clear()
+        self._area_targets.clear()
+        self._floor_areas.clear()
+        self._label_targets.clear()
+
+    def device_entities(self, device_id: str) -> tuple[str, ...]:
+        """Return the entities targeted by a device."""
+        if (entity_ids := self._device_entities.get(device_id)) is None:
+            entity_ids = self._device_entities[device_id] = tuple(
+                entry.entity_id
+                for entry in self._ent_reg.entities.get_entries_for_device_id(device_id)
+                if _is_indirect_target(entry)
+            )
+        return entity_ids
+
+    def area_targets(self, area_id: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the devices and entities targeted by an area."""
+        if (targets := self._area_targets.get(area_id)) is None:
+            entities = self._ent_reg.entities
+            device_ids = tuple(
                 device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+                for device_entry in self._dev_reg.devices.get_devices_for_area_id(
+                    area_id
+                )
             )
-    selected.referenced_devices.update(referenced_devices_by_area)
-
-    # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
-    # Add indirectly referenced by area through device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in referenced_devices_by_area
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
+            entity_ids = [
+                entry.entity_id
+                # The entity's area matches a targeted area
+                for entry in entities.get_entries_for_area_id(area_id)
+                if _is_indirect_target(entry)
+            ]
+            entity_ids.extend(
+                entry.entity_id
+                for device_id in device_ids
+                for entry in entities.get_entries_for_device_id(device_id)
+                # The entity's device is in the area and the entity
                 # has no explicitly set area
-                not entry.area_id
+                if _is_indirect_target(entry) and not entry.area_id
             )
-        )
-    )
+            targets = self._area_targets[area_id] = (device_ids, tuple(entity_ids))
+        return targets
+
+    def floor_areas(self, floor_id: str) -> tuple[str, ...]:
+        """Return the areas targeted by a floor."""
+        if (area_ids := self._floor_areas.get(floor_id)) is None:
+            area_ids = self._floor_areas[floor_id] = tuple(
+                area_entry.id
+                for area_entry in self._area_reg.areas.get_areas_for_floor(floor_id)
+            )
+        return area_ids
+
+    def label_targets(
+        self, label_id: str
+    ) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+        """Return the entities, devices and areas targeted by a label."""
+        if (targets := self._label_targets.get(label_id)) is None:
+            targets = self._label_targets[label_id] = (
+                tuple(
+                    entry.entity_id
+                    for entry in self._ent_reg.entities.get_entries_for_label(label_id)
+                    if _is_indirect_target(entry)
+                ),
+                tuple(
+                    device_entry.id
+                    for device_entry in self._dev_reg.devices.get_devices_for_label(
+                        label_id
+                    )
+                ),
+                tuple(
+                    area_entry.id
+                    for area_entry in self._area_reg.areas.get_areas_for_label(label_id)
+                ),
+            )
+        return targets
 
-    return selected
+
+@callback
+def _async_get_target_index(
+    hass: HomeAssistant,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+) -> _TargetIndex:
+    """Return the target index, creating it on first use."""
+    if (index := hass.data.get(TARGET_INDEX)) is not None:
+        index.async_use_registries(ent_reg, dev_reg, area_reg)
+        return index
+    index = hass.data[TARGET_INDEX] = _TargetIndex(ent_reg, dev_reg, area_reg)
+    event_type: EventType[Any]
+    for event_type in (
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+        label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, index.async_clear)
+    return index
 
 
 @bind_hass
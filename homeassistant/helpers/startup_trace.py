@@ -0,0 +1,261 @@
+"""Record where time is spent while Home Assistant starts.
+
+When enabled, bootstrap records a span for every integration import,
+requirements check, wait on dependencies and setup phase. The spans are
+exported as a Chrome trace (viewable in chrome://tracing or Perfetto)
+and summarized as the chain of integrations that serialized startup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import logging
+from operator import attrgetter
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+STARTUP_TRACE_FILE = "startup_trace.json"
+
+CATEGORY_IMPORT = "import"
+CATEGORY_REQUIREMENTS = "requirements"
+CATEGORY_WAIT_DEPENDENCIES = "wait_dependencies"
+
+
+@dataclass(slots=True, frozen=True)
+class StartupSpan:
+    """A timed step of setting up an integration."""
+
+    domain: str
+    category: str
+    start: float
+    end: float
+    group: str | None = None
+    dependencies: tuple[str, ...] = ()
+    thread_id: int = 0
+
+    @property
+    def duration(self) -> float:
+        """Return the duration of the span in seconds."""
+        return self.end - self.start
+
+
+@dataclass(slots=True)
+class CriticalPathEntry:
+    """An integration on the startup critical path."""
+
+    domain: str
+    start: float
+    end: float
+    durations: dict[str, float] = field(default_factory=dict)
+
+
+class StartupTrace:
+    """Collect startup spans."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.started = time.monotonic()
+        self.spans: list[StartupSpan] = []
+
+    def add(
+        self,
+        domain: str,
+        category: str,
+        start: float,
+        end: float,
+        group: str | None = None,
+        dependencies: Iterable[str] = (),
+    ) -> None:
+        """Add a span.
+
+        This method is thread-safe as imports are timed in the executor.
+        """
+        self.spans.append(
+            StartupSpan(
+                domain,
+                category,
+                start,
+                end,
+                group,
+                tuple(dependencies),
+                threading.get_ident(),
+            )
+        )
+
+    @contextmanager
+    def span(
+        self,
+        domain: str,
+        category: str,
+        group: str | None = None,
+        dependencies: Iterable[str] = (),
+    ) -> Generator[None]:
+        """Time the body of the context manager as a span."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(domain, category, start, time.monotonic(), group, dependencies)
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Each integration (and each config entry or platform group) gets its
+        own row so concurrent setups do not overlap.
+        """
+        rows: dict[tuple[str, str | None], int] = {}
+        events: list[dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            row = (span.domain, span.group)
+            if (tid := rows.get(row)) is None:
+                tid = rows[row] = len(rows) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {
+                            "name": span.domain
+                            if span.group is None
+                            else f"{span.domain} ({span.group})"
+                        },
+                    }
+                )
+            args: dict[str, Any] = {"domain": span.domain, "thread": span.thread_id}
+            if span.dependencies:
+                args["dependencies"] = list(span.dependencies)
+            events.append(
+                {
+                    "name": f"{span.domain} {span.category}",
+                    "cat": span.category,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round((span.start - self.started) * 1_000_000),
+                    "dur": round(span.duration * 1_000_000),
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def critical_path(self) -> list[CriticalPathEntry]:
+        """Return the chain of integrations that determined startup time.
+
+        Starting from the integration that finished last, follow the
+        dependency it waited on that finished last until an integration
+        did not wait on anything.
+        """
+        entries: dict[str, CriticalPathEntry] = {}
+        waited_on: dict[str, set[str]] = {}
+        for span in self.spans:
+            if (entry := entries.get(span.domain)) is None:
+                entry = entries[span.domain] = CriticalPathEntry(
+                    span.domain, span.start, span.end
+                )
+            else:
+                entry.start = min(entry.start, span.start)
+                entry.end = max(entry.end, span.end)
+            # Groups (config entries/platforms) run in parallel so only
+            # the longest one counts.
+            entry.durations[span.category] = max(
+                entry.durations.get(span.category, 0), span.duration
+            )
+            if span.dependencies:
+                waited_on.setdefault(span.domain, set()).update(span.dependencies)
+
+        if not entries:
+            return []
+
+        current = max(entries.values(), key=attrgetter("end"))
+        path = [current]
+        seen = {current.domain}
+        while dependencies := [
+            entries[dep]
+            for dep in waited_on.get(current.domain, ())
+            if dep in entries and dep not in seen
+        ]:
+            current = max(dependencies, key=attrgetter("end"))
+            path.append(current)
+            seen.add(current.domain)
+        path.reverse()
+        return path
+
+    def format_critical_path(self) -> str:
+        """Return a human readable summary of the critical path."""
+        lines = []
+        for entry in self.critical_path():
+            phases = ", ".join(
+                f"{category}={duration:.2f}s"
+                for category, duration in sorted(
+                    entry.durations.items(), key=lambda item: item[1], reverse=True
+                )
+            )
+            lines.append(
+                f"{entry.domain}: {entry.start - self.started:.2f}s"
+                f" -> {entry.end - self.started:.2f}s ({phases})"
+            )
+        return "\n".join(lines)
+
+
+@callback
+def async_enable(hass: HomeAssistant) -> StartupTrace:
+    """Start recording a startup trace."""
+    trace = hass.data[DATA_STARTUP_TRACE] = StartupTrace()
+    return trace
+
+
+@callback
+def async_get_startup_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace if recording is enabled."""
+    return hass.data.get(DATA_STARTUP_TRACE)
+
+
+@contextmanager
+def async_trace_span(
+    hass: HomeAssistant,
+    domain: str,
+    category: str,
+    group: str | None = None,
+    dependencies: Iterable[str] = (),
+) -> Generator[None]:
+    """Time a startup step when recording is enabled."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None:
+        yield
+        return
+    with trace.span(domain, category, group, dependencies):
+        yield
+
+
+def _write_trace(path: str, trace: StartupTrace) -> None:
+    """Serialize the trace and write it to disk."""
+    write_utf8_file(path, json.dumps(trace.as_chrome_trace()))
+
+
+async def async_finish(hass: HomeAssistant) -> None:
+    """Stop recording and write the trace to the config directory."""
+    if (trace := hass.data.pop(DATA_STARTUP_TRACE, None)) is None:
+        return
+    path = hass.config.path(STARTUP_TRACE_FILE)
+    try:
+        await hass.async_add_executor_job(_write_trace, path, trace)
+    except (OSError, WriteError) as err:
+        _LOGGER.error("Error writing startup trace to %s: %s", path, err)
+        return
+    _LOGGER.info(
+        "Startup trace written to %s, critical path:\n%s",
+        path,
+        trace.format_critical_path(),
+    )
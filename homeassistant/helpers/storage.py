@@ -34,6 +34,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -49,6 +50,10 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Compact the journal into the file after this many appended changes
+JOURNAL_MAX_ENTRIES = 500
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -227,6 +232,242 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class _Journal:
+    """Append the changed records of a store to a journal.
+
+    Stores that keep their records in lists (such as the entries of a
+    registry) map each list to the field that identifies a record. A
+    write that only changes records appends the changed and removed
+    records as a line to the journal instead of rewriting the file.
+
+    The first write of a run, a write that changes anything besides the
+    records and a journal that grew too large write the full file with a
+    new journal id which discards the journal. Lines with another
+    journal id are ignored when loading, so a crash between writing the
+    file and removing the journal does not replay stale changes.
+    """
+
+    __slots__ = (
+        "_base_size",
+        "_entries",
+        "_envelope",
+        "_id",
+        "_record_keys",
+        "_records",
+        "_size",
+        "keys",
+    )
+
+    def __init__(self, keys: Mapping[str, str]) -> None:
+        """Initialize the journal."""
+        self.keys = keys
+        self._id: str | None = None
+        self._envelope = b""
+        # The records that were last written and the key of each record
+        self._records: dict[str, dict[Any, json_helper.json_fragment]] = {}
+        self._record_keys: dict[int, Any] = {}
+        self._entries = 0
+        self._size = 0
+        self._base_size = 0
+
+    def reset(self) -> None:
+        """Forget what was written so the next write is a full write."""
+        self._id = None
+        self._records = {}
+        self._record_keys = {}
+
+    @property
+    def has_entries(self) -> bool:
+        """Return if changes were appended since the file was last written."""
+        return self._id is not None and self._entries > 0
+
+    def _diff(
+        self, stored: dict[str, Any]
+    ) -> tuple[
+        dict[str, dict[Any, json_helper.json_fragment]],
+        dict[int, Any],
+        dict[str, list[json_helper.json_fragment]],
+        dict[str, list[Any]],
+    ]:
+        """Return the records of the data and the changes since the last write."""
+        json_bytes = json_helper.json_bytes
+        records: dict[str, dict[Any, json_helper.json_fragment]] = {}
+        record_keys: dict[int, Any] = {}
+        upsert: dict[str, list[json_helper.json_fragment]] = {}
+        remove: dict[str, list[Any]] = {}
+        for collection, key in self.keys.items():
+            previous = self._records.get(collection, {})
+            current = records[collection] = {}
+            changed: list[json_helper.json_fragment] = []
+            for record in stored.get(collection, ()):
+                # Registries cache the fragment of an entry so an unchanged
+                # entry passes the same object
+                if (
+                    record_key := self._record_keys.get(id(record))
+                ) is not None and previous.get(record_key) is record:
+                    current[record_key] = record
+                    record_keys[id(record)] = record_key
+                    continue
+                if isinstance(record, json_helper.json_fragment):
+                    fragment = record
+                    record_key = json_util.json_loads_object(json_bytes(record))[key]
+                else:
+                    fragment = json_helper.json_fragment(json_bytes(record))
+                    record_key = record[key]
+                current[record_key] = fragment
+                record_keys[id(fragment)] = record_key
+                if (old := previous.get(record_key)) is None or json_bytes(
+                    old
+                ) != json_bytes(fragment):
+                    changed.append(fragment)
+            if changed:
+                upsert[collection] = changed
+            if removed := [
+                record_key for record_key in previous if record_key not in current
+            ]:
+                remove[collection] = removed
+        return records, record_keys, upsert, remove
+
+    def write(
+        self,
+        path: str,
+        data: dict[str, Any],
+        private: bool,
+        sync: bool,
+        save: Callable[[str, dict[str, Any]], None],
+    ) -> None:
+        """Append the changes to the journal or save the data."""
+        stored = data["data"]
+        envelope = json_helper.json_bytes(
+            {
+                **data,
+                "data": {
+                    key: value for key, value in stored.items() if key not in self.keys
+                },
+            }
+        )
+        records, record_keys, upsert, remove = self._diff(stored)
+        if (
+            self._id is not None
+            and envelope == self._envelope
+            and self._entries < JOURNAL_MAX_ENTRIES
+            and self._size < self._base_size
+        ):
+            if not upsert and not remove:
+                self._records = records
+                self._record_keys = record_keys
+                return
+            line = (
+                json_helper.json_bytes(
+                    {"journal": self._id, "upsert": upsert, "remove": remove}
+                )
+                + b"\n"
+            )
+            try:
+                self._append(f"{path}{JOURNAL_SUFFIX}", line, private, sync)
+            except OSError as err:
+                _LOGGER.warning(
+                    "Error appending to the journal of %s, writing the full file: %s",
+                    path,
+                    err,
+                )
+            else:
+                self._entries += 1
+                self._size += len(line)
+                self._records = records
+                self._record_keys = record_keys
+                return
+
+        self._write_full(path, data, save)
+        self._envelope = envelope
+        self._records = records
+        self._record_keys = record_keys
+
+    def compact(self, path: str, save: Callable[[str, dict[str, Any]], None]) -> None:
+        """Write the full file from the last written data and discard the journal.
+
+        Versions which do not read the journal only see the file, so it
+        is compacted before stopping.
+        """
+        if not self.has_entries:
+            return
+        data: dict[str, Any] = json_util.json_loads_object(self._envelope)
+        data["data"] = {
+            **data["data"],
+            **{
+                collection: list(records.values())
+                for collection, records in self._records.items()
+            },
+        }
+        self._write_full(path, data, save)
+
+    def _write_full(
+        self,
+        path: str,
+        data: dict[str, Any],
+        save: Callable[[str, dict[str, Any]], None],
+    ) -> None:
+        """Write the full file with a new journal id and discard the journal."""
+        self._id = None
+        journal_id = ulid_now()
+        save(path, {**data, "journal": journal_id})
+        try:
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}{JOURNAL_SUFFIX}")
+            self._base_size = os.path.getsize(path)
+        except OSError as err:
+            raise WriteError(err) from err
+        self._id = journal_id
+        self._entries = 0
+        self._size = 0
+
+    def _append(self, path: str, line: bytes, private: bool, sync: bool) -> None:
+        """Append a line to the journal."""
+        mode = 0o600 if private else 0o644
+        with open(
+            path, "ab", opener=lambda file, flags: os.open(file, flags, mode)
+        ) as journal:
+            journal.write(line)
+            if sync:
+                journal.flush()
+                os.fsync(journal.fileno())
+
+    def replay(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the changes in the journal to data loaded from the file."""
+        try:
+            with open(f"{path}{JOURNAL_SUFFIX}", "rb") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return
+        journal_id = data["journal"]
+        stored = data["data"]
+        collections = {
+            collection: {record[key]: record for record in stored.get(collection, ())}
+            for collection, key in self.keys.items()
+        }
+        for line in lines:
+            try:
+                entry: dict[str, Any] = json_util.json_loads_object(line)
+            except (*json_util.JSON_DECODE_EXCEPTIONS, ValueError):
+                # An unclean shutdown can leave an incomplete last line
+                _LOGGER.warning("Ignoring incomplete journal entry for %s", path)
+                break
+            if entry.get("journal") != journal_id:
+                continue
+            for collection, upserted in entry["upsert"].items():
+                if (records := collections.get(collection)) is not None:
+                    key = self.keys[collection]
+                    for record in upserted:
+                        records[record[key]] = record
+            for collection, removed in entry["remove"].items():
+                if (records := collections.get(collection)) is not None:
+                    for record_key in removed:
+                        records.pop(record_key, None)
+        for collection, records in collections.items():
+            if collection in stored or records:
+                stored[collection] = list(records.values())
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -242,8 +483,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        journal_keys maps lists of records in the data to the field that
+        identifies a record. Changes to those records are appended to a
+        journal instead of rewriting the file.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +506,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _Journal(journal_keys) if journal_keys else None
 
     @cached_property
     def path(self):
@@ -388,6 +636,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._journal is not None and "journal" in data:
+            await self.hass.async_add_executor_job(
+                self._journal.replay, self.path, data
+            )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -519,6 +772,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journal is not None:
+            await self._async_compact_journal()
+            self._async_cleanup_final_write_listener()
+
+    async def _async_compact_journal(self) -> None:
+        """Fold the journal into the file."""
+        assert self._journal is not None
+        async with self._write_lock:
+            try:
+                await self.hass.async_add_executor_job(
+                    self._journal.compact, self.path, self._save_json
+                )
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -542,6 +809,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.has_entries:
+                # Compact the journal when Home Assistant stops
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -553,6 +824,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             data["data"] = data.pop("data_func")()
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if self._journal is not None and isinstance(data["data"], dict):
+            self._journal.write(
+                path, data, self._private, self._atomic_writes, self._save_json
+            )
+            return
+        self._save_json(path, data)
+
+    def _save_json(self, path: str, data: dict) -> None:
+        """Write the data to the file."""
         json_helper.save_json(
             path,
             data,
@@ -573,3 +853,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal is not None:
+            self._journal.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
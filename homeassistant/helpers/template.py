@@ -12,10 +12,14 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+import importlib.util
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -54,13 +58,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -78,6 +85,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -114,6 +122,11 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+BYTECODE_CACHE_FILE = "core.template_bytecode"
+# Bump when the layout of the bytecode cache file changes
+BYTECODE_CACHE_VERSION = 2
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -392,6 +405,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entities_iterated",
+        "entities_state_only",
         "exception",
         "filter",
         "filter_lifecycle",
@@ -415,6 +430,12 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities where only the state value was read, attribute
+        # changes alone do not require a re-render.
+        self.entities_state_only: collections.abc.Set[str] = set()
+        # Entities where more than the state value was read while
+        # iterating all states or a domain.
+        self.entities_iterated: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -427,6 +448,8 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entities_state_only={self.entities_state_only}"
+            f" entities_iterated={self.entities_iterated}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -457,6 +480,23 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def is_state_only(self, entity_id: str) -> bool:
+        """Return if only the state value of the entity was read.
+
+        A change of only the attributes of such an entity does not
+        require a re-render.
+        """
+        if entity_id in self.entities_state_only:
+            return True
+        if (
+            self.exception
+            or entity_id in self.entities
+            or entity_id in self.entities_iterated
+        ):
+            return False
+        # The entity was iterated over as part of all states or its domain
+        return self.all_states or split_entity_id(entity_id)[0] in self.domains
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -472,6 +512,19 @@ class RenderInfo:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        self.entities_iterated = iterated = frozenset(self.entities_iterated)
+        if not (state_only := self.entities_state_only):
+            self.entities_state_only = frozenset()
+            return
+        # An entity only counts as state only if nothing else about it
+        # was read, either directly or while iterating all states or its domain.
+        entities = self.entities
+        self.entities = entities.union(state_only)
+        self.entities_state_only = frozenset(
+            entity_id
+            for entity_id in state_only
+            if entity_id not in entities and entity_id not in iterated
+        )
 
     def _freeze(self) -> None:
         self._freeze_sets()
@@ -483,6 +536,7 @@ class RenderInfo:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
         if self.exception:
+            self.entities_state_only = frozenset()
             return
 
         if not self.all_states_lifecycle:
@@ -1052,17 +1106,32 @@ class TemplateStateBase(State):
         self._cache: dict[str, Any] = {}
 
     def _collect_state(self) -> None:
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            else:
+                render_info.entities_iterated.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_state_only(self) -> None:
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
+        if item == "state":
+            # _collect_state_only inlined here for performance
+            if self._collect and (render_info := _render_info.get()):
+                render_info.entities_state_only.add(self._entity_id)  # type: ignore[attr-defined]
+            return self._state.state
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                else:
+                    render_info.entities_iterated.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1081,7 +1150,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_only()
         return self._state.state
 
     @property
@@ -1090,24 +1159,42 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.attributes
 
-    @property
-    def last_changed(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_changed(self) -> datetime:
         """Wrap State.last_changed."""
         self._collect_state()
         return self._state.last_changed
 
-    @property
-    def last_reported(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_reported(self) -> datetime:
         """Wrap State.last_reported."""
         self._collect_state()
         return self._state.last_reported
 
-    @property
-    def last_updated(self) -> datetime:  # type: ignore[override]
+    @property  # type: ignore[misc]
+    def last_updated(self) -> datetime:
         """Wrap State.last_updated."""
         self._collect_state()
         return self._state.last_updated
 
+    @property
+    def last_changed_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state()
+        return self._state.last_changed_timestamp
+
+    @property
+    def last_reported_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_reported_timestamp."""
+        self._collect_state()
+        return self._state.last_reported_timestamp
+
+    @property
+    def last_updated_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_updated_timestamp."""
+        self._collect_state()
+        return self._state.last_updated_timestamp
+
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
@@ -1132,6 +1219,11 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.name
 
+    def as_dict(self) -> ReadOnlyDict[str, datetime | collections.abc.Collection[Any]]:
+        """Wrap State.as_dict."""
+        self._collect_state()
+        return self._state.as_dict()
+
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
@@ -1174,6 +1266,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -2829,6 +2922,124 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+class TemplateBytecodeCache:
+    """Persist compiled template code across restarts.
+
+    Code objects are keyed by the environment flavor and a hash of the
+    template source. The whole cache is discarded when Home Assistant,
+    Jinja or the Python build changes, or when the checksum of the
+    entries does not match. Only templates compiled or used during the
+    current run are written back, which drops stale entries.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the bytecode cache."""
+        self.path = path
+        # Entries loaded from disk move to _used once a template uses them
+        self._stored: dict[str, bytes] = {}
+        self._used: dict[str, bytes] = {}
+        self._dirty = False
+
+    @staticmethod
+    def _header() -> tuple[int, str, str, str, bytes]:
+        """Return the header that must match for the cache to be used."""
+        return (
+            BYTECODE_CACHE_VERSION,
+            __version__,
+            jinja2.__version__,
+            sys.version,
+            importlib.util.MAGIC_NUMBER,
+        )
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the cached code for a key."""
+        if (data := self._used.get(key)) is None:
+            if (data := self._stored.pop(key, None)) is None:
+                return None
+            self._used[key] = data
+        try:
+            code = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            del self._used[key]
+            return None
+        return code  # type: ignore[no-any-return]
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the code for a key."""
+        self._used[key] = marshal.dumps(code)
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the cache from disk."""
+        try:
+            with open(self.path, "rb") as file:
+                header, checksum, payload = marshal.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding unreadable template bytecode cache: %s", err)
+            return
+        if header != self._header():
+            _LOGGER.debug("Discarding outdated template bytecode cache")
+            return
+        # The entries hold code objects, which can crash the interpreter
+        # when they are corrupt, so only trust them if the checksum matches
+        if (
+            not isinstance(payload, bytes)
+            or hashlib.sha256(payload).digest() != checksum
+        ):
+            _LOGGER.debug("Discarding corrupt template bytecode cache")
+            return
+        try:
+            entries = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding unreadable template bytecode cache: %s", err)
+            return
+        if isinstance(entries, dict):
+            self._stored = entries
+
+    @callback
+    def async_snapshot(self) -> dict[str, bytes] | None:
+        """Return the entries to save or None if nothing was compiled."""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return dict(self._used)
+
+    def save(self, entries: dict[str, bytes]) -> None:
+        """Write a snapshot of the entries to disk."""
+        payload = marshal.dumps(entries)
+        data = marshal.dumps(
+            (self._header(), hashlib.sha256(payload).digest(), payload)
+        )
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.error("Error saving template bytecode cache: %s", err)
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the persistent template bytecode cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from .storage import STORAGE_DIR
+
+    bytecode_cache = TemplateBytecodeCache(
+        hass.config.path(STORAGE_DIR, BYTECODE_CACHE_FILE)
+    )
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    async def _async_save(_: Event) -> None:
+        if (entries := bytecode_cache.async_snapshot()) is not None:
+            await hass.async_add_executor_job(bytecode_cache.save, entries)
+
+    # Most templates are compiled during startup, save them once it is done
+    # so an unclean shutdown still benefits the next start.
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save)
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2875,6 +3086,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # Limited and strict environments compile the same source differently
+        self._bytecode_cache_prefix = f"{int(bool(limited))}{int(bool(strict))}:"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3230,7 +3443,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            isinstance(source, str)
+            and self.hass is not None
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            key = f"{self._bytecode_cache_prefix}{hashlib.sha256(source.encode()).hexdigest()}"
+            if (compiled := bytecode_cache.get(key)) is None:
+                compiled = super().compile(source)
+                bytecode_cache.set(key, compiled)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
@@ -157,7 +157,12 @@ def trace_stack_top[_T](trace_stack_var: ContextVar[list[_T] | None]) -> _T | No
 
 
 def trace_path_push(suffix: str | list[str]) -> int:
-    """Go deeper in the config tree."""
+    """Go deeper in the config tree.
+
+    The path is only tracked while a trace is collected.
+    """
+    if trace_cv.get() is None:
+        return 0
     if isinstance(suffix, str):
         suffix = [suffix]
     for node in suffix:
@@ -184,8 +189,7 @@ def trace_append_element(
 ) -> None:
     """Append a TraceElement to trace[path]."""
     if (trace := trace_cv.get()) is None:
-        trace = {}
-        trace_cv.set(trace)
+        return
     if (path := trace_element.path) not in trace:
         trace[path] = deque(maxlen=maxlen)
     trace[path].append(trace_element)
@@ -207,6 +211,16 @@ def trace_clear() -> None:
     script_execution_cv.set(StopReason())
 
 
+def trace_disable() -> None:
+    """Stop collecting a trace in the current context."""
+    trace_cv.set(None)
+    trace_stack_cv.set(None)
+    trace_path_stack_cv.set(None)
+    variables_cv.set(None)
+    trace_id_cv.set(None)
+    script_execution_cv.set(None)
+
+
 def trace_set_child_id(child_key: str, child_run_id: str) -> None:
     """Set child trace_id of TraceElement at the top of the stack."""
     if node := trace_stack_top(trace_stack_cv):
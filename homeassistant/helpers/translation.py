@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Mapping
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import pathlib
 import string
@@ -138,10 +138,20 @@ class _TranslationsCacheData:
     This class contains data that is designed to be shared
     between multiple instances of the translation cache so
     we only have to load the data once.
+
+    Loaded translations are kept in pending, unflattened and keyed by
+    language, category and component, until the category is requested.
+    Most categories are never requested, so flattening them on load
+    would only cost time and memory. Each layer is a resource of a
+    translation file; the English layer comes first and other languages
+    are overlaid on top of it.
     """
 
     loaded: dict[str, set[str]]
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
+    pending: dict[str, dict[str, dict[str, list[dict[str, Any] | str]]]] = field(
+        default_factory=dict
+    )
 
 
 class _TranslationCache:
@@ -196,6 +206,12 @@ class _TranslationCache:
         components: set[str],
     ) -> dict[str, str]:
         """Read resources from the cache."""
+        if (
+            pending_category := self.cache_data.pending.get(language, {}).get(category)
+        ) and (components_to_build := components.intersection(pending_category)):
+            self._build_component_cache(
+                language, category, components_to_build, pending_category
+            )
         category_cache = self.cache_data.cache.get(language, {}).get(category, {})
         # If only one component was requested, return it directly
         # to avoid merging the dictionaries and keeping additional
@@ -306,9 +322,8 @@ class _TranslationCache:
         components: set[str],
         translation_strings: dict[str, dict[str, Any]],
     ) -> None:
-        """Extract resources into the cache."""
-        resource: dict[str, Any] | str
-        cached = self.cache_data.cache.setdefault(language, {})
+        """Queue resources to be flattened when their category is requested."""
+        pending = self.cache_data.pending.setdefault(language, {})
         categories = {
             category
             for component in translation_strings.values()
@@ -317,11 +332,28 @@ class _TranslationCache:
 
         for category in categories:
             new_resources = build_resources(translation_strings, components, category)
-            category_cache = cached.setdefault(category, {})
+            pending_category = pending.setdefault(category, {})
 
             for component, resource in new_resources.items():
-                component_cache = category_cache.setdefault(component, {})
+                pending_category.setdefault(component, []).append(resource)
+
+    @callback
+    def _build_component_cache(
+        self,
+        language: str,
+        category: str,
+        components: set[str],
+        pending_category: dict[str, list[dict[str, Any] | str]],
+    ) -> None:
+        """Flatten the pending resources of a category into the cache."""
+        category_cache = self.cache_data.cache.setdefault(language, {}).setdefault(
+            category, {}
+        )
+
+        for component in components:
+            component_cache = category_cache.setdefault(component, {})
 
+            for resource in pending_category.pop(component):
                 if not isinstance(resource, dict):
                     component_cache[f"component.{component}.{category}"] = resource
                     continue
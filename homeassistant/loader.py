@@ -8,14 +8,17 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
+from graphlib import CycleError, TopologicalSorter
 import importlib
 import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +32,7 @@ from propcache.api import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__ as HA_VERSION
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -40,6 +43,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_trace import CATEGORY_IMPORT, async_get_startup_trace
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -49,6 +53,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -133,6 +138,16 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_INDEX: HassKey[ManifestIndex | asyncio.Future[ManifestIndex]] = HassKey(
+    "manifest_index"
+)
+DATA_MANIFEST_INDEX_STORE: HassKey[Store[dict[str, Any]]] = HassKey(
+    "manifest_index_store"
+)
+DATA_PRE_IMPORT_WORKERS: HassKey[int] = HassKey("pre_import_workers")
+MANIFEST_INDEX_STORAGE_KEY = "core.integration_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+MANIFEST_INDEX_SAVE_DELAY = 30
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -284,7 +299,153 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
-def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
+class ManifestIndex:
+    """Persisted index of resolved integration manifests.
+
+    Resolving an integration reads its manifest.json and lists its
+    directory. The index keeps the result keyed by directory so the
+    next start only has to stat the directory to know it is current:
+
+    - Integrations are trusted while the Home Assistant version and
+      the mtimes of the directory and manifest.json are unchanged. The
+      manifest.json mtime is needed as it can be edited in place, for
+      example by a git checkout on a development install.
+    - The list of custom integration directories is reused while the
+      custom_components directory mtime is unchanged.
+
+    This class is thread-safe as integrations are resolved in the executor.
+    """
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the index."""
+        if data is None or data.get("ha_version") != HA_VERSION:
+            data = {}
+        self._integrations: dict[str, dict[str, dict[str, Any]]] = data.get(
+            "integrations", {}
+        )
+        self._custom_dirs: dict[str, dict[str, Any]] = data.get("custom_dirs", {})
+        self._lock = threading.Lock()
+        self.dirty = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the index as a dict to store."""
+        with self._lock:
+            self.dirty = False
+            return {
+                "ha_version": HA_VERSION,
+                "integrations": {
+                    base: dict(entries) for base, entries in self._integrations.items()
+                },
+                "custom_dirs": dict(self._custom_dirs),
+            }
+
+    def get_integration(
+        self, base: str, domain: str
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an integration."""
+        if (entry := self._integrations.get(base, {}).get(domain)) is None:
+            return None
+        file_path = os.path.join(base, domain)
+        try:
+            if (
+                os.stat(file_path).st_mtime_ns != entry["mtime_ns"]
+                or os.stat(os.path.join(file_path, "manifest.json")).st_mtime_ns
+                != entry["manifest_mtime_ns"]
+            ):
+                return None
+        except OSError:
+            return None
+        files = entry["files"]
+        return cast(Manifest, dict(entry["manifest"])), (
+            None if files is None else set(files)
+        )
+
+    def set_integration(
+        self,
+        base: str,
+        domain: str,
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Store the manifest and top level files of an integration."""
+        file_path = os.path.join(base, domain)
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            manifest_mtime_ns = os.stat(
+                os.path.join(file_path, "manifest.json")
+            ).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            self._integrations.setdefault(base, {})[domain] = {
+                "mtime_ns": mtime_ns,
+                "manifest_mtime_ns": manifest_mtime_ns,
+                # Copy as the integration adds keys to its manifest
+                "manifest": dict(manifest),
+                "files": None if top_level_files is None else sorted(top_level_files),
+            }
+            self.dirty = True
+
+    def get_custom_dirs(self, path: str) -> list[str]:
+        """Return the integration directories in a custom components path."""
+        mtime_ns = os.stat(path).st_mtime_ns
+        if (entry := self._custom_dirs.get(path)) is not None and entry[
+            "mtime_ns"
+        ] == mtime_ns:
+            return list(entry["dirs"])
+        dirs = [entry.name for entry in pathlib.Path(path).iterdir() if entry.is_dir()]
+        with self._lock:
+            self._custom_dirs[path] = {"mtime_ns": mtime_ns, "dirs": dirs}
+            self.dirty = True
+        return dirs
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> ManifestIndex:
+    """Return the manifest index, loading it from storage if needed."""
+    index_or_future = hass.data.get(DATA_MANIFEST_INDEX)
+    if isinstance(index_or_future, ManifestIndex):
+        return index_or_future
+    if index_or_future is not None:
+        return await index_or_future
+
+    future = hass.data[DATA_MANIFEST_INDEX] = hass.loop.create_future()
+    try:
+        data = await _async_get_manifest_index_store(hass).async_load()
+    except Exception:
+        # The index is only a cache, never let it block resolving integrations
+        _LOGGER.exception("Error loading the integration index, rebuilding it")
+        data = None
+    index = ManifestIndex(data)
+    hass.data[DATA_MANIFEST_INDEX] = index
+    future.set_result(index)
+    return index
+
+
+@callback
+def _async_save_manifest_index(hass: HomeAssistant, index: ManifestIndex) -> None:
+    """Schedule saving the manifest index if it changed."""
+    if index.dirty:
+        _async_get_manifest_index_store(hass).async_delay_save(
+            index.as_dict, MANIFEST_INDEX_SAVE_DELAY
+        )
+
+
+@callback
+def _async_get_manifest_index_store(hass: HomeAssistant) -> Store[dict[str, Any]]:
+    """Return the store for the manifest index."""
+    if (store := hass.data.get(DATA_MANIFEST_INDEX_STORE)) is None:
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        store = hass.data[DATA_MANIFEST_INDEX_STORE] = Store(
+            hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+    return store
+
+
+def _get_custom_components(
+    hass: HomeAssistant, manifest_index: ManifestIndex | None = None
+) -> dict[str, Integration]:
     """Return list of custom integrations."""
     if hass.config.recovery_mode or hass.config.safe_mode:
         return {}
@@ -294,17 +455,22 @@ def _get_custom_components(hass: HomeAssistant) -> dict[str, Integration]:
     except ImportError:
         return {}
 
-    dirs = [
-        entry
-        for path in custom_components.__path__
-        for entry in pathlib.Path(path).iterdir()
-        if entry.is_dir()
-    ]
+    if manifest_index is None:
+        dirs = [
+            entry.name
+            for path in custom_components.__path__
+            for entry in pathlib.Path(path).iterdir()
+            if entry.is_dir()
+        ]
+    else:
+        dirs = [
+            name
+            for path in custom_components.__path__
+            for name in manifest_index.get_custom_dirs(path)
+        ]
 
     integrations = _resolve_integrations_from_root(
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+        hass, custom_components, dirs, manifest_index
     )
     return {
         integration.domain: integration
@@ -322,7 +488,11 @@ async def async_get_custom_components(
     if comps_or_future is None:
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
-        comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        manifest_index = await _async_get_manifest_index(hass)
+        comps = await hass.async_add_executor_job(
+            _get_custom_components, hass, manifest_index
+        )
+        _async_save_manifest_index(hass, manifest_index)
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -650,33 +820,48 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        manifest_index: ManifestIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = pathlib.Path(base) / domain
+            if manifest_index is not None and (
+                indexed := manifest_index.get_integration(base, domain)
+            ):
+                manifest, top_level_files = indexed
+            else:
+                manifest_path = file_path / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
+                if not manifest_path.is_file():
+                    continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_index is not None:
+                    manifest_index.set_integration(
+                        base, domain, manifest, top_level_files
+                    )
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -983,6 +1168,15 @@ class Integration:
         and will check if import_executor is set and load it in the executor,
         otherwise it will load it in the event loop.
         """
+        return await self._async_get_component(None)
+
+    async def _async_get_component(
+        self, executor: Executor | None
+    ) -> ComponentProtocol:
+        """Return the component, importing it in the given executor.
+
+        If no executor is given, the import executor is used.
+        """
         domain = self.domain
         if domain in (cache := self._cache):
             return cache[domain]
@@ -990,8 +1184,9 @@ class Integration:
         if self._component_future:
             return await self._component_future
 
-        if debug := _LOGGER.isEnabledFor(logging.DEBUG):
-            start = time.perf_counter()
+        trace = async_get_startup_trace(self.hass)
+        if (debug := _LOGGER.isEnabledFor(logging.DEBUG)) or trace is not None:
+            start = time.monotonic()
 
         # Some integrations fail on import because they call functions incorrectly.
         # So we do it before validating config to catch these errors.
@@ -1001,20 +1196,27 @@ class Integration:
         )
         if not load_executor:
             comp = self._get_component()
+            if trace is not None:
+                trace.add(domain, CATEGORY_IMPORT, start, time.monotonic())
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
                     self.domain,
-                    time.perf_counter() - start,
+                    time.monotonic() - start,
                 )
             return comp
 
         self._component_future = self.hass.loop.create_future()
         try:
             try:
-                comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
-                )
+                if executor is None:
+                    comp = await self.hass.async_add_import_executor_job(
+                        self._get_component, True
+                    )
+                else:
+                    comp = await self.hass.loop.run_in_executor(
+                        executor, self._get_component, True
+                    )
             except ModuleNotFoundError:
                 raise
             except ImportError as ex:
@@ -1037,11 +1239,13 @@ class Integration:
         finally:
             self._component_future = None
 
+        if trace is not None:
+            trace.add(domain, CATEGORY_IMPORT, start, time.monotonic())
         if debug:
             _LOGGER.debug(
                 "Component %s import took %.3f seconds (loaded_executor=%s)",
                 self.domain,
-                time.perf_counter() - start,
+                time.monotonic() - start,
                 load_executor,
             )
 
@@ -1323,13 +1527,18 @@ def _version_blocked(
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    manifest_index: ManifestIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, manifest_index
+            )
         except Exception:
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -1415,9 +1624,11 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_index = await _async_get_manifest_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, manifest_index
         )
+        _async_save_manifest_index(hass, manifest_index)
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -1435,6 +1646,114 @@ async def async_get_integrations(
     return results
 
 
+async def async_pre_import_integrations(
+    hass: HomeAssistant, integrations: dict[str, Integration], workers: int
+) -> None:
+    """Import integrations concurrently ahead of setting them up.
+
+    The import executor has a single worker so imports cannot deadlock
+    on the import locks, which means heavy imports run one after another.
+    Here integrations are imported in a pool of workers in dependency
+    order: an integration is only imported once the integrations it
+    depends on are imported, so the modules it imports at the top level
+    are usually already loaded and cannot be locked by another worker.
+    If a deadlock is still detected, async_get_component falls back to
+    importing in the event loop as it does for the import executor.
+
+    Setting up an integration that is being pre-imported waits for the
+    import in progress instead of starting another one.
+    """
+    graph = {
+        domain: {
+            dep
+            for dep in (*integration.dependencies, *integration.after_dependencies)
+            if dep in integrations
+        }
+        for domain, integration in integrations.items()
+    }
+    try:
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+    except CycleError:
+        # Cycles through after_dependencies are allowed, ignore the ordering
+        sorter = TopologicalSorter(dict.fromkeys(graph, ()))
+        sorter.prepare()
+
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="PreImportExecutor"
+    )
+    import_times: list[tuple[float, float]] = []
+
+    async def _async_pre_import(integration: Integration) -> str:
+        start = time.monotonic()
+        try:
+            await integration._async_get_component(executor)  # noqa: SLF001
+        except Exception as err:  # noqa: BLE001
+            # Setting up the integration will report the error
+            _LOGGER.debug("Failed to pre-import %s: %s", integration.domain, err)
+        else:
+            import_times.append((start, time.monotonic()))
+        return integration.domain
+
+    started = time.monotonic()
+    pending: set[asyncio.Task[str]] = set()
+    try:
+        while sorter.is_active():
+            for domain in sorter.get_ready():
+                integration = integrations[domain]
+                if not integration.import_executor or integration.pkg_path in (
+                    sys.modules
+                ):
+                    # Imported in the event loop or already imported
+                    sorter.done(domain)
+                    continue
+                pending.add(
+                    hass.async_create_background_task(
+                        _async_pre_import(integration),
+                        f"pre-import {domain}",
+                        eager_start=True,
+                    )
+                )
+            if not pending:
+                continue
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                sorter.done(task.result())
+    finally:
+        executor.shutdown(wait=False)
+
+    if not import_times:
+        return
+    elapsed = time.monotonic() - started
+    import_time = sum(end - start for start, end in import_times)
+    _LOGGER.info(
+        "Pre-imported %s integrations with %s workers in %.2fs,"
+        " %.2fs spent importing (%.1fx overlap, up to %s concurrent)",
+        len(import_times),
+        workers,
+        elapsed,
+        import_time,
+        import_time / elapsed if elapsed else 1,
+        _max_concurrent(import_times),
+    )
+
+
+def _max_concurrent(intervals: list[tuple[float, float]]) -> int:
+    """Return the maximum number of overlapping intervals."""
+    events = sorted(
+        (time_, change)
+        for start, end in intervals
+        for time_, change in ((start, 1), (end, -1))
+    )
+    current = highest = 0
+    for _, change in events:
+        current += change
+        highest = max(highest, current)
+    return highest
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -55,6 +55,10 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    startup_trace: bool = False
+
+    pre_import_workers: int = 0
+
 
 class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
     """Event loop policy for Home Assistant."""
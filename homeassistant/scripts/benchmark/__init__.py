@@ -6,17 +6,24 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import gc
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
+import tracemalloc
+from types import MappingProxyType
 
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant import config_entries, core, loader
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_STATE_CHANGED
+from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.setup import async_setup_component
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +315,354 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_machine_memory(hass: core.HomeAssistant) -> float:
+    """Populate the state machine with 50k entities and update each once.
+
+    Prints the memory held by the state machine afterwards.
+    """
+    entity_count = 50_000
+    attributes = [
+        {
+            "friendly_name": f"Sensor {idx}",
+            "unit_of_measurement": "°C",
+            "device_class": "temperature",
+            "state_class": "measurement",
+        }
+        for idx in range(entity_count)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    start = timer()
+
+    for update in range(2):
+        for idx in range(entity_count):
+            hass.states.async_set(
+                f"sensor.temperature_{idx}", str(idx + update), attributes[idx]
+            )
+
+    runtime = timer() - start
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"State machine holds {memory / 2**20:.1f} MiB,"
+        f" {memory / entity_count:.0f} bytes per entity"
+    )
+    return runtime
+
+
+@benchmark
+async def condition_evaluation(hass: core.HomeAssistant) -> float:
+    """Evaluate a tree of state, numeric_state and time conditions 100k times.
+
+    Prints the evaluations per second without a trace being collected and
+    with one, as when an automation stores its traces.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        condition,
+        config_validation as cv,
+        trace as trace_helper,
+    )
+
+    evaluations = 10**5
+    for idx in range(10):
+        hass.states.async_set(f"light.room_{idx}", "on" if idx % 2 else "off")
+        hass.states.async_set(f"sensor.temperature_{idx}", str(18 + idx))
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "or",
+                    "conditions": [
+                        {
+                            "condition": "state",
+                            "entity_id": f"light.room_{idx}",
+                            "state": "on",
+                        }
+                        for idx in range(0, 10, 2)
+                    ]
+                    + [
+                        {
+                            "condition": "state",
+                            "entity_id": "light.room_1",
+                            "state": ["on", "unavailable"],
+                        }
+                    ],
+                },
+                {
+                    "condition": "numeric_state",
+                    "entity_id": [f"sensor.temperature_{idx}" for idx in range(10)],
+                    "above": 10,
+                    "below": 30,
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {"condition": "time", "after": "03:00:00", "before": "03:00:01"}
+                    ],
+                },
+            ],
+        }
+    )
+    check = await condition.async_from_config(hass, config)
+
+    trace_helper.trace_clear()
+    start = timer()
+    for _ in range(evaluations):
+        check(hass, None)
+        trace_helper.trace_clear()
+    traced_runtime = timer() - start
+
+    trace_helper.trace_cv.set(None)
+    start = timer()
+    for _ in range(evaluations):
+        check(hass, None)
+    runtime = timer() - start
+
+    print(
+        f"{evaluations / runtime:.0f} evaluations/s untraced,"
+        f" {evaluations / traced_runtime:.0f} evaluations/s traced"
+    )
+    return runtime
+
+
+@benchmark
+async def automation_trace_policy(hass: core.HomeAssistant) -> float:
+    """Run a five step automation action 10k times with each trace policy.
+
+    Prints the time per run of every policy.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.automation.trace import trace_automation
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.trace import TracePolicy, TraceRunPolicy
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.trace.const import DATA_TRACE
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.script import Script
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.trace import trace_get, trace_path
+
+    runs = 10_000
+    hass.data[DATA_TRACE] = {}
+    hass.states.async_set("sensor.power", "1500")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"variables": {"threshold": 1000}},
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.power",
+                "above": 1000,
+            },
+            {
+                "choose": [
+                    {
+                        "conditions": [
+                            {
+                                "condition": "state",
+                                "entity_id": "sensor.power",
+                                "state": "1500",
+                            }
+                        ],
+                        "sequence": [{"event": "power_high"}],
+                    }
+                ],
+                "default": [{"event": "power_low"}],
+            },
+            {"event": "power_measured", "event_data": {"power": "{{ threshold }}"}},
+            {"variables": {"done": True}},
+        ]
+    )
+    script = Script(hass, sequence, "benchmark", "automation")
+    run_variables = {"trigger": {"platform": "state", "entity_id": "sensor.power"}}
+
+    total = 0.0
+    for policy in TracePolicy:
+        trace_policy = TraceRunPolicy({"policy": policy})
+        start = timer()
+        for _ in range(runs):
+            with trace_automation(
+                hass, "benchmark", None, None, core.Context(), trace_policy
+            ) as automation_trace:
+                if automation_trace is not None:
+                    automation_trace.set_trace(trace_get())
+                with trace_path("action"):
+                    await script.async_run(run_variables, core.Context())
+        runtime = timer() - start
+        total += runtime
+        print(f"{policy}: {runtime / runs * 1_000_000:.0f} µs per run")
+    return total
+
+
+@benchmark
+async def recorder_state_ingest(hass: core.HomeAssistant) -> float:
+    """Record 100k state changes of 1000 entities.
+
+    Uses a temporary SQLite database unless a database url is
+    set in the RECORDER_BENCHMARK_DB_URL environment variable.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+
+    states_to_write = 10**5
+    entity_count = 1000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_url = os.environ.get(
+            "RECORDER_BENCHMARK_DB_URL", f"sqlite:///{tmp_dir}/benchmark.db"
+        )
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": db_url, "commit_interval": 1}}
+        )
+        hass.set_state(core.CoreState.running)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        instance = get_instance(hass)
+        await instance.async_db_ready
+
+        start = timer()
+
+        for idx in range(states_to_write):
+            hass.states.async_set(
+                f"sensor.power_{idx % entity_count}",
+                str(idx),
+                {"unit_of_measurement": "W", "reading": idx // entity_count},
+            )
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"Recorded {states_to_write / runtime:.0f} states/s")
+        await hass.async_stop()
+        return runtime
+
+
+@benchmark
+async def mqtt_message_dispatch(hass: core.HomeAssistant) -> float:
+    """Replay an MQTT message stream at 5000 messages per second.
+
+    Replays the messages recorded with `mosquitto_sub -v -t '#'` in the file
+    set in the MQTT_BENCHMARK_STREAM environment variable, or a synthetic
+    stream of 1000 devices otherwise. Returns the time spent dispatching.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import paho.mqtt.client as paho_mqtt
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.models import MqttData
+
+    messages_per_second = 5000
+    seconds_to_replay = 10
+    device_count = 1000
+    received = 0
+
+    @core.callback
+    def message_received(msg):
+        """Handle message."""
+        nonlocal received
+        received += 1
+
+    entry = config_entries.ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain="mqtt",
+        minor_version=1,
+        options={},
+        source=config_entries.SOURCE_USER,
+        title="MQTT",
+        unique_id=None,
+        version=1,
+    )
+    mqtt_client = MQTT(hass, entry, {})
+    await mqtt_client.async_start(MqttData(config=[], client=mqtt_client))
+
+    # The subscriptions of discovered zigbee2mqtt, Tasmota and ESPHome devices
+    for topic in (
+        "homeassistant/#",
+        "tasmota/discovery/#",
+        "zigbee2mqtt/bridge/#",
+        "+/status",
+        "tele/+/LWT",
+    ):
+        mqtt_client.async_subscribe(topic, message_received, 0)
+    for idx in range(device_count):
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"zigbee2mqtt/device_{idx}/availability",
+            f"stat/tasmota_{idx}/+",
+            f"tele/tasmota_{idx}/SENSOR",
+            f"esphome_{idx}/sensor/+/state",
+            f"esphome_{idx}/#",
+        ):
+            mqtt_client.async_subscribe(topic, message_received, 0)
+
+    if stream_path := os.environ.get("MQTT_BENCHMARK_STREAM"):
+        recorded = await hass.async_add_executor_job(_read_mqtt_stream, stream_path)
+    else:
+        recorded = [
+            (topic, b'{"temperature": 21.5, "linkquality": 120}')
+            for idx in range(device_count)
+            for topic in (
+                f"zigbee2mqtt/device_{idx}",
+                f"tele/tasmota_{idx}/SENSOR",
+                f"stat/tasmota_{idx}/POWER",
+                f"esphome_{idx}/sensor/temperature/state",
+                f"esphome_{idx}/debug",
+                f"unknown_{idx}/state",
+            )
+        ]
+
+    messages = []
+    for idx in range(messages_per_second * seconds_to_replay):
+        topic, payload = recorded[idx % len(recorded)]
+        msg = paho_mqtt.MQTTMessage(topic=topic.encode())
+        msg.payload = payload
+        messages.append(msg)
+
+    paho_client = mqtt_client._mqttc  # noqa: SLF001
+    loop = asyncio.get_running_loop()
+    busy = 0.0
+    next_slice = loop.time()
+    for idx in range(0, len(messages), messages_per_second):
+        start = timer()
+        for msg in messages[idx : idx + messages_per_second]:
+            mqtt_client._async_mqtt_on_message(paho_client, None, msg)  # noqa: SLF001
+        busy += timer() - start
+        next_slice += 1
+        await asyncio.sleep(max(0, next_slice - loop.time()))
+
+    print(
+        f"Dispatched {len(messages)} messages with {received} callbacks,"
+        f" event loop busy {busy / seconds_to_replay:.1%}"
+        f" at {messages_per_second} msg/s"
+    )
+    await mqtt_client.async_disconnect()
+    return busy
+
+
+def _read_mqtt_stream(path: str) -> list[tuple[str, bytes]]:
+    """Read the topics and payloads of a recorded MQTT message stream."""
+    recorded: list[tuple[str, bytes]] = []
+    with open(path, encoding="utf-8") as stream:
+        for line in stream:
+            if line := line.rstrip("\n"):
+                topic, _, payload = line.partition(" ")
+                recorded.append((topic, payload.encode()))
+    return recorded
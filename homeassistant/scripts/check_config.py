@@ -245,7 +245,7 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml_reference)
 
     return res
 
@@ -31,6 +31,12 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import (
+    CATEGORY_REQUIREMENTS,
+    CATEGORY_WAIT_DEPENDENCIES,
+    async_get_startup_trace,
+    async_trace_span,
+)
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -233,10 +239,16 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_trace_span(
+        hass,
+        integration.domain,
+        CATEGORY_WAIT_DEPENDENCIES,
+        dependencies=[*dependencies_tasks, *after_dependencies_tasks],
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -571,10 +583,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_span(hass, integration.domain, CATEGORY_REQUIREMENTS):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -713,6 +726,8 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        if (trace := async_get_startup_trace(hass)) is not None:
+            trace.add(integration, phase, started, started + time_taken, group)
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -776,6 +791,8 @@ def async_start_setup(
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
+        if (trace := async_get_startup_trace(hass)) is not None:
+            trace.add(integration, phase, started, started + time_taken, group)
         if group is None:
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -22,6 +24,7 @@ except ImportError:
         SafeLoader as FastestAvailableSafeLoader,
     )
 
+from lru import LRU
 from propcache.api import cached_property
 
 from homeassistant.exceptions import HomeAssistantError
@@ -112,6 +115,11 @@ class _LoaderMixin:
 
     name: str
     stream: Any
+    secrets: Secrets | None
+    # If the parsed tree contains references that must be resolved
+    has_references = False
+    # If the parsed tree can be reused when the file did not change
+    cacheable = True
 
     @cached_property
     def get_name(self) -> str:
@@ -155,6 +163,40 @@ class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
+@dataclass(slots=True, frozen=True)
+class _Reference:
+    """A tag in a parsed tree that is resolved each time the file is loaded.
+
+    Includes, secrets and environment variables are kept symbolic so the
+    parsed tree of a file can be reused while the files, secrets and
+    environment it refers to change.
+    """
+
+    resolve: Callable[[_Reference, Secrets | None], Any]
+    value: Any
+    name: str
+    mark: yaml.Mark
+
+    @property
+    def line(self) -> int:
+        """Return the line of the tag."""
+        return self.mark.line + 1
+
+
+@dataclass(slots=True, frozen=True)
+class _ParsedFile:
+    """The parsed tree of a file."""
+
+    digest: bytes
+    tree: JSON_TYPE | None
+
+
+# The parsed trees of the most recently loaded files by path, reused while
+# the content of the file does not change.
+MAX_PARSED_FILES = 2048
+_PARSED_FILES: LRU[str, _ParsedFile] = LRU(MAX_PARSED_FILES)
+
+
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
@@ -165,15 +207,36 @@ def load_yaml(
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            content = conf_file.read()
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
     except FileNotFoundError:
+        _PARSED_FILES.pop(os.fspath(fname), None)
         raise
     except OSError as exc:
         raise HomeAssistantError(exc) from exc
 
+    fname = os.fspath(fname)
+    # The tree only depends on the content while the default constructors
+    # are used, tools like check_config replace them to inspect the config.
+    cacheable = FastSafeLoader.yaml_constructors == _DEFAULT_CONSTRUCTORS
+    digest = hashlib.sha256(content.encode()).digest()
+    if (
+        not cacheable
+        or (parsed := _PARSED_FILES.get(fname)) is None
+        or parsed.digest != digest
+    ):
+        stream = StringIO(content)
+        stream.name = fname
+        tree, loader = _parse_yaml_tree(stream, secrets)
+        if not cacheable or not loader.cacheable:
+            _PARSED_FILES.pop(fname, None)
+            return _resolve_references(tree, secrets) if loader.has_references else tree
+        parsed = _PARSED_FILES[fname] = _ParsedFile(digest, tree)
+    # Resolving returns a copy so the cached tree is never modified
+    return _resolve_references(parsed.tree, secrets)
+
 
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
@@ -195,6 +258,14 @@ def parse_yaml(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
+    tree, loader = _parse_yaml_tree(content, secrets)
+    return _resolve_references(tree, secrets) if loader.has_references else tree
+
+
+def _parse_yaml_tree(
+    content: str | TextIO | StringIO, secrets: Secrets | None = None
+) -> tuple[JSON_TYPE, LoaderType]:
+    """Parse YAML into a tree with unresolved references."""
     if not HAS_C_LOADER:
         return _parse_yaml_python(content, secrets)
     try:
@@ -210,7 +281,7 @@ def parse_yaml(
 
 def _parse_yaml_python(
     content: str | TextIO | StringIO, secrets: Secrets | None = None
-) -> JSON_TYPE:
+) -> tuple[JSON_TYPE, LoaderType]:
     """Parse YAML with the python loader (this is very slow)."""
     try:
         return _parse_yaml(PythonSafeLoader, content, secrets)
@@ -220,12 +291,44 @@ def _parse_yaml_python(
 
 
 def _parse_yaml(
-    loader: type[FastSafeLoader | PythonSafeLoader],
+    loader_class: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
-) -> JSON_TYPE:
+) -> tuple[JSON_TYPE, LoaderType]:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    loader = loader_class(content, secrets)
+    try:
+        return loader.get_single_data(), loader
+    finally:
+        loader.dispose()
+
+
+def _resolve_references(obj: Any, secrets: Secrets | None) -> Any:
+    """Return a copy of a parsed tree with the references resolved."""
+    obj_type = type(obj)
+    if obj_type is NodeDictClass or obj_type is dict:
+        copy = obj_type(
+            {
+                (
+                    key.resolve(key, secrets) if type(key) is _Reference else key
+                ): _resolve_references(value, secrets)
+                for key, value in obj.items()
+            }
+        )
+    elif obj_type is NodeListClass or obj_type is list:
+        copy = obj_type([_resolve_references(value, secrets) for value in obj])
+    elif obj_type is _Reference:
+        return obj.resolve(obj, secrets)
+    elif obj_type is set:
+        return set(obj)
+    else:
+        return obj
+    try:  # suppress is much slower
+        copy.__config_file__ = obj.__config_file__
+        copy.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return copy
 
 
 @overload
@@ -306,24 +409,64 @@ def _raise_if_no_value[NodeT: yaml.nodes.Node, _R](
     return wrapper
 
 
-@_raise_if_no_value
-def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
+def _reference(
+    resolve: Callable[[_Reference, Secrets | None], Any],
+) -> Callable[[LoaderType, yaml.nodes.Node], _Reference]:
+    """Return a constructor that resolves the tag when the file is loaded."""
+
+    def constructor(loader: LoaderType, node: yaml.nodes.Node) -> _Reference:
+        loader.has_references = True
+        return _Reference(resolve, node.value, loader.get_name, node.start_mark)
+
+    return constructor
+
+
+@overload
+def _add_tag_reference(obj: list | NodeListClass, ref: _Reference) -> NodeListClass: ...
+
+
+@overload
+def _add_tag_reference(obj: str | NodeStrClass, ref: _Reference) -> NodeStrClass: ...
+
+
+@overload
+def _add_tag_reference(obj: dict | NodeDictClass, ref: _Reference) -> NodeDictClass: ...
+
+
+def _add_tag_reference(
+    obj: dict | list | str | NodeDictClass | NodeListClass | NodeStrClass,
+    ref: _Reference,
+) -> NodeDictClass | NodeListClass | NodeStrClass:
+    """Add the file reference of a tag to an object."""
+    if isinstance(obj, list):
+        obj = NodeListClass(obj)
+    elif isinstance(obj, str):
+        obj = NodeStrClass(obj)
+    elif isinstance(obj, dict):
+        obj = NodeDictClass(obj)
+    try:  # suppress is much slower
+        obj.__config_file__ = ref.name
+        obj.__line__ = ref.line
+    except AttributeError:
+        pass
+    return obj
+
+
+def _include_yaml(ref: _Reference, secrets: Secrets | None) -> JSON_TYPE:
     """Load another YAML file and embed it using the !include tag.
 
     Example:
         device_tracker: !include device_tracker.yaml
 
     """
-    fname = os.path.join(os.path.dirname(loader.get_name), node.value)
+    fname = os.path.join(os.path.dirname(ref.name), ref.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
-        return _add_reference(loaded_yaml, loader, node)
+        return _add_tag_reference(loaded_yaml, ref)
     except FileNotFoundError as exc:
-        raise HomeAssistantError(
-            f"{node.start_mark}: Unable to read file {fname}"
-        ) from exc
+        raise HomeAssistantError(f"{ref.mark}: Unable to read file {fname}") from exc
 
 
 def _is_file_valid(name: str) -> bool:
@@ -341,68 +484,60 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-@_raise_if_no_value
-def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
+def _include_dir_named_yaml(ref: _Reference, secrets: Secrets | None) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(os.path.dirname(ref.name), ref.value)
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
             loaded_yaml = NodeDictClass()
         mapping[filename] = loaded_yaml
-    return _add_reference_to_node_class(mapping, loader, node)
+    return _add_tag_reference(mapping, ref)
 
 
-@_raise_if_no_value
 def _include_dir_merge_named_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
+    ref: _Reference, secrets: Secrets | None
 ) -> NodeDictClass:
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(os.path.dirname(ref.name), ref.value)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
-    return _add_reference_to_node_class(mapping, loader, node)
+    return _add_tag_reference(mapping, ref)
 
 
-@_raise_if_no_value
-def _include_dir_list_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
-) -> list[JSON_TYPE]:
+def _include_dir_list_yaml(ref: _Reference, secrets: Secrets | None) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
-    loc = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc = os.path.join(os.path.dirname(ref.name), ref.value)
     return [
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, secrets)) is not None
     ]
 
 
-@_raise_if_no_value
-def _include_dir_merge_list_yaml(
-    loader: LoaderType, node: yaml.nodes.Node
-) -> JSON_TYPE:
+def _include_dir_merge_list_yaml(ref: _Reference, secrets: Secrets | None) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
-    loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
+    loc: str = os.path.join(os.path.dirname(ref.name), ref.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, secrets)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
-    return _add_reference(merged_list, loader, node)
+    return _add_tag_reference(merged_list, ref)
 
 
 def _handle_mapping_tag(
@@ -433,6 +568,8 @@ def _handle_mapping_tag(
             ) from exc
 
         if key in seen:
+            # Parse the file again on the next load to repeat the warning
+            loader.cacheable = False
             fname = loader.get_stream_name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
@@ -462,17 +599,25 @@ def _handle_scalar_tag(
     return _add_reference_to_node_class(NodeStrClass(obj), loader, node)
 
 
-def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(ref: _Reference, secrets: Secrets | None) -> str:
     """Load environment variables and embed it into the configuration YAML."""
-    args = node.value.split()
+    args = ref.value.split()
 
     # Check for a default value
     if len(args) > 1:
         return os.getenv(args[0], " ".join(args[1:]))
     if args[0] in os.environ:
         return os.environ[args[0]]
-    _LOGGER.error("Environment variable %s not defined", node.value)
-    raise HomeAssistantError(node.value)
+    _LOGGER.error("Environment variable %s not defined", ref.value)
+    raise HomeAssistantError(ref.value)
+
+
+def _secret_yaml(ref: _Reference, secrets: Secrets | None) -> JSON_TYPE:
+    """Load secrets and embed it into the configuration YAML."""
+    if secrets is None:
+        raise HomeAssistantError("Secrets not supported in this YAML file")
+
+    return secrets.get(ref.name, ref.value)
 
 
 def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
@@ -489,14 +634,28 @@ def add_constructor(tag: Any, constructor: Any) -> None:
         yaml_loader.add_constructor(tag, constructor)
 
 
-add_constructor("!include", _include_yaml)
+add_constructor("!include", _raise_if_no_value(_reference(_include_yaml)))
 add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _handle_mapping_tag)
 add_constructor(yaml.resolver.BaseResolver.DEFAULT_SCALAR_TAG, _handle_scalar_tag)
 add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
-add_constructor("!env_var", _env_var_yaml)
-add_constructor("!secret", secret_yaml)
-add_constructor("!include_dir_list", _include_dir_list_yaml)
-add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-add_constructor("!include_dir_named", _include_dir_named_yaml)
-add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!env_var", _reference(_env_var_yaml))
+# The default !secret constructor, restore it after replacing it
+secret_yaml_reference = _reference(_secret_yaml)
+add_constructor("!secret", secret_yaml_reference)
+add_constructor(
+    "!include_dir_list", _raise_if_no_value(_reference(_include_dir_list_yaml))
+)
+add_constructor(
+    "!include_dir_merge_list",
+    _raise_if_no_value(_reference(_include_dir_merge_list_yaml)),
+)
+add_constructor(
+    "!include_dir_named", _raise_if_no_value(_reference(_include_dir_named_yaml))
+)
+add_constructor(
+    "!include_dir_merge_named",
+    _raise_if_no_value(_reference(_include_dir_merge_named_yaml)),
+)
 add_constructor("!input", Input.from_node)
+
+_DEFAULT_CONSTRUCTORS = dict(FastSafeLoader.yaml_constructors)
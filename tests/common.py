@@ -1832,7 +1832,10 @@ def reset_translation_cache(hass: HomeAssistant, components: list[str]) -> None:
     for loaded_components in translations_cache.cache_data.loaded.values():
         for component_to_unload in components:
             loaded_components.discard(component_to_unload)
-    for loaded_categories in translations_cache.cache_data.cache.values():
+    for loaded_categories in (
+        *translations_cache.cache_data.cache.values(),
+        *translations_cache.cache_data.pending.values(),
+    ):
         for loaded_components in loaded_categories.values():
             for component_to_unload in components:
                 loaded_components.pop(component_to_unload, None)
@@ -50,6 +50,7 @@ from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     _async_stop_scripts_at_shutdown,
 )
+from homeassistant.helpers.trigger import async_validate_trigger_config
 from homeassistant.setup import async_setup_component
 from homeassistant.util import yaml as yaml_util
 import homeassistant.util.dt as dt_util
@@ -1343,6 +1344,96 @@ async def test_reload_unchanged_automation(
         assert len(calls) == 2
 
 
+async def test_reload_only_validates_changed_automations(
+    hass: HomeAssistant, calls: list[ServiceCall]
+) -> None:
+    """Test reloading does not validate automations that did not change."""
+    config = {
+        automation.DOMAIN: [
+            {
+                "id": "unchanged",
+                "triggers": {"trigger": "event", "event_type": "test_event"},
+                "actions": {"action": "test.automation"},
+            },
+            {
+                "id": "changed",
+                "triggers": {"trigger": "event", "event_type": "test_event"},
+                "actions": {"action": "test.automation"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    config = {
+        automation.DOMAIN: [
+            config[automation.DOMAIN][0],
+            {
+                "id": "changed",
+                "triggers": {"trigger": "event", "event_type": "test_event_2"},
+                "actions": {"action": "test.automation"},
+            },
+        ]
+    }
+    with (
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+        patch(
+            "homeassistant.components.automation.config.async_validate_trigger_config",
+            wraps=async_validate_trigger_config,
+        ) as validate_trigger_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert validate_trigger_config.call_count == 1
+    hass.bus.async_fire("test_event")
+    hass.bus.async_fire("test_event_2")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_reload_validates_automations_after_registry_update(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test reloading validates all automations after a registry update."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    config = {
+        automation.DOMAIN: {
+            "id": "unchanged",
+            "triggers": {"trigger": "event", "event_type": "test_event"},
+            "actions": {"action": "test.automation"},
+        }
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+
+    with (
+        patch(
+            "homeassistant.config.load_yaml_config_file",
+            autospec=True,
+            return_value=config,
+        ),
+        patch(
+            "homeassistant.components.automation.config.async_validate_trigger_config",
+            wraps=async_validate_trigger_config,
+        ) as validate_trigger_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_trigger_config.call_count == 0
+
+        device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id,
+            connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        )
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_trigger_config.call_count == 1
+
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+        assert validate_trigger_config.call_count == 1
+
+
 @pytest.mark.parametrize("extra_config", [{}, {"id": "sun"}])
 async def test_reload_automation_when_blueprint_changes(
     hass: HomeAssistant, calls: list[ServiceCall], extra_config: dict[str, str]
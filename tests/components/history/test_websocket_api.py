@@ -173,6 +173,98 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_columnar(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period in the columnar format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "5", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "COLUMNAR_ENTITY_CHUNK_SIZE", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": False,
+                "columnar": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["result"] is None
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        assert response["event"]["complete"] is False
+        sensor_one = response["event"]["states"]["sensor.one"]
+        assert sensor_one["v"] == ["on", "off"]
+        assert sensor_one["s"] == [0, 1, 0]
+        assert sensor_one["a"] == [{"any": "attr"}, {"any": "attr"}, {"any": "changed"}]
+        assert "lc" not in sensor_one
+        last_updated = sensor_one["lu"]
+        assert len(last_updated) == 3
+        assert last_updated[0] > now.timestamp()
+        assert last_updated[1] > 0
+        assert last_updated[2] > 0
+        assert sum(last_updated) == pytest.approx(
+            hass.states.get("sensor.one").last_updated_timestamp
+        )
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["event"]["complete"] is True
+        assert response["event"]["states"] == {
+            "sensor.two": {
+                "v": ["5"],
+                "s": [0],
+                "lu": [hass.states.get("sensor.two").last_updated_timestamp],
+                "a": [{"any": "attr"}],
+            }
+        }
+
+
+async def test_history_during_period_columnar_empty(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period in the columnar format without history."""
+    await async_setup_component(hass, "history", {})
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": (dt_util.utcnow() + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"] == {"states": {}, "complete": True}
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -635,6 +635,64 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_wildcard_topics_matching_order(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test overlapping wildcard subscriptions are matched in subscription order."""
+    await mqtt_mock_entry()
+    calls: list[str] = []
+
+    def _record(subscribed_topic: str) -> MessageCallbackType:
+        @callback
+        def _record_call(msg: ReceiveMessage) -> None:
+            calls.append(subscribed_topic)
+
+        return _record_call
+
+    topics = ["#", "home/+/state", "home/#", "+/+/+", "home/kitchen/+", "+/#"]
+    unsubs = {
+        topic: await mqtt.async_subscribe(hass, topic, _record(topic))
+        for topic in topics
+    }
+    await mqtt.async_subscribe(hass, "home/kitchen/state", _record("simple"))
+
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == ["simple", *topics]
+
+    calls.clear()
+    async_fire_mqtt_message(hass, "home", "on")
+    await hass.async_block_till_done()
+    assert calls == ["#", "home/#", "+/#"]
+
+    calls.clear()
+    async_fire_mqtt_message(hass, "$home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == []
+
+    unsubs["home/#"]()
+    unsubs["+/+/+"]()
+    calls.clear()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == ["simple", "#", "home/+/state", "home/kitchen/+", "+/#"]
+
+    # Subscribing again moves the subscription to the end
+    await mqtt.async_subscribe(hass, "home/#", _record("home/#"))
+    calls.clear()
+    async_fire_mqtt_message(hass, "home/kitchen/state", "on")
+    await hass.async_block_till_done()
+    assert calls == [
+        "simple",
+        "#",
+        "home/+/state",
+        "home/kitchen/+",
+        "+/#",
+        "home/#",
+    ]
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -15,6 +15,7 @@ from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
+import voluptuous as vol
 
 from homeassistant.components import recorder
 from homeassistant.components.lock import LockState
@@ -23,6 +24,8 @@ from homeassistant.components.recorder import (
     CONF_AUTO_REPACK,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
+    CONF_DB_READ_URL,
+    CONF_DB_READ_WORKERS,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
     CONFIG_SCHEMA,
@@ -51,7 +54,10 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsRuns,
 )
 from homeassistant.components.recorder.models import process_timestamp
-from homeassistant.components.recorder.queries import select_event_type_ids
+from homeassistant.components.recorder.queries import (
+    find_states_metadata_ids,
+    select_event_type_ids,
+)
 from homeassistant.components.recorder.services import (
     SERVICE_DISABLE,
     SERVICE_ENABLE,
@@ -69,6 +75,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
@@ -1860,6 +1867,98 @@ async def test_database_lock_and_unlock(
     assert len(db_events) == 1
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_queued_states_ids_resolved_in_bulk(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test ids for queued state changes are looked up with one query per table.
+
+    This test is specific for SQLite: Locking is not implemented for other engines.
+    """
+    instance = await async_setup_recorder_instance(hass)
+    entity_attributes = {f"test.recorder_{idx}": {"test_attr": idx} for idx in range(5)}
+    for entity_id, attributes in entity_attributes.items():
+        hass.states.async_set(entity_id, "on", attributes)
+    await async_wait_recording_done(hass)
+
+    # Clear the caches so the ids have to be looked up in the database
+    instance.states_meta_manager._id_map.clear()
+    instance.state_attributes_manager._id_map.clear()
+
+    # Queue the state changes while the recorder thread is blocked,
+    # including entities and attributes which are not in the database yet
+    assert await instance.lock_database()
+    for entity_id, attributes in entity_attributes.items():
+        hass.states.async_set(entity_id, "off", attributes)
+    for idx in range(5, 8):
+        hass.states.async_set(f"test.recorder_{idx}", "off", {"test_attr": idx})
+    await hass.async_block_till_done()
+
+    with (
+        patch(
+            "homeassistant.components.recorder.table_managers.states_meta.find_states_metadata_ids",
+            wraps=find_states_metadata_ids,
+        ) as find_states_metadata_ids_mock,
+        patch.object(
+            instance.state_attributes_manager,
+            "_load_from_hashes",
+            wraps=instance.state_attributes_manager._load_from_hashes,
+        ) as load_from_hashes_mock,
+    ):
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass)
+
+    assert find_states_metadata_ids_mock.call_count == 1
+    assert load_from_hashes_mock.call_count == 1
+
+    def _get_db_states() -> list[States]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(States))
+
+    db_states = await instance.async_add_executor_job(_get_db_states)
+    assert len(db_states) == 13
+    assert len({db_state.metadata_id for db_state in db_states}) == 8
+    assert len({db_state.attributes_id for db_state in db_states}) == 8
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_queued_states_recorded_when_bulk_lookup_fails(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test queued state changes are recorded if the bulk id lookup raises.
+
+    This test is specific for SQLite: Locking is not implemented for other engines.
+    """
+    instance = await async_setup_recorder_instance(hass)
+
+    assert await instance.lock_database()
+    for idx in range(3):
+        hass.states.async_set(f"test.recorder_{idx}", "on", {"test_attr": idx})
+    await hass.async_block_till_done()
+
+    with patch.object(
+        instance, "_pre_process_event_batch", side_effect=ValueError("boom")
+    ):
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass)
+
+    assert "Error while pre processing events" in caplog.text
+
+    def _get_db_states() -> list[States]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(session.query(States))
+
+    db_states = await instance.async_add_executor_job(_get_db_states)
+    assert len(db_states) == 3
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
@@ -2188,6 +2287,35 @@ async def test_deduplication_state_attributes_inside_commit_interval(
         assert first_attributes_id == last_attributes_id
 
 
+async def test_serialize_unchanged_state_attributes_once(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test unchanged state attributes are only serialized once per entity."""
+    manager = state_attributes_table_manager.StateAttributesManager(get_instance(hass))
+    entity_id = "test.recorder"
+
+    def _serialize() -> bytes | None:
+        return manager.serialize_from_event(
+            Event(
+                EVENT_STATE_CHANGED,
+                {"entity_id": entity_id, "new_state": hass.states.get(entity_id)},
+            )
+        )
+
+    hass.states.async_set(entity_id, "on", {"test_attr": 5})
+    shared_attrs_bytes = _serialize()
+    assert shared_attrs_bytes == b'{"test_attr":5}'
+    hass.states.async_set(entity_id, "off", {"test_attr": 5})
+    assert _serialize() is shared_attrs_bytes
+
+    hass.states.async_set(entity_id, "on", {"test_attr": 6})
+    assert _serialize() == b'{"test_attr":6}'
+
+    hass.states.async_remove(entity_id)
+    assert _serialize() == b"{}"
+    assert not manager._serialized
+
+
 async def test_async_block_till_done(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -2383,6 +2511,81 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
     assert connect_params[0]["charset"] == "utf8mb4"
 
 
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_db_read_workers(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the db executor and connection pool scale with db_read_workers."""
+    instance = await async_setup_recorder_instance(hass, {CONF_DB_READ_WORKERS: 8})
+
+    assert instance._db_executor._max_workers == 8
+    # One connection per db executor worker plus the recorder thread
+    assert instance.engine.pool.size == 9
+    assert instance.read_engine is None
+
+
+async def test_db_read_url_rejects_sqlite() -> None:
+    """Test a SQLite read replica is rejected."""
+    with pytest.raises(vol.Invalid):
+        CONFIG_SCHEMA({DOMAIN: {CONF_DB_READ_URL: "sqlite:///replica.db"}})
+
+
+async def test_db_read_url_creates_read_engine(hass: HomeAssistant) -> None:
+    """Test a read replica engine is created with the recorder engine settings."""
+    recorder_helper.async_initialize_recorder(hass)
+    engine = Mock()
+    engine.dialect.name = "postgresql"
+    read_engine = Mock()
+    read_engine.dialect.name = "postgresql"
+
+    class MockEvent:
+        def listen(self, _, _2, callback):
+            callback(None, None)
+
+    with (
+        patch(
+            "homeassistant.components.recorder.core.create_engine",
+            side_effect=[engine, read_engine],
+        ) as create_engine_mock,
+        patch("homeassistant.components.recorder.core.sqlalchemy_event", MockEvent()),
+        patch("homeassistant.components.recorder.core.setup_connection_for_dialect"),
+    ):
+        await async_setup_component(
+            hass,
+            DOMAIN,
+            {
+                DOMAIN: {
+                    CONF_DB_URL: "postgresql://writer",
+                    CONF_DB_READ_URL: "postgresql://replica",
+                    CONF_DB_READ_WORKERS: 6,
+                }
+            },
+        )
+
+    assert create_engine_mock.mock_calls[0][1][0] == "postgresql://writer"
+    assert create_engine_mock.mock_calls[1][1][0] == "postgresql://replica"
+    assert create_engine_mock.mock_calls[1][2]["pool_size"] == 7
+    assert create_engine_mock.mock_calls[1][2]["echo"] is False
+
+
+async def test_get_read_session(hass: HomeAssistant) -> None:
+    """Test read-only sessions use the read replica except on the recorder thread."""
+    recorder_helper.async_initialize_recorder(hass)
+    instance = _default_recorder(hass)
+    session = Mock()
+    read_session = Mock()
+    instance._get_session = Mock(return_value=session)
+
+    assert instance.get_read_session() is session
+
+    instance._get_read_session = Mock(return_value=read_session)
+    assert instance.get_read_session() is read_session
+
+    instance.thread_id = threading.get_ident()
+    assert instance.get_read_session() is session
+
+
 async def test_excluding_attributes_by_integration(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
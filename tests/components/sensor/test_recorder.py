@@ -35,7 +35,13 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    SensorStateClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -306,6 +312,106 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_normalizes_only_unit_changes(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test only measurements with a changing unit are normalized from states."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+        freezer.move_to(zero)
+        four, _ = await async_record_states(
+            hass, freezer, zero, "sensor.test2", attributes
+        )
+        freezer.move_to(zero + timedelta(seconds=55))
+        hass.states.async_set(
+            "sensor.test2", "15", {**attributes, "unit_of_measurement": "kW"}
+        )
+        freezer.move_to(four)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as full_states_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    assert full_states_mock.call_count == 1
+    assert full_states_mock.call_args.kwargs["entity_ids"] == ["sensor.test2"]
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(13.050847),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                # Displayed in the current unit of the sensor
+                "mean": pytest.approx((-10 * 50 + 15000 * 200 + 30 * 45) / 295 / 1000),
+                "min": pytest.approx(-0.01),
+                "max": pytest.approx(15.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_compile_hourly_statistics_from_columns_without_mean(
+    hass: HomeAssistant,
+) -> None:
+    """Test measurements only get the wanted statistics from the columns."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "power",
+        "state_class": "measurement",
+        "unit_of_measurement": "W",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.dict(
+        sensor_recorder.DEFAULT_STATISTICS,
+        {SensorStateClass.MEASUREMENT: {"min", "max"}},
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    statistic_ids = await async_list_statistic_ids(hass)
+    assert statistic_ids[0]["has_mean"] is False
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] is None
+    assert stats["sensor.test1"][0]["min"] == pytest.approx(-10.0)
+    assert stats["sensor.test1"][0]["max"] == pytest.approx(30.0)
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
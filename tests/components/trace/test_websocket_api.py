@@ -8,7 +8,9 @@ from unittest.mock import patch
 
 import pytest
 from pytest_unordered import unordered
+import voluptuous as vol
 
+from homeassistant.components.trace import TRACE_CONFIG_SCHEMA
 from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
@@ -44,6 +46,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    trace_config: dict[str, Any] | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -67,6 +70,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -788,6 +795,65 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "failing_traces", "passing_traces"),
+    [
+        ({}, 4, 4),
+        ({"policy": "full"}, 4, 4),
+        ({"policy": "off"}, 0, 0),
+        ({"policy": "sampled"}, 1, 1),
+        ({"policy": "sampled", "sample_rate": 2}, 2, 2),
+        ({"policy": "on_error"}, 4, 0),
+    ],
+)
+async def test_trace_policy(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    failing_traces: int,
+    passing_traces: int,
+) -> None:
+    """Test the trace policy selects the runs which are traced."""
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"service": "test.automation"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config=trace_config
+    )
+
+    for _ in range(4):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"], domain, "sun")
+    assert len(sun_traces) == failing_traces
+    assert all(trace["script_execution"] == "error" for trace in sun_traces)
+    assert len(_find_traces(response["result"], domain, "moon")) == passing_traces
+
+
+@pytest.mark.parametrize("sample_rate", [0, -1, "abc"])
+async def test_trace_policy_invalid_sample_rate(sample_rate: Any) -> None:
+    """Test the sample rate must be a positive number."""
+    with pytest.raises(vol.Invalid):
+        vol.Schema(TRACE_CONFIG_SCHEMA)(
+            {"policy": "sampled", "sample_rate": sample_rate}
+        )
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
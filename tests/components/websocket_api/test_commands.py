@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.broadcast import DATA_ENTITY_SUBSCRIPTIONS
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -34,6 +36,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1072,13 +1075,19 @@ async def test_subscribe_unsubscribe_entities(
             }
         }
     }
+    # The state changes of one event loop iteration are sent as one
+    # message, let each change be sent on its own
     hass.states.async_set("light.not_permitted", "on")
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    await hass.async_block_till_done()
     hass.states.async_set("light.permitted", "on", {"effect": "help"})
+    await hass.async_block_till_done()
     hass.states.async_set(
         "light.permitted", "on", {"effect": "help", "color": ["blue", "green"]}
     )
+    await hass.async_block_till_done()
     hass.states.async_remove("light.permitted")
+    await hass.async_block_till_done()
     hass.states.async_set("light.permitted", "on", {"effect": "help", "color": "blue"})
 
     msg = await websocket_client.receive_json()
@@ -1310,6 +1319,242 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_between_clients(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscriptions with the same filter share a group."""
+    hass.states.async_set("light.kitchen", "off")
+    clients = [await hass_ws_client(hass) for _ in range(2)]
+    for client in clients:
+        await client.send_json_auto_id(
+            {"type": "subscribe_entities", "include": {"domains": ["light"]}}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["event"]["a"].keys() == {"light.kitchen"}
+
+    await clients[0].send_json_auto_id({"type": "entity_subscriptions/stats"})
+    msg = await clients[0].receive_json()
+    assert msg["result"]["groups"] == [
+        {
+            "entity_ids": None,
+            "filtered": True,
+            "coalesce_window": 0,
+            "subscriptions": 2,
+            "pending_changes": 0,
+        }
+    ]
+    assert len(msg["result"]["connections"]) == 2
+
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on")
+    for client in clients:
+        msg = await client.receive_json()
+        assert msg["id"] == 1
+        assert msg["event"] == {
+            "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+        }
+
+
+async def test_subscribe_entities_indexed_by_entity_id(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions for entity ids only see changes of those entities."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.kitchen"]}
+    )
+    await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+    for msg_id in (7, 7, 8, 8):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+
+    hub = hass.data[DATA_ENTITY_SUBSCRIPTIONS]
+    assert list(hub._groups_by_entity_id) == ["light.kitchen"]
+    assert len(hub._unkeyed_groups) == 1
+
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["c"].keys() == {"light.hallway", "light.kitchen"}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["c"].keys() == {"light.kitchen"}
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+    assert not hub._groups_by_entity_id
+    assert not hub._unkeyed_groups
+
+
+async def test_subscribe_entities_set_many(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the state changes of one event loop iteration are sent as one message."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.temporary", "on")
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.temporary"}
+
+    hass.states.async_set_many(
+        [
+            ("light.kitchen", "on", {"brightness": 10}),
+            ("light.hallway", "on", None),
+        ]
+    )
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    hass.states.async_remove("light.temporary")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {"light.hallway": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.kitchen": {
+                "+": {
+                    "a": {"brightness": 20},
+                    "c": ANY,
+                    "lc": ANY,
+                    "lu": ANY,
+                    "s": "on",
+                }
+            }
+        },
+        "r": ["light.temporary"],
+    }
+
+    await websocket_client.send_json({"id": 8, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test state changes within the coalesce window are sent as one message."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    hass.states.async_set("light.hallway", "on")
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 0.5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen", "light.hallway"}
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 30})
+    hass.states.async_remove("light.hallway")
+    hass.states.async_set("light.attic", "on")
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+    await hass.async_block_till_done()
+
+    freezer.tick(0.5)
+    async_fire_time_changed(hass)
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {"light.attic": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.kitchen": {"+": {"a": {"brightness": 30}, "c": ANY, "s": "on"}}},
+        "r": ["light.hallway"],
+    }
+
+
+async def test_subscribe_entities_coalesce_window_last_updated(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test last_updated is sent when it differs from a coalesced last_changed."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 10})
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 0.5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.kitchen"}
+
+    freezer.tick(0.1)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    freezer.tick(0.1)
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    state = hass.states.get("light.kitchen")
+    assert state.last_updated != state.last_changed
+    await hass.async_block_till_done()
+
+    freezer.tick(0.3)
+    async_fire_time_changed(hass)
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {
+                    "a": {"brightness": 20},
+                    "c": ANY,
+                    "lc": state.last_changed_timestamp,
+                    "lu": state.last_updated_timestamp,
+                    "s": "on",
+                }
+            }
+        },
+    }
+
+
+async def test_subscribe_entities_coalesce_window_permissions(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test coalesced state changes only include permitted entities."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 0.5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+    await hass.async_block_till_done()
+    freezer.tick(0.5)
+    async_fire_time_changed(hass)
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+
+async def test_entity_subscriptions_stats_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test entity subscription statistics require an admin."""
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 5, "type": "entity_subscriptions/stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2699,24 +2944,9 @@ async def test_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # The state changes of one event loop iteration are sent as one message
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
@@ -2745,6 +2975,7 @@ async def test_message_coalescing_not_supported_by_websocket_client(
     assert msg["success"]
 
     hass.states.async_set("light.permitted", "on", {"color": "red"})
+    await hass.async_block_till_done()
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
     data = await websocket_client.receive_str()
@@ -2818,24 +3049,9 @@ async def test_client_message_coalescing(
     hass.states.async_set("light.permitted", "on", {"color": "green"})
     hass.states.async_set("light.permitted", "on", {"color": "blue"})
 
+    # The state changes of one event loop iteration are sent as one message
     data = await websocket_client.receive_str()
-    msgs = json_loads(data)
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "yellow"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"a": {"color": "green"}, "c": ANY, "lu": ANY}}}
-    }
-
-    msg = msgs.pop(0)
+    msg = json_loads(data)
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
@@ -2875,8 +3091,8 @@ async def test_subscribe_entities_chained_state_change(
 ) -> None:
     """Test chaining state changed events.
 
-    Ensure the websocket sends the off state after
-    the on state.
+    Ensure the websocket sends the off state set by the
+    listener of the on state.
     """
 
     @callback
@@ -2905,15 +3121,9 @@ async def test_subscribe_entities_chained_state_change(
     assert msg["id"] == 7
     assert msg["type"] == "event"
     assert msg["event"] == {
-        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
-    }
-    data = await websocket_client.receive_str()
-    msg = json_loads(data)
-    assert msg["id"] == 7
-    assert msg["type"] == "event"
-    assert msg["event"] == {
-        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}}
     }
+    assert hass.states.get("light.permitted").state == "off"
 
     await websocket_client.close()
     await hass.async_block_till_done()
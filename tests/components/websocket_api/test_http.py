@@ -10,16 +10,28 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
 )
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -451,6 +463,272 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_compress_min_size(
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+    socket_enabled: None,
+) -> None:
+    """Test small messages are not compressed when the client asks for it."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    websocket = await client.ws_connect(const.URL, compress=15)
+    assert websocket.compress == 15
+    assert (await websocket.receive_json())["type"] == TYPE_AUTH_REQUIRED
+    await websocket.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+    assert (await websocket.receive_json())["type"] == TYPE_AUTH_OK
+
+    with patch.object(
+        http, "_async_send_uncompressed", wraps=http._async_send_uncompressed
+    ) as send_uncompressed:
+        await websocket.send_json({"id": 1, "type": "ping"})
+        assert (await websocket.receive_json())["type"] == "pong"
+        assert not send_uncompressed.called
+
+        await websocket.send_json(
+            {
+                "id": 2,
+                "type": "supported_features",
+                "features": {const.FEATURE_COMPRESS_MIN_SIZE: 1000},
+            }
+        )
+        assert (await websocket.receive_json())["success"]
+        assert send_uncompressed.call_count == 1
+
+        await websocket.send_json({"id": 3, "type": "ping"})
+        assert (await websocket.receive_json())["type"] == "pong"
+        assert send_uncompressed.call_count == 2
+
+        # Compressed messages can still be read after uncompressed ones
+        hass.states.async_set("light.kitchen", "on", {"effect_list": ["a" * 1000]})
+        await websocket.send_json({"id": 4, "type": "get_states"})
+        assert (await websocket.receive_json())["result"][0]["state"] == "on"
+        assert send_uncompressed.call_count == 2
+
+    await websocket.close()
+
+
+async def test_batch_answers_sent_together(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the answers to commands sent in one frame are sent in one frame."""
+    release = asyncio.Event()
+
+    @websocket_command({"type": "slow_responder"})
+    @async_response
+    async def async_slow_responder(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        await release.wait()
+        connection.send_result(msg["id"], "slow")
+
+    async_register_command(hass, async_slow_responder)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json(
+        [
+            {"id": 2, "type": "ping"},
+            {"id": 3, "type": "slow_responder"},
+            {"id": 4, "type": "ping"},
+        ]
+    )
+    with pytest.raises(TimeoutError):
+        await websocket_client.receive_str(timeout=0.1)
+
+    release.set()
+    answers = json_loads(await websocket_client.receive_str())
+    assert [(answer["id"], answer["type"]) for answer in answers] == [
+        (2, "pong"),
+        (4, "pong"),
+        (3, "result"),
+    ]
+
+
+async def test_batch_answers_released_after_max_wait(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test answers are not held forever when a batched command is slow."""
+
+    @websocket_command({"type": "silent"})
+    @callback
+    def async_silent(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        """Never answer."""
+
+    async_register_command(hass, async_silent)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    with patch.object(http, "BATCH_MAX_WAIT", 0.05):
+        await websocket_client.send_json(
+            [{"id": 2, "type": "silent"}, {"id": 3, "type": "ping"}]
+        )
+        msg = await websocket_client.receive_json(timeout=1)
+    assert msg["id"] == 3
+
+
+async def test_batch_does_not_hold_other_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test only the answers to a batch are held, not other messages."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    @websocket_command({"type": "slow_responder"})
+    @async_response
+    async def async_slow_responder(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        started.set()
+        await release.wait()
+        connection.send_result(msg["id"], "slow")
+
+    async_register_command(hass, async_slow_responder)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json(
+        [{"id": 3, "type": "ping"}, {"id": 4, "type": "slow_responder"}]
+    )
+    await started.wait()
+    hass.bus.async_fire("test_event")
+    msg = await websocket_client.receive_json(timeout=0.4)
+    assert msg["id"] == 2
+    assert msg["type"] == "event"
+
+    release.set()
+    answers = json_loads(await websocket_client.receive_str())
+    assert [(answer["id"], answer["type"]) for answer in answers] == [
+        (3, "pong"),
+        (4, "result"),
+    ]
+
+
+async def test_batch_max_wait_not_extended_by_later_batches(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a later batch does not extend how long answers are held."""
+
+    @websocket_command({"type": "silent"})
+    @callback
+    def async_silent(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        """Never answer."""
+
+    async_register_command(hass, async_silent)
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    with patch.object(http, "BATCH_MAX_WAIT", 0.2):
+        await websocket_client.send_json(
+            [{"id": 2, "type": "silent"}, {"id": 3, "type": "ping"}]
+        )
+        await asyncio.sleep(0.05)
+    with patch.object(http, "BATCH_MAX_WAIT", 60):
+        await websocket_client.send_json(
+            [{"id": 4, "type": "silent"}, {"id": 5, "type": "ping"}]
+        )
+        answers = json_loads(await websocket_client.receive_str(timeout=1))
+    assert [(answer["id"], answer["type"]) for answer in answers] == [
+        (3, "pong"),
+        (5, "pong"),
+    ]
+
+
+async def test_batch_subscription_result_not_held(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the result of a batched subscription arrives before its events."""
+    release = asyncio.Event()
+
+    @websocket_command({"type": "slow_responder"})
+    @async_response
+    async def async_slow_responder(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        await release.wait()
+        connection.send_result(msg["id"], "slow")
+
+    async_register_command(hass, async_slow_responder)
+    hass.states.async_set("light.kitchen", "on")
+    websocket_client = await hass_ws_client(hass)
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    assert (await websocket_client.receive_json())["success"]
+
+    await websocket_client.send_json(
+        [
+            {"id": 2, "type": "subscribe_entities"},
+            {"id": 3, "type": "slow_responder"},
+        ]
+    )
+    messages = json_loads(await websocket_client.receive_str())
+    assert [(message["id"], message["type"]) for message in messages] == [
+        (2, "result"),
+        (2, "event"),
+    ]
+
+    release.set()
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 3
+    assert msg["result"] == "slow"
+
+
+@pytest.mark.parametrize(
+    ("message", "message_id"),
+    [
+        (b'{"id":12,"type":"result","success":true,"result":null}', 12),
+        (b'{"id":5,"type":"pong"}', 5),
+        (b'{"id":5,"type":"event","event":{}}', None),
+        (b'{"type":"result","id":5}', None),
+        (b'{"id":"x","type":"result"}', None),
+    ],
+)
+def test_answered_message_id(message: bytes, message_id: int | None) -> None:
+    """Test reading the id of the command a message answers."""
+    assert http._answered_message_id(message) == message_id
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -335,6 +335,19 @@ def skip_stop_scripts(
         yield
 
 
+@pytest.fixture(autouse=True)
+def skip_manifest_index_save(request: pytest.FixtureRequest) -> Generator[None]:
+    """Do not write the integration index to the test config dir.
+
+    Tests using the hass_storage fixture keep saving it to the mocked storage.
+    """
+    if "hass_storage" in request.fixturenames:
+        yield
+        return
+    with patch("homeassistant.loader._async_save_manifest_index"):
+        yield
+
+
 @contextmanager
 def long_repr_strings() -> Generator[None]:
     """Increase reprlib maxstring and maxother to 300."""
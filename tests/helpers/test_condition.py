@@ -1,6 +1,7 @@
 """Test the condition helper."""
 
 from datetime import datetime, timedelta
+import logging
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -3668,3 +3669,114 @@ async def test_or_condition_with_disabled_condition(hass: HomeAssistant) -> None
             "conditions/1/entity_id/0": [{"result": {"result": True, "state": 100.0}}],
         }
     )
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            "condition": "and",
+            "conditions": [
+                {"condition": "state", "entity_id": "light.kitchen", "state": "on"},
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.temperature",
+                    "below": 110,
+                },
+            ],
+        },
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": ["light.kitchen", "light.missing"],
+                    "state": ["on", "unavailable"],
+                    "match": "any",
+                },
+                {
+                    "condition": "template",
+                    "value_template": "{{ states('sensor.temperature') | int > 50 }}",
+                },
+            ],
+        },
+        {
+            "condition": "not",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "light.kitchen",
+                    "attribute": "brightness",
+                    "state": 255,
+                },
+                {"condition": "time", "after": "00:00:00", "before": "00:00:01"},
+                {"condition": "state", "entity_id": "light.missing", "state": "on"},
+            ],
+        },
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "light.kitchen",
+                    "state": "on",
+                    "enabled": False,
+                },
+                {"condition": "trigger", "id": "event"},
+            ],
+        },
+    ],
+)
+@pytest.mark.parametrize(
+    ("kitchen", "temperature"), [("on", "100"), ("off", "120"), ("off", "30")]
+)
+async def test_untraced_condition_matches_traced(
+    hass: HomeAssistant, config: dict[str, Any], kitchen: str, temperature: str
+) -> None:
+    """Test conditions evaluated without a trace give the traced result."""
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+    hass.states.async_set("light.kitchen", kitchen, {"brightness": 255})
+    hass.states.async_set("sensor.temperature", temperature)
+    variables = {"trigger": {"id": "event"}}
+
+    def evaluate() -> Any:
+        try:
+            return test(hass, variables)
+        except ConditionError as ex:
+            return str(ex)
+
+    traced = evaluate()
+    assert trace.trace_get(clear=False)
+
+    trace.trace_cv.set(None)
+    with patch(
+        "homeassistant.helpers.condition.trace_condition",
+        side_effect=AssertionError("should not trace"),
+    ):
+        assert evaluate() == traced
+    assert trace.trace_cv.get() is None
+
+
+async def test_untraced_conditions_from_config(hass: HomeAssistant) -> None:
+    """Test a list of conditions is not traced when no trace is collected."""
+    check = await condition.async_conditions_from_config(
+        hass,
+        [
+            await condition.async_validate_condition_config(
+                hass,
+                cv.CONDITION_SCHEMA(
+                    {"condition": "state", "entity_id": "light.kitchen", "state": "on"}
+                ),
+            )
+        ],
+        logging.getLogger(__name__),
+        "test",
+    )
+    trace.trace_cv.set(None)
+
+    assert not check()
+    hass.states.async_set("light.kitchen", "on")
+    assert check()
+    assert trace.trace_cv.get() is None
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -37,6 +38,7 @@ from homeassistant.helpers.event import (
     async_track_same_state,
     async_track_state_added_domain,
     async_track_state_change,
+    async_track_state_change_batch,
     async_track_state_change_event,
     async_track_state_change_filtered,
     async_track_state_removed_domain,
@@ -444,6 +446,43 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_batch(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_batch."""
+    batches = []
+
+    @ha.callback
+    def batch_callback(events):
+        batches.append(events)
+
+    unsub = async_track_state_change_batch(hass, batch_callback)
+
+    hass.states.async_set_many(
+        [("light.bowl", "on", None), ("light.ceiling", "off", None)]
+    )
+    hass.states.async_set("switch.fan", "on")
+    await hass.async_block_till_done()
+
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.bowl",
+        "light.ceiling",
+        "switch.fan",
+    ]
+
+    hass.states.async_set("light.bowl", "off")
+    await hass.async_block_till_done()
+
+    assert len(batches) == 2
+    assert batches[1][0].data["new_state"].state == "off"
+
+    # Pending changes are dropped when unsubscribing before delivery
+    hass.states.async_set("light.bowl", "on")
+    unsub()
+    await hass.async_block_till_done()
+
+    assert len(batches) == 2
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -1756,6 +1795,98 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_state_only_skips_attribute_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates only reading the state skip attribute only changes."""
+    hass.states.async_set("sensor.test", "5", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.other", "on")
+    state_only = Template("{{ states('sensor.test') }}", hass)
+    with_attributes = Template(
+        "{{ states('sensor.other') }}"
+        " {{ state_attr('sensor.test', 'unit_of_measurement') }}",
+        hass,
+    )
+    renders: dict[str, int] = {}
+
+    original_render_to_info = Template.async_render_to_info
+
+    def _count_renders(self: Template, *args: Any, **kwargs: Any) -> Any:
+        renders[self.template] = renders.get(self.template, 0) + 1
+        return original_render_to_info(self, *args, **kwargs)
+
+    runs = []
+
+    @ha.callback
+    def _refresh(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.result for update in updates)
+
+    with patch.object(Template, "async_render_to_info", _count_renders):
+        info = async_track_template_result(
+            hass,
+            [TrackTemplate(state_only, None), TrackTemplate(with_attributes, None)],
+            _refresh,
+        )
+        assert renders == {state_only.template: 1, with_attributes.template: 1}
+
+        hass.states.async_set("sensor.test", "5", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert renders == {state_only.template: 1, with_attributes.template: 2}
+        assert runs == ["on kW"]
+
+        hass.states.async_set("sensor.test", "6", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert renders == {state_only.template: 2, with_attributes.template: 3}
+        assert runs == ["on kW", 6]
+
+        hass.states.async_remove("sensor.test")
+        await hass.async_block_till_done()
+        assert renders == {state_only.template: 3, with_attributes.template: 4}
+
+    info.async_remove()
+
+
+async def test_track_template_result_domain_state_only_skips_attribute_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates only reading the state of a domain skip attribute changes."""
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "2", {"unit_of_measurement": "W"})
+    template_sum = Template(
+        "{{ states.sensor | map(attribute='state') | map('int') | sum }}", hass
+    )
+    runs = []
+
+    @ha.callback
+    def _refresh(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.result for update in updates)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None, None)], _refresh
+    )
+    assert info.listeners["domains"] == {"sensor"}
+
+    with patch.object(
+        Template, "async_render_to_info", wraps=template_sum.async_render_to_info
+    ) as render_mock:
+        hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 0
+
+        hass.states.async_set("sensor.one", "3", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert render_mock.call_count == 1
+
+    assert runs == [5]
+    info.async_remove()
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
@@ -39,6 +39,8 @@ from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
     service,
 )
 from homeassistant.loader import async_get_integration
@@ -46,6 +48,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
+    MockConfigEntry,
     MockEntity,
     MockModule,
     MockUser,
@@ -801,6 +804,65 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_follows_registry_updates(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    floor_registry: fr.FloorRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test targets resolve to the current registry contents."""
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    floor = floor_registry.async_create("Ground floor")
+    kitchen = area_registry.async_create("Kitchen", floor_id=floor.floor_id)
+    hallway = area_registry.async_create("Hallway")
+    label = label_registry.async_create("Lights")
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "device")},
+    )
+    entity_registry.async_get_or_create(
+        "light", "test", "ceiling", device_id=device.id, suggested_object_id="ceiling"
+    )
+    entity_registry.async_get_or_create(
+        "light", "test", "spot", suggested_object_id="spot"
+    )
+
+    async def extract(target: dict[str, str]) -> set[str]:
+        return await service.async_extract_entity_ids(
+            hass, ServiceCall(hass, "light", "turn_on", target)
+        )
+
+    assert await extract({"device_id": device.id}) == {"light.ceiling"}
+    assert await extract({"area_id": kitchen.id}) == set()
+    assert await extract({"floor_id": floor.floor_id}) == set()
+    assert await extract({"label_id": label.label_id}) == set()
+
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    entity_registry.async_update_entity("light.spot", area_id=kitchen.id)
+    entity_registry.async_update_entity("light.ceiling", labels={label.label_id})
+
+    assert await extract({"area_id": kitchen.id}) == {"light.ceiling", "light.spot"}
+    assert await extract({"floor_id": floor.floor_id}) == {
+        "light.ceiling",
+        "light.spot",
+    }
+    assert await extract({"label_id": label.label_id}) == {"light.ceiling"}
+
+    area_registry.async_update(kitchen.id, floor_id=None)
+    entity_registry.async_update_entity(
+        "light.ceiling", hidden_by=er.RegistryEntryHider.USER
+    )
+    entity_registry.async_update_entity("light.spot", area_id=hallway.id)
+
+    assert await extract({"device_id": device.id}) == set()
+    assert await extract({"area_id": kitchen.id}) == set()
+    assert await extract({"area_id": hallway.id}) == {"light.spot"}
+    assert await extract({"floor_id": floor.floor_id}) == set()
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -0,0 +1,139 @@
+"""Test the startup trace helper."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.setup import SetupPhases, async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def _trace_with_spans() -> startup_trace.StartupTrace:
+    """Return a trace where zone -> person -> default_config is the longest chain."""
+    trace = startup_trace.StartupTrace()
+    start = trace.started
+    trace.add("zone", SetupPhases.SETUP, start, start + 1)
+    trace.add("http", SetupPhases.SETUP, start, start + 3)
+    trace.add(
+        "person",
+        startup_trace.CATEGORY_WAIT_DEPENDENCIES,
+        start,
+        start + 1,
+        dependencies=["zone"],
+    )
+    trace.add("person", SetupPhases.SETUP, start + 1, start + 4)
+    trace.add(
+        "default_config",
+        startup_trace.CATEGORY_WAIT_DEPENDENCIES,
+        start,
+        start + 4,
+        dependencies=["http", "person"],
+    )
+    trace.add("default_config", startup_trace.CATEGORY_IMPORT, start + 4, start + 5)
+    trace.add("default_config", SetupPhases.SETUP, start + 5, start + 6)
+    trace.add(
+        "default_config",
+        SetupPhases.CONFIG_ENTRY_SETUP,
+        start + 6,
+        start + 7,
+        group="entry_1",
+    )
+    return trace
+
+
+def test_critical_path() -> None:
+    """Test the critical path follows the dependency that finished last."""
+    trace = _trace_with_spans()
+
+    path = trace.critical_path()
+
+    assert [entry.domain for entry in path] == ["zone", "person", "default_config"]
+    assert path[-1].durations == {
+        startup_trace.CATEGORY_WAIT_DEPENDENCIES: 4,
+        startup_trace.CATEGORY_IMPORT: 1,
+        SetupPhases.SETUP: 1,
+        SetupPhases.CONFIG_ENTRY_SETUP: 1,
+    }
+    assert trace.format_critical_path().splitlines() == [
+        "zone: 0.00s -> 1.00s (setup=1.00s)",
+        "person: 0.00s -> 4.00s (setup=3.00s, wait_dependencies=1.00s)",
+        (
+            "default_config: 0.00s -> 7.00s (wait_dependencies=4.00s,"
+            " import=1.00s, setup=1.00s, config_entry_setup=1.00s)"
+        ),
+    ]
+
+
+def test_critical_path_empty() -> None:
+    """Test the critical path of an empty trace."""
+    assert startup_trace.StartupTrace().critical_path() == []
+
+
+def test_chrome_trace() -> None:
+    """Test exporting the spans as a Chrome trace."""
+    trace = _trace_with_spans()
+
+    events = trace.as_chrome_trace()["traceEvents"]
+
+    rows = {
+        event["args"]["name"]: event["tid"] for event in events if event["ph"] == "M"
+    }
+    assert set(rows) == {
+        "zone",
+        "http",
+        "person",
+        "default_config",
+        "default_config (entry_1)",
+    }
+    config_entry_setup = next(
+        event
+        for event in events
+        if event["ph"] == "X" and event["cat"] == SetupPhases.CONFIG_ENTRY_SETUP
+    )
+    assert config_entry_setup["tid"] == rows["default_config (entry_1)"]
+    assert config_entry_setup["ts"] == 6_000_000
+    assert config_entry_setup["dur"] == 1_000_000
+
+
+async def test_setup_records_spans(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test setting up integrations records spans when the trace is enabled."""
+    hass.config.config_dir = str(tmp_path)
+    # Setup times are only tracked while starting
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("base"))
+    mock_integration(hass, MockModule("child", dependencies=["base"]))
+    trace = startup_trace.async_enable(hass)
+
+    assert await async_setup_component(hass, "child", {})
+
+    categories = {(span.domain, span.category) for span in trace.spans}
+    assert {
+        ("base", SetupPhases.SETUP),
+        ("child", SetupPhases.SETUP),
+        ("child", startup_trace.CATEGORY_WAIT_DEPENDENCIES),
+        ("child", startup_trace.CATEGORY_REQUIREMENTS),
+    } <= categories
+    assert [entry.domain for entry in trace.critical_path()] == ["base", "child"]
+
+    await startup_trace.async_finish(hass)
+    assert startup_trace.async_get_startup_trace(hass) is None
+    data = json.loads((tmp_path / startup_trace.STARTUP_TRACE_FILE).read_text())
+    assert data["traceEvents"]
+
+
+async def test_finish_write_error(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a failure writing the trace is logged and does not raise."""
+    hass.config.config_dir = str(tmp_path / "missing")
+    startup_trace.async_enable(hass)
+
+    await startup_trace.async_finish(hass)
+
+    assert startup_trace.async_get_startup_trace(hass) is None
+    assert "Error writing startup trace" in caplog.text
+    assert "Startup trace written" not in caplog.text
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1180,172 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+def _read_json(path: str) -> dict[str, Any]:
+    """Read a JSON file."""
+    with open(path, encoding="utf8") as file:
+        return json.load(file)
+
+
+def _read_journal(path: str) -> list[dict[str, Any]]:
+    """Read the entries of a journal."""
+    with open(path, encoding="utf8") as file:
+        return [json.loads(line) for line in file]
+
+
+def _append_journal(path: str, data: bytes) -> None:
+    """Append raw data to a journal."""
+    with open(path, "ab") as file:
+        file.write(data)
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changed records are appended to the journal."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        item_1 = json_fragment(json_bytes({"id": "1", "name": "one"}))
+        item_2 = json_fragment(json_bytes({"id": "2", "name": "two"}))
+        await store.async_save({"items": [item_1, item_2]})
+        assert not os.path.exists(journal_path)
+
+        item_2 = json_fragment(json_bytes({"id": "2", "name": "changed"}))
+        item_3 = {"id": "3", "name": "three"}
+        await store.async_save({"items": [item_1, item_2, item_3]})
+        await store.async_save({"items": [item_2, item_3]})
+        # Nothing changed
+        await store.async_save({"items": [item_2, {"id": "3", "name": "three"}]})
+
+        base = await hass.async_add_executor_job(_read_json, store.path)
+        assert base["data"] == {
+            "items": [{"id": "1", "name": "one"}, {"id": "2", "name": "two"}]
+        }
+        entries = await hass.async_add_executor_job(_read_journal, journal_path)
+        assert entries == [
+            {
+                "journal": base["journal"],
+                "upsert": {
+                    "items": [
+                        {"id": "2", "name": "changed"},
+                        {"id": "3", "name": "three"},
+                    ]
+                },
+                "remove": {},
+            },
+            {"journal": base["journal"], "upsert": {}, "remove": {"items": ["1"]}},
+        ]
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        assert await store.async_load() == {
+            "items": [{"id": "2", "name": "changed"}, {"id": "3", "name": "three"}]
+        }
+
+        # The first write of a store writes the full file
+        await store.async_save({"items": [{"id": "4", "name": "four"}]})
+        assert not os.path.exists(journal_path)
+        assert (await hass.async_add_executor_job(_read_json, store.path))["data"] == {
+            "items": [{"id": "4", "name": "four"}]
+        }
+
+        await store.async_remove()
+        assert not os.path.exists(store.path)
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the file."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": "item"} for idx in range(10)]
+        await store.async_save({"items": items, "other": 1})
+
+        with patch.object(storage, "JOURNAL_MAX_ENTRIES", 2):
+            for idx in range(2):
+                items[idx] = {"id": str(idx), "name": "changed"}
+                await store.async_save({"items": items, "other": 1})
+            assert os.path.exists(journal_path)
+
+            items[2] = {"id": "2", "name": "changed"}
+            await store.async_save({"items": items, "other": 1})
+            assert not os.path.exists(journal_path)
+
+            items[3] = {"id": "3", "name": "changed"}
+            await store.async_save({"items": items, "other": 1})
+            assert os.path.exists(journal_path)
+
+        # Changes outside of the records write the full file
+        await store.async_save({"items": items, "other": 2})
+        assert not os.path.exists(journal_path)
+        assert (await hass.async_add_executor_job(_read_json, store.path))["data"] == {
+            "items": items,
+            "other": 2,
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignores_stale_and_incomplete_entries(
+    tmpdir: py.path.local,
+) -> None:
+    """Test entries of another journal and incomplete entries are ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        await store.async_save({"items": [{"id": "1"}, {"id": "2"}]})
+        await store.async_save({"items": [{"id": "2"}, {"id": "3"}]})
+
+        await hass.async_add_executor_job(
+            _append_journal,
+            f"{store.path}{storage.JOURNAL_SUFFIX}",
+            json_bytes(
+                {
+                    "journal": "stale",
+                    "upsert": {"items": [{"id": "4"}]},
+                    "remove": {},
+                }
+            )
+            + b"\n"
+            + b'{"journal": "incomplete',
+        )
+
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        assert await store.async_load() == {"items": [{"id": "2"}, {"id": "3"}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_stop(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the file when Home Assistant stops."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_keys={"items": "id"}
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        await store.async_save({"items": [{"id": "1"}], "other": 1})
+        await store.async_save({"items": [{"id": "1"}, {"id": "2"}], "other": 1})
+        assert await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        await hass.async_stop(force=True)
+
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        data = await hass.async_add_executor_job(_read_json, store.path)
+        assert data["data"] == {"other": 1, "items": [{"id": "1"}, {"id": "2"}]}
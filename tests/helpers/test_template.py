@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
@@ -22,6 +23,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfArea,
@@ -4929,6 +4931,65 @@ async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+async def test_async_render_to_info_entities_state_only(hass: HomeAssistant) -> None:
+    """Test entities where only the state was read are tracked separately."""
+    hass.states.async_set("sensor.a", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.b", "2")
+    hass.states.async_set("light.c", "on")
+
+    info = template.Template(
+        "{{ states('sensor.a') }} {{ states.sensor.b.state }}"
+        " {{ is_state('light.c', 'on') }}",
+        hass,
+    ).async_render_to_info()
+    assert_result_info(info, "1 2 True", ["sensor.a", "sensor.b", "light.c"])
+    assert info.entities_state_only == {"sensor.a", "sensor.b", "light.c"}
+
+    info = template.Template(
+        "{{ states('sensor.a') }} {{ states.sensor.a.attributes.unit_of_measurement }}"
+        " {{ states('sensor.b', with_unit=True) }} {{ states.light.c.last_changed }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities == {"sensor.a", "sensor.b", "light.c"}
+    assert not info.entities_state_only
+
+    info = template.Template(
+        "{{ states('sensor.a') }} {{ states('light.c') }}"
+        " {{ states.sensor | map(attribute='name') | list | count }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities == {"sensor.a", "light.c"}
+    assert info.entities_state_only == {"light.c"}
+
+    info = template.Template(
+        "{{ states('sensor.a') }} {{ states | list | count }}", hass
+    ).async_render_to_info()
+    assert info.all_states
+    assert info.entities_state_only == {"sensor.a"}
+    assert info.is_state_only("sensor.b")
+
+    info = template.Template(
+        "{{ states.sensor | map(attribute='state') | join(',') }}"
+        " {{ states.light | map(attribute='name') | join(',') }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities_iterated == {"light.c"}
+    assert info.is_state_only("sensor.a")
+    assert not info.is_state_only("light.c")
+    assert not info.is_state_only("switch.d")
+
+    info = template.Template(
+        "{{ states | selectattr('attributes.unit_of_measurement', 'defined')"
+        " | map(attribute='entity_id') | list }}",
+        hass,
+    ).async_render_to_info()
+    assert info.entities_iterated == {"sensor.a", "sensor.b", "light.c"}
+    assert not info.is_state_only("sensor.b")
+
+    info = template.Template("{{ states.sensor | list }}", hass).async_render_to_info()
+    assert info.entities_iterated == {"sensor.a", "sensor.b"}
+
+
 def test_jinja_namespace(hass: HomeAssistant) -> None:
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
@@ -5189,6 +5250,67 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_bytecode_cache_persists_compiled_templates(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test compiled templates are reused from the bytecode cache after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    template_string = "{{ 'persisted' | upper }}"
+
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(template_string, hass).async_render() == "PERSISTED"
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert (tmp_path / ".storage" / template.BYTECODE_CACHE_FILE).exists()
+
+    # Simulate a restart with fresh environments
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        template.ImmutableSandboxedEnvironment, "compile"
+    ) as compile_mock:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == "PERSISTED"
+    compile_mock.assert_not_called()
+
+
+async def test_bytecode_cache_discarded_on_version_change(tmp_path: Path) -> None:
+    """Test the bytecode cache is discarded when the header changes."""
+    path = str(tmp_path / template.BYTECODE_CACHE_FILE)
+    code = template._NO_HASS_ENV.compile("{{ 1 + 1 }}")
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    bytecode_cache.set("key", code)
+    bytecode_cache.save(bytecode_cache.async_snapshot())
+    assert bytecode_cache.async_snapshot() is None
+
+    bytecode_cache = template.TemplateBytecodeCache(path)
+    bytecode_cache.load()
+    assert bytecode_cache.get("key") == code
+
+    with patch.object(template, "__version__", "0.0.0"):
+        bytecode_cache = template.TemplateBytecodeCache(path)
+        bytecode_cache.load()
+    assert bytecode_cache.get("key") is None
+
+
+@pytest.mark.parametrize(
+    "corrupt", [lambda data: data[:-10], lambda data: data[:-20] + bytes(20)]
+)
+async def test_bytecode_cache_discarded_when_corrupt(
+    tmp_path: Path, corrupt: Callable[[bytes], bytes]
+) -> None:
+    """Test a truncated or corrupt bytecode cache is discarded."""
+    path = tmp_path / template.BYTECODE_CACHE_FILE
+    bytecode_cache = template.TemplateBytecodeCache(str(path))
+    bytecode_cache.set("key", template._NO_HASS_ENV.compile("{{ 1 + 1 }}"))
+    bytecode_cache.save(bytecode_cache.async_snapshot())
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    bytecode_cache = template.TemplateBytecodeCache(str(path))
+    bytecode_cache.load()
+    assert bytecode_cache.get("key") is None
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
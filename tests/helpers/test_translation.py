@@ -13,6 +13,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.setup import async_setup_component
 
+from tests.common import reset_translation_cache
+
 
 @pytest.fixture(autouse=True)
 def _disable_translations_once(disable_translations_once: None) -> None:
@@ -577,6 +579,34 @@ async def test_get_cached_translations(hass: HomeAssistant, mock_config_flows) -
     }
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_categories_flattened_on_demand(hass: HomeAssistant) -> None:
+    """Test categories are only flattened when they are requested."""
+    reset_translation_cache(hass, ["test"])
+    cache = translation._async_get_translations_cache(hass)
+    await cache.async_load("es", {"test"})
+    cache_data = cache.cache_data
+
+    # Both the English fallback and the translation are pending
+    assert len(cache_data.pending["es"]["entity"]["test"]) == 2
+    assert "test" not in cache_data.cache.get("es", {}).get("entity", {})
+
+    translations = translation.async_get_cached_translations(
+        hass, "es", "entity", "test"
+    )
+    assert translations["component.test.entity.switch.other1.name"] == "Otra 1"
+    assert "test" not in cache_data.pending["es"]["entity"]
+    assert cache_data.cache["es"]["entity"]["test"] is translations
+    # Unrequested categories stay pending
+    assert "test" in cache_data.pending["es"]["something"]
+    assert "test" not in cache_data.cache["es"].get("something", {})
+
+    assert translation.async_get_cached_translations(
+        hass, "es", "something", "test"
+    ) == {"component.test.something": "else"}
+    assert "test" not in cache_data.pending["es"]["something"]
+
+
 async def test_setup(hass: HomeAssistant) -> None:
     """Test the setup load listeners helper."""
     translation.async_setup(hass)
@@ -7,6 +7,7 @@ import pytest
 
 from homeassistant.config import YAML_CONFIG_FILE
 from homeassistant.scripts import check_config
+from homeassistant.util.yaml import loader as yaml_loader
 
 from tests.common import get_test_config_dir
 
@@ -146,6 +147,10 @@ def test_secrets() -> None:
         ".../configuration.yaml",
         ".../secrets.yaml",
     ]
+    # The default constructors are restored so parsed files are reused again
+    assert yaml_loader.FastSafeLoader.yaml_constructors == (
+        yaml_loader._DEFAULT_CONSTRUCTORS
+    )
 
 
 @pytest.mark.parametrize(
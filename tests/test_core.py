@@ -1165,6 +1165,144 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only receive events with a matching data value."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", "light.kitchen", listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": ["unhashable"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    assert "test" not in hass.bus._keyed_listeners
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_listener_with_regular_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed and regular listeners of the same event type both fire in order."""
+    calls = []
+
+    @ha.callback
+    def regular_listener_before(event):
+        """Mock regular listener registered before the keyed listeners."""
+        calls.append(("before", event.data["entity_id"]))
+
+    @ha.callback
+    def keyed_listener(event):
+        """Mock keyed listener."""
+        calls.append(("keyed", event.data["entity_id"]))
+
+    @ha.callback
+    def regular_listener_after(event):
+        """Mock regular listener registered after the keyed listeners."""
+        calls.append(("after", event.data["entity_id"]))
+
+    unsubs = [
+        hass.bus.async_listen("test", regular_listener_before),
+        hass.bus.async_listen_keyed(
+            "test", "entity_id", "light.kitchen", keyed_listener
+        ),
+        hass.bus.async_listen("test", regular_listener_after),
+    ]
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hallway"})
+    await hass.async_block_till_done()
+
+    assert calls == [
+        ("before", "light.kitchen"),
+        ("keyed", "light.kitchen"),
+        ("after", "light.kitchen"),
+        ("before", "light.hallway"),
+        ("after", "light.hallway"),
+    ]
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_eventbus_keyed_listener_none_value(hass: HomeAssistant) -> None:
+    """Test keyed listeners can match a None value but not a missing key."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "old_state", None, listener)
+
+    hass.bus.async_fire("test", {"old_state": "on"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"old_state": None})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"old_state": None}
+    unsub()
+
+
+async def test_eventbus_keyed_listener_remove_during_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test a keyed listener can remove itself while the event is dispatched."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that removes itself."""
+        calls.append(event)
+        unsub()
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", "light.kitchen", listener)
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "entity_id", "light.kitchen", other_listener
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 3
+    unsub_other()
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test keyed listeners can not be registered for MATCH_ALL."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(
+            MATCH_ALL, "entity_id", "light.kitchen", MagicMock()
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1698,72 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test async_set_many writes all states with a shared timestamp."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.ceiling", "off")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events = []
+
+    @ha.callback
+    def reported_listener(event):
+        """Capture state reported events."""
+        reported_events.append(event)
+
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_REPORTED, "entity_id", "light.bowl", reported_listener
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.ceiling", "on", None),
+            ("light.new", "off", {"friendly_name": "New"}),
+        ],
+        timestamp=1234.5,
+    )
+    await hass.async_block_till_done()
+
+    assert len(reported_events) == 1
+    assert reported_events[0].data["entity_id"] == "light.bowl"
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.ceiling",
+        "light.new",
+    ]
+    # Each state gets its own context
+    assert (
+        len(
+            {
+                changed_events[0].context.id,
+                changed_events[1].context.id,
+                reported_events[0].context.id,
+            }
+        )
+        == 3
+    )
+
+    ceiling = hass.states.get("light.ceiling")
+    new = hass.states.get("light.new")
+    assert ceiling.state == "on"
+    assert ceiling.last_updated_timestamp == 1234.5
+    assert new.attributes == {"friendly_name": "New"}
+    assert new.last_updated_timestamp == 1234.5
+
+
+async def test_statemachine_set_many_context(hass: HomeAssistant) -> None:
+    """Test async_set_many uses the passed context and force update."""
+    hass.states.async_set("light.bowl", "on")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = ha.Context()
+
+    hass.states.async_set_many([("light.bowl", "on", None)], True, context)
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].context is context
+    assert hass.states.get("light.bowl").context is context
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
@@ -2678,6 +2882,58 @@ def test_state_timestamps() -> None:
     assert state.last_updated_timestamp == now.timestamp()
 
 
+def test_state_datetimes_from_timestamps() -> None:
+    """Test State creates its datetimes from the timestamps when accessed."""
+    state = ha.State(
+        "light.bedroom",
+        "on",
+        last_updated_timestamp=1700000100.5,
+        last_changed_timestamp=1700000000.25,
+        last_reported_timestamp=1700000100.5,
+    )
+    assert state.last_changed == dt_util.utc_from_timestamp(1700000000.25)
+    assert state.last_updated == dt_util.utc_from_timestamp(1700000100.5)
+    # Equal times share the same datetime
+    assert state.last_reported is state.last_updated
+    assert state.as_dict()["last_changed"] == "2023-11-14T22:13:20.250000+00:00"
+
+    new_time = dt_util.utc_from_timestamp(1700000200)
+    state.last_reported = new_time
+    assert state.last_reported is new_time
+    assert state.last_reported_timestamp == 1700000200
+
+
+async def test_statemachine_reuses_entity_id(hass: HomeAssistant) -> None:
+    """Test updates keep the entity_id held by the state machine."""
+    hass.states.async_set("light.bowl", "off")
+    state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.Bowl", "on")
+    new_state = hass.states.get("light.bowl")
+
+    assert new_state.entity_id is state.entity_id
+    assert new_state.last_changed_timestamp == new_state.last_updated_timestamp
+    assert new_state.last_changed is new_state.last_updated
+
+
+async def test_statemachine_reuses_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes keep the object of the previous state."""
+    hass.states.async_set("light.desk", "on", {"brightness": 50})
+    state = hass.states.get("light.desk")
+    hass.states.async_set("light.desk", "off", {"brightness": 50})
+    assert hass.states.get("light.desk").attributes is state.attributes
+
+    # Attributes are never shared between entities, so the value types of
+    # one entity do not leak into another
+    hass.states.async_set("sensor.a", "1", {"x": 1.0})
+    hass.states.async_set("sensor.b", "1", {"x": 1})
+    hass.states.async_set("sensor.c", "1", {"x": True})
+    assert hass.states.get("sensor.a").attributes["x"] is not True
+    assert type(hass.states.get("sensor.a").attributes["x"]) is float
+    assert type(hass.states.get("sensor.b").attributes["x"]) is int
+    assert hass.states.get("sensor.c").attributes["x"] is True
+
+
 async def test_state_firing_event_matches_context_id_ulid_time(
     hass: HomeAssistant,
 ) -> None:
@@ -1,6 +1,7 @@
 """Test to verify that we can load components."""
 
 import asyncio
+from datetime import timedelta
 import os
 import pathlib
 import sys
@@ -15,11 +16,18 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -634,6 +642,98 @@ def test_integration_properties(hass: HomeAssistant) -> None:
     assert integration.ssdp is None
 
 
+async def test_pre_import_integrations(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test integrations are pre-imported in a pool following dependencies."""
+    integrations = {
+        domain: loader.Integration(
+            hass,
+            f"custom_components.{domain}",
+            None,
+            {"name": domain, "domain": domain, "dependencies": dependencies},
+        )
+        for domain, dependencies in (
+            ("base", []),
+            ("child", ["base"]),
+            ("other", []),
+            ("broken", []),
+        )
+    }
+    imported: list[tuple[str, str]] = []
+
+    def _get_component(
+        integration: loader.Integration, preload_platforms: bool = False
+    ) -> MagicMock:
+        if integration.domain == "broken":
+            raise ImportError("broken")
+        imported.append((integration.domain, threading.current_thread().name))
+        return MagicMock()
+
+    with patch.object(
+        loader.Integration,
+        "_get_component",
+        autospec=True,
+        side_effect=_get_component,
+    ):
+        await loader.async_pre_import_integrations(hass, integrations, 2)
+
+    domains = [domain for domain, _ in imported]
+    assert sorted(domains) == ["base", "child", "other"]
+    assert domains.index("base") < domains.index("child")
+    assert all(thread.startswith("PreImportExecutor") for _, thread in imported)
+    assert "Pre-imported 3 integrations with 2 workers" in caplog.text
+
+
+async def test_pre_import_mutually_importing_integrations(
+    hass: HomeAssistant, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test pre-importing integrations which import each other does not deadlock.
+
+    Both imports start at the same time, so each worker holds the import lock
+    of one integration while it imports the other.
+    """
+    package = tmp_path / "pre_import_mutual"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "import threading\n"
+        "STARTED = {'alpha': threading.Event(), 'beta': threading.Event()}\n"
+    )
+    for domain, other in (("alpha", "beta"), ("beta", "alpha")):
+        (package / domain).mkdir()
+        (package / domain / "__init__.py").write_text(
+            "from pre_import_mutual import STARTED\n"
+            f"DOMAIN = {domain!r}\n"
+            f"STARTED[{domain!r}].set()\n"
+            f"STARTED[{other!r}].wait(5)\n"
+            f"from pre_import_mutual.{other} import DOMAIN as OTHER\n"
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for module in (
+        "pre_import_mutual",
+        "pre_import_mutual.alpha",
+        "pre_import_mutual.beta",
+    ):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+
+    integrations = {
+        domain: loader.Integration(
+            hass,
+            f"pre_import_mutual.{domain}",
+            package / domain,
+            {"name": domain, "domain": domain, "dependencies": []},
+        )
+        for domain in ("alpha", "beta")
+    }
+    async with asyncio.timeout(10):
+        await loader.async_pre_import_integrations(hass, integrations, 2)
+
+    alpha = await integrations["alpha"].async_get_component()
+    beta = await integrations["beta"].async_get_component()
+    assert alpha.OTHER == "beta"
+    assert beta.OTHER == "alpha"
+
+
 async def test_integrations_only_once(hass: HomeAssistant) -> None:
     """Test that we load integrations only once."""
     int_1 = hass.async_create_task(loader.async_get_integration(hass, "hue"))
@@ -832,7 +932,99 @@ async def test_get_custom_components(hass: HomeAssistant) -> None:
         assert integrations == mock_get.return_value
         integrations = await loader.async_get_custom_components(hass)
         assert integrations == mock_get.return_value
-        mock_get.assert_called_once_with(hass)
+        mock_get.assert_called_once_with(hass, hass.data[loader.DATA_MANIFEST_INDEX])
+
+
+def _write_indexed_integration(root: pathlib.Path, version: str) -> None:
+    """Write a custom integration to index."""
+    integration_dir = root / "indexed"
+    integration_dir.mkdir(exist_ok=True)
+    (integration_dir / "__init__.py").write_text("")
+    (integration_dir / "light.py").write_text("")
+    (integration_dir / "manifest.json").write_text(
+        json_dumps({"domain": "indexed", "name": "Indexed", "version": version})
+    )
+
+
+@pytest.mark.parametrize(
+    ("root_name", "is_built_in"),
+    [("custom_components", False), (loader.PACKAGE_BUILTIN, True)],
+)
+def test_manifest_index_reuses_resolved_integrations(
+    hass: HomeAssistant, tmp_path: pathlib.Path, root_name: str, is_built_in: bool
+) -> None:
+    """Test the manifest index skips reading unchanged integrations."""
+    root = MagicMock(__name__=root_name, __path__=[str(tmp_path)])
+    _write_indexed_integration(tmp_path, "1.0.0")
+    index = loader.ManifestIndex()
+
+    integration = loader.Integration.resolve_from_root(hass, root, "indexed", index)
+    assert integration.version == "1.0.0"
+    assert integration.platforms_exists(["light", "sensor"]) == ["light"]
+    assert index.dirty
+
+    # Reload the index as it would be on the next start
+    index = loader.ManifestIndex(json_loads(json_dumps(index.as_dict())))
+    with (
+        patch("homeassistant.loader.json_loads") as mock_json_loads,
+        patch("homeassistant.loader.os.listdir") as mock_listdir,
+    ):
+        integration = loader.Integration.resolve_from_root(hass, root, "indexed", index)
+    assert not mock_json_loads.called
+    assert not mock_listdir.called
+    assert not index.dirty
+    assert integration.version == "1.0.0"
+    assert integration.is_built_in is is_built_in
+    assert integration.platforms_exists(["light", "sensor"]) == ["light"]
+
+    # A changed manifest is read again, also for built-in integrations as
+    # the version does not change on development installs
+    _write_indexed_integration(tmp_path, "2.0.0")
+    manifest_path = tmp_path / "indexed" / "manifest.json"
+    mtime_ns = manifest_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+    integration = loader.Integration.resolve_from_root(hass, root, "indexed", index)
+    assert integration.version == "2.0.0"
+    assert index.dirty
+
+
+def test_manifest_index_discarded_on_version_change() -> None:
+    """Test the manifest index is discarded when Home Assistant is updated."""
+    data = loader.ManifestIndex().as_dict()
+    data["integrations"] = {"/config/custom_components": {"indexed": {}}}
+
+    assert loader.ManifestIndex(data).as_dict()["integrations"]
+
+    data["ha_version"] = "2020.1.0"
+    assert loader.ManifestIndex(data).as_dict()["integrations"] == {}
+
+
+async def test_manifest_index_load_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test integrations still resolve when the manifest index fails to load."""
+    with patch(
+        "homeassistant.helpers.storage.Store.async_load",
+        side_effect=HomeAssistantError("corrupt"),
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+    assert integration.domain == "hue"
+    assert "Error loading the integration index" in caplog.text
+    assert isinstance(hass.data[loader.DATA_MANIFEST_INDEX], loader.ManifestIndex)
+
+
+async def test_manifest_index_saved(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test resolving integrations saves the manifest index."""
+    await loader.async_get_integration(hass, "hue")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_INDEX_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]
+    assert "hue" in next(iter(data["integrations"].values()))
 
 
 @pytest.mark.usefixtures("enable_custom_integrations")
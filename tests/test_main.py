@@ -2,6 +2,8 @@
 
 from unittest.mock import PropertyMock, patch
 
+import pytest
+
 from homeassistant import __main__ as main
 from homeassistant.const import REQUIRED_PYTHON_VER, RESTART_EXIT_CODE
 
@@ -88,6 +90,20 @@ def test_skip_pip_mutually_exclusive(mock_exit) -> None:
     assert mock_exit.called is True
 
 
+def test_pre_import_workers_not_negative() -> None:
+    """Test --pre-import-workers must be 0 or more."""
+
+    def parse_args(*args):
+        with patch("sys.argv", ["python", *args]):
+            return main.get_arguments()
+
+    assert parse_args().pre_import_workers == 0
+    assert parse_args("--pre-import-workers", "4").pre_import_workers == 4
+
+    with pytest.raises(SystemExit):
+        parse_args("--pre-import-workers", "-1")
+
+
 def test_restart_after_backup_restore() -> None:
     """Test restarting if we restored a backup."""
     with (
@@ -602,3 +602,84 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_reuses_parsed_file(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are not parsed again."""
+    (tmp_path / "secrets.yaml").write_text("password: secret_1")
+    (tmp_path / "included.yaml").write_text("included: true")
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text(
+        "password: !secret password\n"
+        "env: !env_var TEST_YAML_ENV default\n"
+        "include: !include included.yaml\n"
+        "list: [1, 2]\n"
+    )
+    secrets = yaml_util.Secrets(tmp_path)
+
+    with patch.object(
+        yaml_loader, "_parse_yaml_tree", wraps=yaml_loader._parse_yaml_tree
+    ) as parse_mock:
+        doc = yaml_loader.load_yaml(config_path, secrets)
+        # The configuration, secrets and included files
+        assert parse_mock.call_count == 3
+        assert doc == {
+            "password": "secret_1",
+            "env": "default",
+            "include": {"included": True},
+            "list": [1, 2],
+        }
+        assert doc.__line__ == 1
+        assert doc["include"].__line__ == 3
+        assert doc["include"].__config_file__ == str(config_path)
+        doc["list"].append(3)
+
+        # References are resolved again on each load
+        (tmp_path / "secrets.yaml").write_text("password: secret_2")
+        with patch.dict(os.environ, {"TEST_YAML_ENV": "env"}):
+            doc = yaml_loader.load_yaml(config_path, yaml_util.Secrets(tmp_path))
+        # Only the changed secrets file
+        assert parse_mock.call_count == 4
+        assert doc == {
+            "password": "secret_2",
+            "env": "env",
+            "include": {"included": True},
+            "list": [1, 2],
+        }
+
+        config_path.write_text("changed: true")
+        assert yaml_loader.load_yaml(config_path, secrets) == {"changed": True}
+        assert parse_mock.call_count == 5
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_does_not_reuse_file_with_duplicate_keys(
+    tmp_path: pathlib.Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test files with duplicate keys are parsed again to repeat the warning."""
+    config_path = tmp_path / "configuration.yaml"
+    config_path.write_text("key: thing1\nkey: thing2")
+
+    for _ in range(2):
+        caplog.clear()
+        assert yaml_loader.load_yaml(config_path) == {"key": "thing2"}
+        assert "contains duplicate key" in caplog.text
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_load_yaml_drops_parsed_files(tmp_path: pathlib.Path) -> None:
+    """Test parsed files are bounded and dropped when the file is removed."""
+    paths = [tmp_path / f"file_{idx}.yaml" for idx in range(3)]
+    for idx, path in enumerate(paths):
+        path.write_text(f"value: {idx}")
+
+    with patch.object(yaml_loader, "_PARSED_FILES", yaml_loader.LRU(2)) as parsed:
+        for path in paths:
+            yaml_loader.load_yaml(path)
+        assert set(parsed.keys()) == {str(paths[1]), str(paths[2])}
+
+        paths[2].unlink()
+        with pytest.raises(FileNotFoundError):
+            yaml_loader.load_yaml(paths[2])
+        assert set(parsed.keys()) == {str(paths[1])}